@@ -3,80 +3,108 @@ import json
 import bpy
 from bpy.app.handlers import persistent
 from .utils.registration import get_prefs, get_path
-from .materials.materials import (
-    get_blend_filenames,
-    load_materials)
+from .materials.library_manifest import get_library_materials
 from .lib.utils.file_handling import absolute_file_paths
 
+# owner of our msgbus subscriptions
+msgbus_owner = object()
+
+# names of properties shared by mt_tile_props and mt_scene_props
+shared_prop_keys = None
+
+# parsed tile_defaults.json and lookup tables, reloaded when the file changes
+tile_defaults_cache = {
+    'mtime': None,
+    'tile_defaults': False,
+    'tiles': {},
+    'parts': {}}
+
 
 def create_properties_on_activation(dummy):
     bpy.app.handlers.depsgraph_update_pre.remove(
         create_properties_on_activation)
     context = bpy.context
     create_default_materials(context)
-    load_default_materials(context)
     initialise_scene_props(context)
+    subscribe_to_active_object()
 
 
 @persistent
 def create_properties_on_load(dummy):
     context = bpy.context
-    load_default_materials(context)
     initialise_scene_props(context)
+    # msgbus subscriptions are cleared when a file is loaded
+    subscribe_to_active_object()
+
+
+def subscribe_to_active_object():
+    """Call update_mt_scene_props_handler whenever the active object changes."""
+    bpy.msgbus.clear_by_owner(msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.LayerObjects, 'active'),
+        owner=msgbus_owner,
+        args=(),
+        notify=update_mt_scene_props_handler)
+
+
+def unregister():
+    bpy.msgbus.clear_by_owner(msgbus_owner)
 
 
 def create_default_materials(context):
     """Create a list of default materials that appear in the MakeTile menu.
 
+    Materials are not linked here. They are linked from their library the first
+    time they are used. See materials.materials.get_default_material.
+
     Args:
-        context ([type]): [description]
+        context (bpy.context): context
     """
     prefs = get_prefs()
 
     # Collection of custom props containg name and path to material
     default_mats = prefs.default_materials
+    existing = {(mat.name, mat.filepath) for mat in default_mats}
 
     default_assets_dir = os.path.join(prefs.assets_path, "materials")
 
     paths = [path for path in absolute_file_paths(
         default_assets_dir) if path.endswith(".blend")]
 
-    for path in paths:
-        with bpy.data.libraries.load(path) as (data_from, data_to):
-            for mat in data_from.materials:
-                if mat not in [mat.name for mat in default_mats if mat.filepath == path]:
-                    new_mat = default_mats.add()
-                    new_mat.name = mat
-                    new_mat.filepath = path
+    for path, materials in get_library_materials(paths).items():
+        for mat in materials:
+            if (mat, path) not in existing:
+                new_mat = default_mats.add()
+                new_mat.name = mat
+                new_mat.filepath = path
+                existing.add((mat, path))
     return
 
 
-def load_default_materials(context):
-    prefs = get_prefs()
-    default_mats = prefs.default_materials
-    paths = set([mat.filepath for mat in default_mats])
+def get_shared_prop_keys(scene_props, tile_props):
+    """Return the names of properties that exist on both mt_tile_props and mt_scene_props.
 
-    try:
-        for path in paths:
-            mats = [mat.name for mat in default_mats if mat.filepath == path]
-            with bpy.data.libraries.load(path, link=True) as (data_from, data_to):
-                data_to.materials = [
-                    mat for mat in data_from.materials if mat in mats]
-        return True
-    except OSError as err:
-        print(err)
-        return False
-    except KeyError as err:
-        print(err)
-        return False
+    Args:
+        scene_props (MakeTile.properties.MT_Scene_Props): scene props
+        tile_props (MakeTile.properties.MT_Tile_Props): tile props
+
+    Returns:
+        frozenset[str]: property names
+    """
+    global shared_prop_keys
+    if shared_prop_keys is None:
+        shared_prop_keys = frozenset(
+            scene_props.bl_rna.properties.keys()) & frozenset(
+            tile_props.bl_rna.properties.keys())
+    return shared_prop_keys
 
 
-@persistent
-def update_mt_scene_props_handler(dummy):
+def update_mt_scene_props_handler(*args):
     """Updates mt_scene_props based on mt_tile_props of selected object.
 
     This means that when the user selects an existing tile they can easily
-    create one with the same properties.
+    create one with the same properties. Called via msgbus when the active
+    object changes.
     """
     try:
         context = bpy.context
@@ -94,10 +122,10 @@ def update_mt_scene_props_handler(dummy):
             scene_props.base_y = tile_props.base_size[1]
             scene_props.base_z = tile_props.base_size[2]
 
-            for key, value in tile_props.items():
-                for k in scene_props.keys():
-                    if k == key:
-                        scene_props[k] = value
+            # only copy values that have been set on the tile
+            for key in get_shared_prop_keys(scene_props, tile_props):
+                if key in tile_props:
+                    scene_props[key] = tile_props[key]
             scene_props.mt_last_selected = obj
 
     except KeyError:
@@ -106,53 +134,125 @@ def update_mt_scene_props_handler(dummy):
         pass
 
 
-def load_tile_defaults(context):
-    """Load tile defaults into memory."""
-    addon_path = get_path()
-    json_path = os.path.join(
-        addon_path,
+def get_tile_defaults_path():
+    """Return the path to tile_defaults.json."""
+    return os.path.join(
+        get_path(),
         "assets",
         "data",
         "tile_defaults.json"
     )
 
-    if os.path.exists(json_path):
+
+def index_tile_defaults(tile_defaults):
+    """Build lookup tables for tile defaults.
+
+    Part defaults are precomputed for every combination of main part and base
+    blueprint, with None standing in for a blueprint that has no defaults.
+
+    Args:
+        tile_defaults (list[dict]): parsed tile_defaults.json
+
+    Returns:
+        tuple(dict, dict): tiles keyed by tile_type, part defaults keyed by
+        (tile_type, main_part_blueprint, base_blueprint)
+    """
+    tiles = {}
+    parts = {}
+    for tile in tile_defaults:
+        tile_type = tile['type']
+        tiles[tile_type] = tile
+        defaults = tile['defaults']
+        base_defaults = defaults.get('base_defaults', {})
+        main_part_defaults = defaults.get('tile_defaults', {})
+        for base_blueprint in list(base_defaults.keys()) + [None]:
+            for main_part_blueprint in list(main_part_defaults.keys()) + [None]:
+                merged = dict(base_defaults.get(base_blueprint, {}))
+                merged.update(main_part_defaults.get(main_part_blueprint, {}))
+                parts[tile_type, main_part_blueprint, base_blueprint] = merged
+    return tiles, parts
+
+
+def load_tile_defaults(context):
+    """Load tile defaults into memory.
+
+    The file is only parsed again if it has been modified since it was last loaded.
+    """
+    json_path = get_tile_defaults_path()
+
+    try:
+        mtime = os.path.getmtime(json_path)
+    except OSError:
+        return False
+
+    if tile_defaults_cache['mtime'] != mtime:
         with open(json_path) as json_file:
             tile_defaults = json.load(json_file)
-            return tile_defaults
-    return False
+        tiles, parts = index_tile_defaults(tile_defaults)
+        tile_defaults_cache.update({
+            'mtime': mtime,
+            'tile_defaults': tile_defaults,
+            'tiles': tiles,
+            'parts': parts})
+    return tile_defaults_cache['tile_defaults']
+
+
+def get_tile_type_defaults(context, tile_type):
+    """Return the entry in tile_defaults.json for a tile type.
+
+    Args:
+        context (bpy.context): context
+        tile_type (str): tile type
+
+    Returns:
+        dict: tile entry or None
+    """
+    if not load_tile_defaults(context):
+        return None
+    return tile_defaults_cache['tiles'].get(tile_type)
+
+
+def get_part_defaults(context, tile_type, main_part_blueprint, base_blueprint):
+    """Return the combined base and main part defaults for a tile.
+
+    Args:
+        context (bpy.context): context
+        tile_type (str): tile type
+        main_part_blueprint (str): main part blueprint
+        base_blueprint (str): base blueprint
+
+    Returns:
+        dict: property values keyed by property name
+    """
+    tile = get_tile_type_defaults(context, tile_type)
+    if tile is None:
+        return {}
+    defaults = tile['defaults']
+    if main_part_blueprint not in defaults.get('tile_defaults', {}):
+        main_part_blueprint = None
+    if base_blueprint not in defaults.get('base_defaults', {}):
+        base_blueprint = None
+    return tile_defaults_cache['parts'][tile_type, main_part_blueprint, base_blueprint]
 
 
 def initialise_scene_props(context):
     prefs = get_prefs()
     scene_props = context.scene.mt_scene_props
     scene_props.tile_type = prefs.default_tile_type
-    tile_defaults = load_tile_defaults(context)
+    tile = get_tile_type_defaults(context, scene_props.tile_type)
 
-    for tile in tile_defaults:
-        if tile['type'] == scene_props.tile_type:
-            defaults = tile['defaults']
-            for key, value in defaults.items():
-                setattr(scene_props, key, value)
-
-            base_blueprint = scene_props.base_blueprint
-            base_defaults = defaults['base_defaults']
-            for key, value in base_defaults.items():
-                if key == base_blueprint:
-                    for k, v in value.items():
-                        setattr(scene_props, k, v)
-                    break
-
-            main_part_blueprint = scene_props.main_part_blueprint
-            main_part_defaults = defaults['tile_defaults']
-            for key, value in main_part_defaults.items():
-                if key == main_part_blueprint:
-                    for k, v in value.items():
-                        setattr(scene_props, k, v)
-                    break
-            break
+    if tile is not None:
+        for key, value in tile['defaults'].items():
+            setattr(scene_props, key, value)
+
+        part_defaults = get_part_defaults(
+            context,
+            scene_props.tile_type,
+            scene_props.main_part_blueprint,
+            scene_props.base_blueprint)
+        for key, value in part_defaults.items():
+            setattr(scene_props, key, value)
 
 
 bpy.app.handlers.depsgraph_update_pre.append(create_properties_on_activation)
 bpy.app.handlers.load_post.append(create_properties_on_load)
-bpy.app.handlers.depsgraph_update_post.append(update_mt_scene_props_handler)
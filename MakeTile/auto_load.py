@@ -6,6 +6,7 @@ import inspect
 import pkgutil
 import importlib
 from pathlib import Path
+from .lib.utils.profile import profile_operator_method, PROFILED_METHODS
 
 __all__ = (
     "init",
@@ -27,6 +28,10 @@ def init():
 
 def register():
     for cls in ordered_classes:
+        if cls.__name__.startswith("MT_OT_"):
+            for method_name in PROFILED_METHODS:
+                if method_name in cls.__dict__:
+                    setattr(cls, method_name, profile_operator_method(cls.__dict__[method_name], method_name))
         bpy.utils.register_class(cls)
 
     for module in modules:
@@ -91,4 +91,30 @@ openlock_column_types = [
 column_socket_style = [
     ("FLAT", "Flat", "", 1),
     ("TEXTURED", "Textured", "", 2)
-]
\ No newline at end of file
+]
+
+displacement_methods = [
+    ("MODIFIER", "Modifier", "Use the subsurf and displacement modifiers", 1),
+    ("CPU", "CPU", "Only subdivide textured faces and displace them in bulk", 2)
+]
+
+bake_resolution_modes = [
+    ("FIXED", "Fixed", "Bake all displacement maps at the same resolution", 1),
+    ("AUTO", "Auto", "Choose resolution and bit depth per object based on texel density", 2)
+]
+
+voxel_size_modes = [
+    ("FIXED", "Fixed", "Use a fixed voxel size", 1),
+    ("TRIANGLES", "Triangle Count", "Choose voxel size to hit a target triangle count", 2),
+    ("FEATURE", "Feature Size", "Choose voxel size to preserve features of a minimum size", 3)
+]
+
+uv_projection_methods = [
+    ("SMART", "Smart", "Smart UV project. Less stretching but slow on dense meshes", 1),
+    ("BOX", "Box", "Project each face along its main axis. Fast on dense meshes such as scans", 2)
+]
+
+memory_budget_actions = [
+    ("WARN", "Warn", "Warn when a bake would take Blender over the memory budget", 1),
+    ("DOWNSCALE", "Downscale", "Downscale bakes that would take Blender over the memory budget", 2)
+]
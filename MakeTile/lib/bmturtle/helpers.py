@@ -1,9 +1,10 @@
 from math import inf, tan, radians, acos, pi, modf
 import bmesh
 import bpy
+import numpy as np
 from mathutils import Vector, geometry
 from mathutils.bvhtree import BVHTree
-from ..utils.selection import in_bbox
+from ..utils.selection import CoordIndex
 
 def bmesh_array(
     source_obj=None,
@@ -136,7 +137,35 @@ def bm_deselect_all(bm):
     bm.select_flush(False)
 
 
-def select_verts_in_bounds(lbound, ubound, buffer, bm):
+def get_bmesh_coord_index(bm, edges=False):
+    """Return a CoordIndex over the vertices of a bmesh.
+
+    Build this once and pass it to select_verts_in_bounds and select_edges_in_bounds
+    when making several selections from a bmesh whose geometry doesn't change
+    in between.
+
+    Args:
+        bm (bmesh): bmesh
+        edges (bool, optional): also index edges. Defaults to False.
+
+    Returns:
+        CoordIndex: index
+    """
+    co = np.fromiter(
+        (c for v in bm.verts for c in v.co),
+        dtype=np.float64,
+        count=len(bm.verts) * 3)
+    edge_verts = None
+    if edges:
+        bm.verts.index_update()
+        edge_verts = np.fromiter(
+            (v.index for e in bm.edges for v in e.verts),
+            dtype=np.int64,
+            count=len(bm.edges) * 2).reshape((-1, 2))
+    return CoordIndex(co, edge_verts)
+
+
+def select_verts_in_bounds(lbound, ubound, buffer, bm, index=None):
     """Select vertices within cubical boundary.
 
     Args:
@@ -144,26 +173,39 @@ def select_verts_in_bounds(lbound, ubound, buffer, bm):
         ubound (tuble[3]): Upper left corner of bounds
         buffer (float): Buffer around bbox
         bm (bmesh): bmesh
+        index (CoordIndex, optional): index returned by get_bmesh_coord_index. Defaults to None.
 
     Returns:
         list[bmesh.verts]: List of verts
     """
-    vert_coords = [v.co.to_tuple() for v in bm.verts]
-    to_select = [in_bbox(lbound, ubound, v, buffer) for v in vert_coords]
+    if index is None:
+        index = get_bmesh_coord_index(bm)
+    mask = index.vert_mask(lbound, ubound, buffer)
 
-    for vert, select in zip(bm.verts, to_select):
+    for vert, select in zip(bm.verts, mask.tolist()):
         vert.select = select
 
-    return [v for v in bm.verts if v.select]
+    return [v for v, select in zip(bm.verts, mask.tolist()) if select]
+
+def select_edges_in_bounds(lbound, ubound, buffer, bm, index=None):
+    """Select edges wholly within cubical boundary.
 
-def select_edges_in_bounds(lbound, ubound, buffer, bm):
-    vert_coords = []
-    [vert_coords.append([v.co.to_tuple()for v in e.verts]) for e in bm.edges]
-    to_select = []
-    [to_select.append(all(in_bbox(lbound, ubound, v, buffer)for v in e)) for e in vert_coords]
-    for edge_obj, select in zip(bm.edges, to_select):
+    Args:
+        lbound (tuple[3]): Lower left corner of bounds
+        ubound (tuble[3]): Upper left corner of bounds
+        buffer (float): Buffer around bbox
+        bm (bmesh): bmesh
+        index (CoordIndex, optional): index returned by get_bmesh_coord_index with edges=True. Defaults to None.
+
+    Returns:
+        list[bmesh.edges]: List of edges
+    """
+    if index is None or index.edge_verts is None:
+        index = get_bmesh_coord_index(bm, edges=True)
+    mask = index.edge_mask(lbound, ubound, buffer).tolist()
+    for edge_obj, select in zip(bm.edges, mask):
         edge_obj.select = select
-    return [e for e in bm.edges if e.select]
+    return [e for e, select in zip(bm.edges, mask) if select]
 
 def points_are_inside_bmesh(coords, bm):
     """Test whether points are inside an arbitrary manifold bmesh.
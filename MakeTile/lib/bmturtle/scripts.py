@@ -21,6 +21,7 @@ from .helpers import (
     bm_deselect_all,
     assign_verts_to_group,
     select_verts_in_bounds,
+    get_bmesh_coord_index,
     bm_shortest_path)
 '''
 from line_profiler import LineProfiler
@@ -202,6 +203,8 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
 
     buffer = margin / 2
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # select side c and assign to vert group
     lbound = loc_A
     ubound = (
@@ -209,7 +212,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
         loc_B[1],
         loc_B[2] + height)
 
-    side_c_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    side_c_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     assign_verts_to_group(side_c_verts, obj, deform_groups, 'Side c')
     bm_deselect_all(bm)
 
@@ -229,7 +232,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
             turtle.location[0],
             turtle.location[1],
             turtle.location[2] + height)
-        selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+        selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
         side_a_verts.extend(selected_verts)
         fd(bm, a / (subdivs[0] + 1))
         i += 1
@@ -238,7 +241,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
         turtle.location[0],
         turtle.location[1],
         turtle.location[2] + height)
-    selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     side_a_verts.extend(selected_verts)
 
     assign_verts_to_group(side_a_verts, obj, deform_groups, 'Side a')
@@ -255,7 +258,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
             turtle.location[0],
             turtle.location[1],
             turtle.location[2] + height)
-        selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+        selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
         side_b_verts.extend(selected_verts)
         fd(bm, b / (subdivs[0] + 1))
         i += 1
@@ -264,7 +267,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
         turtle.location[0],
         turtle.location[1],
         turtle.location[2] + height)
-    selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     side_b_verts.extend(selected_verts)
 
     assign_verts_to_group(side_b_verts, obj, deform_groups, 'Side b')
@@ -283,7 +286,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
         loc_A[2] + height)
 
     side_verts = side_a_verts + side_b_verts + side_c_verts
-    selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     top_verts = [v for v in selected_verts if v not in side_verts]
 
     assign_verts_to_group(top_verts, obj, deform_groups, 'Top')
@@ -456,12 +459,14 @@ def draw_straight_wall_core(dims, subdivs, margin=0.001):
 
     home(obj)
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # select left side and assign to vert group
     lbound = (0, 0, 0)
     ubound = (0, dims[1], dims[2])
     buffer = margin / 2
 
-    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     left_verts = [
         v for v in left_verts_orig if v not in top_verts and v not in bottom_verts]
     assign_verts_to_group(left_verts, obj, deform_groups, 'Left')
@@ -471,7 +476,7 @@ def draw_straight_wall_core(dims, subdivs, margin=0.001):
     ubound = dims
     buffer = margin / 2
 
-    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     right_verts = [
         v for v in right_verts_orig if v not in top_verts and v not in bottom_verts]
     assign_verts_to_group(right_verts, obj, deform_groups, 'Right')
@@ -490,7 +495,7 @@ def draw_straight_wall_core(dims, subdivs, margin=0.001):
     ubound = (dims[0] - margin, 0, dims[2] - margin)
     buffer = margin / 2
 
-    front_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    front_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     assign_verts_to_group(front_verts, obj, deform_groups, 'Front')
 
     # select back side and assign to vert group
@@ -498,7 +503,7 @@ def draw_straight_wall_core(dims, subdivs, margin=0.001):
     ubound = (dims[0] - margin, dims[1], dims[2] - margin)
     buffer = margin / 2
 
-    back_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    back_verts = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
     assign_verts_to_group(back_verts, obj, deform_groups, 'Back')
 
     # finalise turtle and release bmesh
@@ -932,6 +937,8 @@ def create_corner_vert_groups_vert_lists(bm, height, margin, vert_locs):
         'Leg 2 Outer': vert_locs['Leg 2 Outer']}
     vert_groups = {}
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # create kdtree
     size = len(bm.verts)
     kd = kdtree.KDTree(size)
@@ -950,7 +957,8 @@ def create_corner_vert_groups_vert_lists(bm, height, margin, vert_locs):
                 ubound=(bottom_vert_co[0], bottom_vert_co[1],
                         bottom_vert_co[2] + height),
                 buffer=margin / 2,
-                bm=bm)
+                bm=bm,
+                index=coord_index)
             vert_group.extend(verts)
         vert_groups[key] = vert_group
 
@@ -982,7 +990,8 @@ def create_corner_vert_groups_vert_lists(bm, height, margin, vert_locs):
 
         for v in verts:
             selected = select_verts_in_bounds(
-                v.co, (v.co[0], v.co[1], v.co[2] + height), margin / 2, bm)
+                v.co, (v.co[0], v.co[1], v.co[2] + height), margin / 2, bm,
+                coord_index)
             selected_verts.extend(selected)
 
         vert_groups[key] = selected_verts
@@ -1060,7 +1069,8 @@ def create_corner_vert_groups_vert_lists(bm, height, margin, vert_locs):
              inner_locs[i][1],
              inner_locs[i][2] + height),
             margin / 2,
-            bm)
+            bm,
+            coord_index)
         v2 = select_verts_in_bounds(
             (outer_locs[i][0],
              outer_locs[i][1],
@@ -1069,7 +1079,8 @@ def create_corner_vert_groups_vert_lists(bm, height, margin, vert_locs):
              outer_locs[i][1],
              outer_locs[i][2] + height),
             margin / 2,
-            bm)
+            bm,
+            coord_index)
 
         nodes = bm_shortest_path(bm, v1[0], v2[0])
         node = nodes[v2[0]]
@@ -1099,7 +1110,8 @@ def create_corner_vert_groups_vert_lists(bm, height, margin, vert_locs):
              inner_locs[i][1],
              inner_locs[i][2] + height),
             margin / 2,
-            bm)
+            bm,
+            coord_index)
         v2 = select_verts_in_bounds(
             (outer_locs[i][0],
              outer_locs[i][1],
@@ -1108,7 +1120,8 @@ def create_corner_vert_groups_vert_lists(bm, height, margin, vert_locs):
              outer_locs[i][1],
              outer_locs[i][2] + height),
             margin / 2,
-            bm)
+            bm,
+            coord_index)
 
         nodes = bm_shortest_path(bm, v1[0], v2[0])
         node = nodes[v2[0]]
@@ -1409,12 +1422,15 @@ def draw_rectangular_floor_core(dims, subdivs, margin=0.001, offset=0):
 
     top_verts = {v for v in bm.verts if v.select}
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # select left
     left_verts = select_verts_in_bounds(
         lbound=orig_loc,
         ubound=(orig_loc[0], dims[1] + offset, dims[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     assign_verts_to_group(left_verts, obj, deform_groups, 'Left')
 
@@ -1423,7 +1439,8 @@ def draw_rectangular_floor_core(dims, subdivs, margin=0.001, offset=0):
         lbound=(dims[0] + offset, orig_loc[1], orig_loc[2]),
         ubound=(dims[0] + offset, dims[1] + offset, dims[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     assign_verts_to_group(right_verts, obj, deform_groups, 'Right')
 
@@ -1432,7 +1449,8 @@ def draw_rectangular_floor_core(dims, subdivs, margin=0.001, offset=0):
         lbound=orig_loc,
         ubound=(dims[0] + offset, orig_loc[1], dims[2]),
         buffer=margin / 2,
-        bm=bm
+        bm=bm,
+        index=coord_index
     )
 
     assign_verts_to_group(front_verts, obj, deform_groups, 'Front')
@@ -1442,7 +1460,8 @@ def draw_rectangular_floor_core(dims, subdivs, margin=0.001, offset=0):
         lbound=(orig_loc[0], dims[1] + offset, orig_loc[2]),
         ubound=(dims[0] + offset, dims[1] + offset, dims[2]),
         buffer=margin / 2,
-        bm=bm
+        bm=bm,
+        index=coord_index
     )
 
     assign_verts_to_group(back_verts, obj, deform_groups, 'Back')
@@ -0,0 +1,266 @@
+"""Memory accounting for baked images, meshes and the Blender process.
+
+Snapshots record image buffer sizes, mesh vertex / loop counts and the
+resident set size of the process. The exporter wraps each stage in
+track_memory so the memory used by each stage of a batch can be reported.
+"""
+import os
+import sys
+from contextlib import contextmanager
+import bpy
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# stages recorded by track_memory since the last reset_memory_report and
+# the latest snapshot and largest images found by the memory report operator
+memory_report = {
+    'stages': [],
+    'snapshot': None,
+    'largest_images': []}
+
+
+def get_rss():
+    """Return the resident set size of this process in bytes.
+
+    On Linux this is the current rss. Elsewhere we fall back to the peak rss.
+
+    Returns:
+        int: rss in bytes. None if unavailable.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak
+    return peak * 1024
+
+
+def get_image_bytes(image):
+    """Return the size in bytes of an image's pixel buffer.
+
+    Args:
+        image (bpy.types.Image): image
+
+    Returns:
+        int: size in bytes
+    """
+    width, height = image.size
+    bytes_per_channel = 4 if image.is_float else 1
+    return width * height * image.channels * bytes_per_channel
+
+
+def get_image_memory(images=None):
+    """Return the memory used by images.
+
+    Args:
+        images (list[bpy.types.Image], optional): images. Defaults to all images in the file.
+
+    Returns:
+        dict: number of images, bytes of loaded pixel buffers and bytes of packed files
+    """
+    if images is None:
+        images = bpy.data.images
+    buffer_bytes = 0
+    packed_bytes = 0
+    count = 0
+    for image in images:
+        count += 1
+        if image.has_data:
+            buffer_bytes += get_image_bytes(image)
+        if image.packed_file:
+            packed_bytes += image.packed_file.size
+    return {
+        'images': count,
+        'image_bytes': buffer_bytes,
+        'packed_bytes': packed_bytes}
+
+
+def get_mesh_memory(meshes=None):
+    """Return the number of meshes and their total vertex, loop and polygon counts.
+
+    Args:
+        meshes (list[bpy.types.Mesh], optional): meshes. Defaults to all meshes in the file.
+
+    Returns:
+        dict: number of meshes, vertices, loops and polygons
+    """
+    if meshes is None:
+        meshes = bpy.data.meshes
+    counts = {'meshes': 0, 'verts': 0, 'loops': 0, 'polys': 0}
+    for mesh in meshes:
+        counts['meshes'] += 1
+        counts['verts'] += len(mesh.vertices)
+        counts['loops'] += len(mesh.loops)
+        counts['polys'] += len(mesh.polygons)
+    return counts
+
+
+def get_memory_snapshot():
+    """Return the current image, mesh and process memory use.
+
+    Returns:
+        dict: rss, image and mesh memory
+    """
+    snapshot = {'rss': get_rss()}
+    snapshot.update(get_image_memory())
+    snapshot.update(get_mesh_memory())
+    return snapshot
+
+
+def get_memory_delta(before, after):
+    """Return the difference between two snapshots.
+
+    Args:
+        before (dict): snapshot
+        after (dict): snapshot
+
+    Returns:
+        dict: after - before for each value. None where either value is unavailable.
+    """
+    delta = {}
+    for key, value in after.items():
+        if value is None or before.get(key) is None:
+            delta[key] = None
+        else:
+            delta[key] = value - before[key]
+    return delta
+
+
+def reset_memory_report():
+    """Clear the stages recorded by track_memory."""
+    memory_report['stages'] = []
+
+
+@contextmanager
+def track_memory(stage):
+    """Record a memory snapshot before and after a stage in memory_report.
+
+    Args:
+        stage (str): name of stage
+    """
+    before = get_memory_snapshot()
+    try:
+        yield
+    finally:
+        after = get_memory_snapshot()
+        memory_report['stages'].append({
+            'stage': stage,
+            'before': before,
+            'after': after})
+        if bpy.app.background:
+            print(format_stage(memory_report['stages'][-1]))
+
+
+def format_bytes(num_bytes):
+    """Return a human readable size.
+
+    Args:
+        num_bytes (int): size in bytes
+
+    Returns:
+        str: size
+    """
+    if num_bytes is None:
+        return 'n/a'
+    sign = '-' if num_bytes < 0 else ''
+    num_bytes = abs(num_bytes)
+    for unit in ['B', 'KB', 'MB']:
+        if num_bytes < 1024:
+            return '{0}{1:.1f}{2}'.format(sign, num_bytes, unit)
+        num_bytes /= 1024
+    return '{0}{1:.2f}GB'.format(sign, num_bytes)
+
+
+def format_bytes_delta(num_bytes):
+    """Return a human readable change in size.
+
+    Args:
+        num_bytes (int): change in bytes
+
+    Returns:
+        str: change
+    """
+    if num_bytes is not None and num_bytes >= 0:
+        return '+' + format_bytes(num_bytes)
+    return format_bytes(num_bytes)
+
+
+def format_snapshot(snapshot):
+    """Return a snapshot as lines of text.
+
+    Args:
+        snapshot (dict): snapshot
+
+    Returns:
+        list[str]: lines
+    """
+    return [
+        'Process: ' + format_bytes(snapshot['rss']),
+        'Images: {0} using {1}, {2} packed'.format(
+            snapshot['images'],
+            format_bytes(snapshot['image_bytes']),
+            format_bytes(snapshot['packed_bytes'])),
+        'Meshes: {0} with {1} verts, {2} loops'.format(
+            snapshot['meshes'],
+            snapshot['verts'],
+            snapshot['loops'])]
+
+
+def format_stage(stage):
+    """Return a stage recorded by track_memory as a line of text.
+
+    Args:
+        stage (dict): stage
+
+    Returns:
+        str: line
+    """
+    delta = get_memory_delta(stage['before'], stage['after'])
+    return 'MakeTile memory: {0}: process {1} ({2}), images {3} ({4}), loops {5} ({6:+})'.format(
+        stage['stage'],
+        format_bytes(stage['after']['rss']),
+        format_bytes_delta(delta['rss']),
+        format_bytes(stage['after']['image_bytes']),
+        format_bytes_delta(delta['image_bytes']),
+        stage['after']['loops'],
+        delta['loops'])
+
+
+def get_largest_images(count):
+    """Return the images with the largest pixel buffers.
+
+    Args:
+        count (int): number of images
+
+    Returns:
+        list[tuple(str, int)]: image name and size in bytes
+    """
+    images = [(image.name, get_image_bytes(image)) for image in bpy.data.images if image.has_data]
+    images.sort(key=lambda image: image[1], reverse=True)
+    return images[:count]
+
+
+def get_memory_headroom(budget):
+    """Return how much more memory the process can use before exceeding budget.
+
+    Args:
+        budget (int): budget in bytes. None if unlimited.
+
+    Returns:
+        int: bytes. None if the budget is unlimited or the rss is unavailable.
+    """
+    if budget is None:
+        return None
+    rss = get_rss()
+    if rss is None:
+        return None
+    return max(budget - rss, 0)
@@ -0,0 +1,254 @@
+"""Vectorised mesh analysis helpers built on foreach_get and numpy."""
+import numpy as np
+
+
+def get_loop_arrays(mesh):
+    """Return loop vertex indices, polygon loop starts and polygon loop totals.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): loop_verts, loop_starts, loop_totals
+    """
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    return loop_verts, loop_starts, loop_totals
+
+
+def get_next_loops(loop_starts, loop_totals, num_loops):
+    """Return the index of the next loop in each loop's polygon.
+
+    Args:
+        loop_starts (numpy.ndarray): polygon loop starts
+        loop_totals (numpy.ndarray): polygon loop totals
+        num_loops (int): number of loops
+
+    Returns:
+        numpy.ndarray: next loop indices
+    """
+    nxt = np.arange(1, num_loops + 1)
+    if len(loop_starts):
+        nxt[loop_starts + loop_totals - 1] = loop_starts
+    return nxt
+
+
+def get_edge_face_counts(mesh):
+    """Return the number of faces using each edge and how many of them traverse it forwards.
+
+    In a manifold mesh with consistent normals every edge is used by two faces,
+    one traversing it in each direction.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): face counts, forward counts
+    """
+    num_edges = len(mesh.edges)
+    loop_verts, loop_starts, loop_totals = get_loop_arrays(mesh)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('edge_index', loop_edges)
+
+    nxt = get_next_loops(loop_starts, loop_totals, len(mesh.loops))
+    forward = loop_verts < loop_verts[nxt]
+
+    face_counts = np.bincount(loop_edges, minlength=num_edges)
+    forward_counts = np.bincount(loop_edges[forward], minlength=num_edges)
+    return face_counts, forward_counts
+
+
+def get_non_manifold_edge_count(mesh):
+    """Return the number of non-manifold edges in a mesh.
+
+    Boundary edges, edges shared by more than two faces and wire edges all count.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        int: number of non-manifold edges
+    """
+    face_counts, forward_counts = get_edge_face_counts(mesh)
+    return int(np.count_nonzero(face_counts != 2))
+
+
+def get_inconsistent_edge_count(mesh):
+    """Return the number of manifold edges whose two faces have opposing normals.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        int: number of edges with inconsistent winding
+    """
+    face_counts, forward_counts = get_edge_face_counts(mesh)
+    return int(np.count_nonzero((face_counts == 2) & (forward_counts != 1)))
+
+
+def get_triangle_count(mesh):
+    """Return the number of triangles a mesh will have once triangulated.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        int: triangle count
+    """
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    return int((loop_totals - 2).sum())
+
+
+def get_surface_area(obj, coords='GLOBAL'):
+    """Return the surface area of an object's mesh.
+
+    Args:
+        obj (bpy.types.Object): object
+        coords (str, optional): 'GLOBAL' for world space or 'LOCAL' for object space. Defaults to 'GLOBAL'.
+
+    Returns:
+        float: surface area
+    """
+    mesh = obj.data
+    areas = np.empty(len(mesh.polygons), dtype=np.float64)
+    mesh.polygons.foreach_get('area', areas)
+    if coords == 'LOCAL':
+        return float(areas.sum())
+    scale = obj.matrix_world.to_scale()
+    return float(areas.sum()) * abs(scale[0] * scale[1] * scale[2]) ** (2 / 3)
+
+
+# size in bytes of a binary STL header and of each triangle
+STL_HEADER_BYTES = 84
+STL_TRIANGLE_BYTES = 50
+
+
+def get_stl_size(num_tris):
+    """Return the size in bytes of a binary STL with this many triangles.
+
+    Args:
+        num_tris (int): number of triangles
+
+    Returns:
+        int: file size in bytes
+    """
+    return STL_HEADER_BYTES + STL_TRIANGLE_BYTES * num_tris
+
+
+def get_component_labels(num_verts, edge_verts):
+    """Label the connected components of a mesh's vertices.
+
+    Uses min label propagation with pointer jumping so it stays vectorised.
+
+    Args:
+        num_verts (int): number of vertices
+        edge_verts (numpy.ndarray): vertex indices of each edge of shape (n, 2)
+
+    Returns:
+        numpy.ndarray: component label of each vertex
+    """
+    labels = np.arange(num_verts)
+    if len(edge_verts) == 0:
+        return labels
+    a = edge_verts[:, 0]
+    b = edge_verts[:, 1]
+    while True:
+        prev = labels.copy()
+        m = np.minimum(labels[a], labels[b])
+        np.minimum.at(labels, a, m)
+        np.minimum.at(labels, b, m)
+        labels = labels[labels]
+        if np.array_equal(labels, prev):
+            return labels
+
+
+def get_edge_verts(mesh):
+    """Return the vertex indices of each edge of a mesh.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        numpy.ndarray: vertex indices of shape (n, 2)
+    """
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edge_verts)
+    return edge_verts.reshape((-1, 2))
+
+
+def get_loose_part_count(labels, edge_verts):
+    """Return the number of separate connected parts in a mesh, ignoring loose vertices.
+
+    Args:
+        labels (numpy.ndarray): component label of each vertex from get_component_labels
+        edge_verts (numpy.ndarray): vertex indices of each edge of shape (n, 2)
+
+    Returns:
+        int: number of parts
+    """
+    return len(np.unique(labels[edge_verts.ravel()]))
+
+
+def get_triangle_volumes(co, tris):
+    """Return the signed volume of the tetrahedron each triangle makes with the origin.
+
+    Args:
+        co (numpy.ndarray): vertex coordinates of shape (n, 3)
+        tris (numpy.ndarray): vertex indices of each triangle of shape (m, 3)
+
+    Returns:
+        numpy.ndarray: signed volumes of shape (m,)
+    """
+    v0 = co[tris[:, 0]]
+    v1 = co[tris[:, 1]]
+    v2 = co[tris[:, 2]]
+    return np.einsum('ij,ij->i', v0, np.cross(v1, v2)) / 6
+
+
+def get_signed_volume(co, tris):
+    """Return the signed volume enclosed by a triangle mesh.
+
+    The volume is negative if the normals of a closed mesh point inwards.
+
+    Args:
+        co (numpy.ndarray): vertex coordinates of shape (n, 3)
+        tris (numpy.ndarray): vertex indices of each triangle of shape (m, 3)
+
+    Returns:
+        float: signed volume
+    """
+    if len(tris) == 0:
+        return 0.0
+    return float(get_triangle_volumes(co, tris).sum())
+
+
+def get_inverted_part_count(co, tris, edge_verts, labels, face_counts):
+    """Return the number of closed parts of a mesh whose normals point inwards.
+
+    Parts with any non-manifold edges are skipped as their volume isn't meaningful.
+
+    Args:
+        co (numpy.ndarray): vertex coordinates of shape (n, 3)
+        tris (numpy.ndarray): vertex indices of each triangle of shape (m, 3)
+        edge_verts (numpy.ndarray): vertex indices of each edge of shape (k, 2)
+        labels (numpy.ndarray): component label of each vertex from get_component_labels
+        face_counts (numpy.ndarray): number of faces using each edge
+
+    Returns:
+        int: number of inverted parts
+    """
+    if len(tris) == 0:
+        return 0
+    volumes = np.bincount(
+        labels[tris[:, 0]],
+        weights=get_triangle_volumes(co, tris),
+        minlength=len(labels))
+    has_faces = np.bincount(labels[tris[:, 0]], minlength=len(labels)) > 0
+    is_closed = np.ones(len(labels), dtype=bool)
+    is_closed[labels[edge_verts[face_counts != 2, 0]]] = False
+    return int(np.count_nonzero(has_faces & is_closed & (volumes < 0)))
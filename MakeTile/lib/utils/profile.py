@@ -1,18 +1,196 @@
-import cProfile, pstats, io
-from pstats import SortKey
+"""Profile MakeTile operators with cProfile.
+
+auto_load wraps the execute, invoke, modal and cancel methods of every MT_OT_
+operator with profile_operator_method. When profiling is enabled in the add-on
+preferences each run of an operator is profiled and the stats are dumped to a
+.prof file which can be opened with pstats or snakeviz. A modal operator's run
+lasts from the call that returns RUNNING_MODAL until it finishes or is cancelled,
+and only the time spent in its own methods is recorded.
+"""
+import os
+import cProfile
+import pstats
+import tempfile
+import functools
+from datetime import datetime
 import bpy
+from ...utils.registration import get_prefs
+
+PROFILE_DIR_NAME = 'maketile_profiles'
+
+# top cumulative entries of the last profiled operator
+latest_profile = {
+    'operator': None,
+    'path': None,
+    'total_time': 0,
+    'entries': []}
+
+# True while an operator is being profiled so operators it calls aren't profiled separately
+profiling = {'active': False}
+
+# operator methods that are wrapped
+PROFILED_METHODS = ('execute', 'invoke', 'modal', 'cancel')
+
+# attribute of a running modal operator that holds its profile between calls
+PROFILE_ATTR = '_mt_profile'
+
+
+def get_profile_dir(prefs):
+    """Return the directory profiles are saved to.
+
+    Args:
+        prefs (MakeTile.preferences.MT_MakeTilePreferences): add-on preferences
+
+    Returns:
+        str: directory
+    """
+    if prefs.profile_dir:
+        return os.path.abspath(bpy.path.abspath(prefs.profile_dir))
+    return os.path.join(tempfile.gettempdir(), PROFILE_DIR_NAME)
+
+
+def get_profile_filename(op_name):
+    """Return a profile filename named by operator and timestamp.
+
+    Args:
+        op_name (str): operator bl_idname
+
+    Returns:
+        str: filename
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    return op_name.replace('.', '_') + '_' + timestamp + '.prof'
+
+
+def get_top_entries(stats, count):
+    """Return the entries of a profile with the highest cumulative time.
+
+    Args:
+        stats (pstats.Stats): profile stats
+        count (int): number of entries
+
+    Returns:
+        list[tuple(str, int, float, float)]: function, calls, total time, cumulative time
+    """
+    entries = []
+    for (filename, line, func), (cc, nc, tt, ct, callers) in stats.stats.items():
+        name = '{0}:{1}({2})'.format(os.path.basename(filename), line, func)
+        entries.append((name, nc, tt, ct))
+    entries.sort(key=lambda entry: entry[3], reverse=True)
+    return entries[:count]
 
 
+def save_profile(profile, op_name, prefs):
+    """Dump a profile to the profile directory and store its top entries in latest_profile.
 
-def profile_operator(op_call):
-    #op_call = 'bpy.ops.object.make_straight_wall(invoked=False, executed=True, base_updated=True, refresh=True, auto_refresh=True, reset_defaults=False, defaults_upated=False, main_part_blueprint=\'OPENLOCK\', base_blueprint=\'OPENLOCK\', x_proportionate_scale=True, y_proportionate_scale=False, z_proportionate_scale=False, tile_x=2.515, tile_y=0.32, tile_z=2, base_x=2.515, base_y=0.5, base_z=0.2755, tile_size=(0, 0, 0), base_size=(0, 0, 0), collection_type=\'TILE\', tile_name="straight_wall.009", is_mt_collection=True, converter_material=\'Basic Stone 1\', export_subdivs=3, subdivision_density=\'MEDIUM\', UV_island_margin=0.012, texture_margin=0.001, tile_units=\'INCHES\', wall_position=\'CENTER\', floor_thickness=0.0245, floor_material=\'Floor Tiles\', wall_material=\'Basic Stone 1\')'
-    profile = cProfile.Profile()
+    Args:
+        profile (cProfile.Profile): profile
+        op_name (str): operator bl_idname
+        prefs (MakeTile.preferences.MT_MakeTilePreferences): add-on preferences
+
+    Returns:
+        str: path of saved profile
+    """
+    profile_dir = get_profile_dir(prefs)
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, get_profile_filename(op_name))
+    profile.dump_stats(path)
+
+    stats = pstats.Stats(profile)
+    latest_profile['operator'] = op_name
+    latest_profile['path'] = path
+    latest_profile['total_time'] = stats.total_tt
+    latest_profile['entries'] = get_top_entries(stats, prefs.profile_top_n)
+    return path
+
+
+def is_run_finished(method_name, result):
+    """Return whether an operator's run is over after one of its methods returns.
+
+    Args:
+        method_name (str): name of the method
+        result (set[str]): value returned by the method. None if it raised.
+
+    Returns:
+        bool: whether the run is over
+    """
+    if method_name == 'cancel' or result is None:
+        return True
+    if 'RUNNING_MODAL' in result:
+        return False
+    # a modal operator passes events through without finishing
+    if method_name == 'modal':
+        return 'FINISHED' in result or 'CANCELLED' in result
+    return True
+
+
+def call_profiled(operator, method_name, call):
+    """Call an operator method, profiling it if enabled in preferences.
+
+    Args:
+        operator (bpy.types.Operator): operator
+        method_name (str): name of the method
+        call (function): calls the original method with its arguments
+
+    Returns:
+        set[str]: value returned by the method
+    """
+    if profiling['active']:
+        return call()
+
+    profile = getattr(operator, PROFILE_ATTR, None)
+    if profile is None:
+        if method_name in ('modal', 'cancel'):
+            return call()
+        prefs = get_prefs()
+        if not prefs.profile_operators:
+            return call()
+        profile = cProfile.Profile()
+
+    result = None
+    profiling['active'] = True
     profile.enable()
-    bpy.ops.object.make_straight_wall(invoked=False, executed=True, base_updated=True, refresh=True, auto_refresh=True, reset_defaults=False, defaults_upated=False, main_part_blueprint='OPENLOCK', base_blueprint='OPENLOCK', x_proportionate_scale=True, y_proportionate_scale=False, z_proportionate_scale=False, tile_x=2.015, tile_y=0.32, tile_z=2, base_x=2.015, base_y=0.5, base_z=0.2755, tile_size=(0, 0, 0), base_size=(0, 0, 0), collection_type='TILE', tile_name="straight_wall.013", is_mt_collection=True, converter_material='Basic Stone 1', export_subdivs=3, subdivision_density='MEDIUM', UV_island_margin=0.012, texture_margin=0.001, tile_units='INCHES', wall_position='CENTER', floor_thickness=0.0245, floor_material='Floor Tiles', wall_material='Basic Stone 1')
-    profile.disable()
-    s = io.StringIO()
-    sortby = SortKey.CUMULATIVE
-    ps = pstats.Stats(profile, stream=s).sort_stats(sortby)
-    ps.print_stats()
-    print(s.getvalue())
+    try:
+        result = call()
+        return result
+    finally:
+        profile.disable()
+        profiling['active'] = False
+        if is_run_finished(method_name, result):
+            setattr(operator, PROFILE_ATTR, None)
+            try:
+                path = save_profile(profile, operator.bl_idname, get_prefs())
+                print('Saved profile to ' + path)
+            except OSError as err:
+                print(err)
+        else:
+            setattr(operator, PROFILE_ATTR, profile)
+
+
+def profile_operator_method(method, method_name):
+    """Wrap an operator method so it is profiled when enabled in preferences.
+
+    Blender checks the number of arguments of operator methods when a class is
+    registered, so each wrapper keeps the signature of the method it wraps.
+
+    Args:
+        method (function): execute, invoke, modal or cancel method
+        method_name (str): name of the method
+
+    Returns:
+        function: wrapped method
+    """
+    if getattr(method, 'mt_profiled', False):
+        return method
+
+    if method_name in ('invoke', 'modal'):
+        @functools.wraps(method)
+        def wrapper(self, context, event):
+            return call_profiled(self, method_name, lambda: method(self, context, event))
+    else:
+        @functools.wraps(method)
+        def wrapper(self, context):
+            return call_profiled(self, method_name, lambda: method(self, context))
 
+    wrapper.mt_profiled = True
+    return wrapper
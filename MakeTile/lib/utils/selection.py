@@ -1,5 +1,5 @@
 import bpy
-import bmesh
+import numpy as np
 from mathutils import Vector
 
 
@@ -73,186 +73,57 @@ def in_bbox(lbound, ubound, vert, buffer=0.001):
         lbound[2] - buffer <= vert[2] <= ubound[2] + buffer
 
 
-def select_by_loc(
-        lbound=(0, 0, 0),
-        ubound=(0, 0, 0),
-        select_mode='VERT',
-        coords='GLOBAL',
-        buffer=0.001,
-        additive=False):
-    """select faces, edges or verts by location that are wholly
-    within a bounding cuboid
+class CoordIndex:
+    """Spatial index over an array of vertex coordinates for bounding box queries.
 
-    Keyword arguments:
-
-    lbound -- lower left bound of bounding box
-    ubound -- upper right bound of bounding box
-    select_mode -- default 'VERT'
-    coords -- default 'GLOBAL'
-    buffer - buffer around selection default = 0.001
-    """
-
-    # set selection mode
-    bpy.ops.mesh.select_mode(type=select_mode)
-    # grab the transformation matrix
-    world = bpy.context.object.matrix_world
-
-    # instantiate a bmesh object and ensure lookup table (bm.faces.ensure... works for all)
-    bm = bmesh.from_edit_mesh(bpy.context.object.data)
-    bm.faces.ensure_lookup_table()
-
-    # initialise list of verts and parts to be selected
-    verts = []
-    to_select = []
-
-    # for VERT, EDGE or FACE
-    # grab list of global or local coords
-    # test if the piece is entirely within the rectangular
-    # prism defined by lbound and ubound
-    # select each piece that returned TRUE and deselect each piece that returned FALSE
-
-    if select_mode == 'VERT':
-        if coords == 'GLOBAL':
-            [verts.append((world @ v.co).to_tuple())for v in bm.verts]
-        elif coords == 'LOCAL':
-            [verts.append(v.co.to_tuple())for v in bm.verts]
-
-        [to_select.append(in_bbox(lbound, ubound, v, buffer))for v in verts]
-
-        for vert_obj, select in zip(bm.verts, to_select):
-            if additive:
-                vert_obj.select |= select
-            else:
-                vert_obj.select = select
-
-    if select_mode == 'EDGE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in e.verts]) for e in bm.edges]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in e.verts]) for e in bm.edges]
-
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer)for v in e)) for e in verts]
-
-        for edge_obj, select in zip(bm.edges, to_select):
-            if additive:
-                edge_obj.select |= select
-            else:
-                edge_obj.select = select
-
-    if select_mode == 'FACE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in f.verts])for f in bm.faces]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in f.verts]) for f in bm.faces]
-
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer) for v in f))for f in verts]
-
-        for face_obj, select in zip(bm.faces, to_select):
-            if additive:
-                face_obj.select |= select
-            else:
-                face_obj.select = select
-
-    # update the edit mesh so we get live highlighting
-    bmesh.update_edit_mesh(bpy.context.object.data)
-
-
-def select_inverse_by_loc(
-        lbound=(0, 0, 0),
-        ubound=(0, 0, 0),
-        select_mode='VERT',
-        coords='GLOBAL',
-        buffer=0.001,
-        additive=False):
-    """selects faces, edges or verts by location that are not within
-    a bounding cuboid
-
-    Keyword arguments:
-
-    lbound -- lower left bound of bounding box
-    ubound -- upper right bound of bounding box
-    select_mode -- default 'VERT'
-    coords -- default 'GLOBAL'
-    buffer - buffer around selection default = 0.001
+    Works in object mode. Coordinates are read once and sorted along X so each
+    query only tests the vertices whose X coordinate is in range. Queries return
+    boolean masks over the vertices or edges.
     """
 
-    # set selection mode
-    bpy.ops.mesh.select_mode(type=select_mode)
-    # grab the transformation matrix
-    world = bpy.context.object.matrix_world
-
-    # instantiate a bmesh object and ensure lookup table (bm.faces.ensure... works for all)
-    bm = bmesh.from_edit_mesh(bpy.context.object.data)
-    bm.faces.ensure_lookup_table()
-
-    # initialise list of verts and parts to be selected
-    verts = []
-    to_select = []
-
-    # for VERT, EDGE or FACE
-    # grab list of global or local coords
-    # test if the piece is entirely within the rectangular
-    # prism defined by lbound and ubound
-    # select each piece that returned TRUE and deselect each piece that returned FALSE
-
-    if select_mode == 'VERT':
-        if coords == 'GLOBAL':
-            [verts.append((world @ v.co).to_tuple())for v in bm.verts]
-        elif coords == 'LOCAL':
-            [verts.append(v.co.to_tuple())for v in bm.verts]
-
-        [to_select.append(in_bbox(lbound, ubound, v, buffer))for v in verts]
-
-        for vert_obj, select in zip(bm.verts, to_select):
-            if select is True:
-                select = False
-            else:
-                select = True
-
-            if additive:
-                vert_obj.select |= select
-            else:
-                vert_obj.select = select
-
-    if select_mode == 'EDGE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in e.verts]) for e in bm.edges]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in e.verts]) for e in bm.edges]
-
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer)for v in e)) for e in verts]
-
-        for edge_obj, select in zip(bm.edges, to_select):
-
-            if select is True:
-                select = False
-            else:
-                select = True
-
-            if additive:
-                edge_obj.select |= select
-            else:
-                edge_obj.select = select
-
-    if select_mode == 'FACE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in f.verts])for f in bm.faces]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in f.verts]) for f in bm.faces]
-
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer) for v in f))for f in verts]
-
-        for face_obj, select in zip(bm.faces, to_select):
-
-            if select is True:
-                select = False
-            else:
-                select = True
-
-            if additive:
-                face_obj.select |= select
-            else:
-                face_obj.select = select
-
-    # update the edit mesh so we get live highlighting
-    bmesh.update_edit_mesh(bpy.context.object.data)
+    def __init__(self, co, edge_verts=None):
+        """Build the index.
+
+        Args:
+            co (numpy.ndarray): vertex coordinates of shape (n, 3)
+            edge_verts (numpy.ndarray, optional): vertex indices of each edge of shape (m, 2). Defaults to None.
+        """
+        self.co = np.asarray(co, dtype=np.float64).reshape((-1, 3))
+        self.order = np.argsort(self.co[:, 0], kind='stable')
+        self.sorted_x = self.co[self.order, 0]
+        self.edge_verts = edge_verts
+
+    def vert_mask(self, lbound, ubound, buffer=0.001):
+        """Return a boolean mask of vertices within a bounding cuboid.
+
+        Args:
+            lbound (Vector): lower left of cuboid
+            ubound (Vector): upper right of cuboid
+            buffer (float, optional): buffer to add to cuboid. Defaults to 0.001.
+
+        Returns:
+            numpy.ndarray: mask
+        """
+        lbound = np.asarray(lbound, dtype=np.float64) - buffer
+        ubound = np.asarray(ubound, dtype=np.float64) + buffer
+        start = np.searchsorted(self.sorted_x, lbound[0], side='left')
+        end = np.searchsorted(self.sorted_x, ubound[0], side='right')
+        candidates = self.order[start:end]
+        co = self.co[candidates]
+        inside = np.all((co[:, 1:] >= lbound[1:]) & (co[:, 1:] <= ubound[1:]), axis=1)
+        mask = np.zeros(len(self.co), dtype=bool)
+        mask[candidates[inside]] = True
+        return mask
+
+    def edge_mask(self, lbound, ubound, buffer=0.001):
+        """Return a boolean mask of edges wholly within a bounding cuboid.
+
+        Args:
+            lbound (Vector): lower left of cuboid
+            ubound (Vector): upper right of cuboid
+            buffer (float, optional): buffer to add to cuboid. Defaults to 0.001.
+
+        Returns:
+            numpy.ndarray: mask
+        """
+        return self.vert_mask(lbound, ubound, buffer)[self.edge_verts].all(axis=1)
@@ -21,9 +21,9 @@
 
 import bpy
 import bmesh
-from mathutils.geometry import intersect_line_line as LineIntersect
+import numpy as np
+from mathutils import Vector
 
-import itertools
 from collections import defaultdict
 from . import cad_module as cm
 
@@ -39,65 +39,28 @@ def order_points(edge, point_list):
     return [v1] + point_list + [v2]
 
 
-def remove_permutations_that_share_a_vertex(bm, permutations):
-    ''' Get useful Permutations '''
-    final_permutations = []
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        if cm.duplicates(raw_vert_indices):
-            continue
-
-        # reaches this point if they do not share.
-        final_permutations.append(edges)
-
-    return final_permutations
-
-
-def get_valid_permutations(bm, edge_indices):
-    raw_permutations = itertools.permutations(edge_indices, 2)
-    permutations = [r for r in raw_permutations if r[0] < r[1]]
-    return remove_permutations_that_share_a_vertex(bm, permutations)
-
-
-def can_skip(closest_points, vert_vectors):
-    '''this checks if the intersection lies on both edges, returns True
-    when criteria are not met, and thus this point can be skipped'''
-    if not closest_points:
-        return True
-    if not isinstance(closest_points[0].x, float):
-        return True
-    if cm.num_edges_point_lies_on(closest_points[0], vert_vectors) < 2:
-        return True
-
-    # if this distance is larger than than VTX_PRECISION, we can skip it.
-    cpa, cpb = closest_points
-    return (cpa - cpb).length > cm.CAD_prefs.VTX_PRECISION
-
-
 def get_intersection_dictionary(bm, edge_indices):
 
     bm.verts.ensure_lookup_table()
     bm.edges.ensure_lookup_table()
 
-    permutations = get_valid_permutations(bm, edge_indices)
+    edges = [bm.edges[idx] for idx in edge_indices]
+    co = np.array([v.co for v in bm.verts], dtype=np.float64).reshape((-1, 3))
+    edge_verts = np.array(
+        [(e.verts[0].index, e.verts[1].index) for e in edges],
+        dtype=np.int64).reshape((-1, 2))
+
+    pairs, points = cm.get_edge_intersections(co, edge_verts)
 
     k = defaultdict(list)
     d = defaultdict(list)
 
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        vert_vectors = cm.vectors_from_indices(bm, raw_vert_indices)
-
-        points = LineIntersect(*vert_vectors)
-
-        # some can be skipped.    (NaN, None, not on both edges)
-        if can_skip(points, vert_vectors):
-            continue
-
-        # reaches this point only when an intersection happens on both edges.
-        [k[edge].append(points[0]) for edge in edges]
-
     # k will contain a dict of edge indices and points found on those edges.
+    for (i, j), point in zip(pairs.tolist(), points):
+        point = Vector(point)
+        k[edge_indices[i]].append(point)
+        k[edge_indices[j]].append(point.copy())
+
     for edge_idx, unordered_points in k.items():
         tv1, tv2 = bm.edges[edge_idx].verts
         v1 = bm.verts[tv1.index].co
@@ -20,6 +20,7 @@
 
 
 import bmesh
+import numpy as np
 
 from mathutils import Vector, geometry
 from mathutils.geometry import intersect_line_line as LineIntersect
@@ -31,6 +32,10 @@ class CAD_prefs:
     VTX_DOUBLES_THRSHLD = 0.0001
 
 
+# average number of grid cells an edge may occupy in get_candidate_edge_pairs
+MAX_GRID_ENTRIES_PER_EDGE = 8
+
+
 def point_on_edge(p, edge):
     '''
     > p:        vector
@@ -170,3 +175,128 @@ def duplicates(indices):
 def vert_idxs_from_edge_idx(bm, idx):
     edge = bm.edges[idx]
     return edge.verts[0].index, edge.verts[1].index
+
+
+def get_candidate_edge_pairs(mins, maxs):
+    '''
+    > mins, maxs:   arrays of shape (n, 3) holding the bounding box of each edge
+    < returns an array of shape (m, 2) of edge index pairs (i < j) whose bounding
+      boxes overlap.
+
+    Edges are bucketed into a uniform grid sized to the average edge extent so
+    only edges sharing a cell are compared.
+    '''
+    num_edges = len(mins)
+    if num_edges < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    extents = maxs - mins
+    cell_size = max(float(extents.max(axis=1).mean()), CAD_prefs.VTX_PRECISION)
+    origin = mins.min(axis=0)
+
+    # grow the cells until long edges no longer flood the grid
+    while True:
+        lo = np.floor((mins - origin) / cell_size).astype(np.int64)
+        hi = np.floor((maxs - origin) / cell_size).astype(np.int64)
+        spans = hi - lo + 1
+        counts = spans.prod(axis=1)
+        if counts.sum() <= MAX_GRID_ENTRIES_PER_EDGE * num_edges:
+            break
+        cell_size *= 2
+    grid_dims = hi.max(axis=0) + 1
+
+    # one entry per (edge, cell) the edge's bounding box touches
+    edge_ids = np.repeat(np.arange(num_edges), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    span = spans[edge_ids]
+    cells = lo[edge_ids] + np.stack((
+        local % span[:, 0],
+        (local // span[:, 0]) % span[:, 1],
+        local // (span[:, 0] * span[:, 1])), axis=1)
+    keys = (cells[:, 2] * grid_dims[1] + cells[:, 1]) * grid_dims[0] + cells[:, 0]
+
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    edge_ids = edge_ids[order]
+
+    # pair every entry with the later entries in the same cell
+    pairs = []
+    offset = 1
+    while offset < len(keys):
+        same_cell = keys[offset:] == keys[:-offset]
+        if not same_cell.any():
+            break
+        pairs.append(np.stack((
+            edge_ids[:-offset][same_cell],
+            edge_ids[offset:][same_cell]), axis=1))
+        offset += 1
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+
+    pairs = np.sort(np.concatenate(pairs), axis=1)
+    pairs = np.unique(pairs[pairs[:, 0] != pairs[:, 1]], axis=0)
+
+    # discard pairs that only share a cell, not a bounding box
+    a, b = pairs[:, 0], pairs[:, 1]
+    overlap = np.all((mins[a] <= maxs[b]) & (mins[b] <= maxs[a]), axis=1)
+    return pairs[overlap]
+
+
+def get_edge_intersections(co, edge_verts):
+    '''
+    > co:           array of shape (v, 3) of vertex coordinates
+    > edge_verts:   array of shape (n, 2) of vertex indices of each edge
+    < returns (pairs, points): pairs is an array of shape (m, 2) of indices into
+      edge_verts of edges that intersect, points is an array of shape (m, 3) of
+      the intersection on the first edge of each pair.
+
+    Edges that share a vertex or are parallel are not reported. This is the
+    vectorised equivalent of testing every pair of edges with
+    intersect_line_line and point_on_edge.
+    '''
+    co = np.asarray(co, dtype=np.float64).reshape((-1, 3))
+    edge_verts = np.asarray(edge_verts, dtype=np.int64).reshape((-1, 2))
+    precision = CAD_prefs.VTX_PRECISION
+
+    start = co[edge_verts[:, 0]]
+    end = co[edge_verts[:, 1]]
+    mins = np.minimum(start, end) - precision
+    maxs = np.maximum(start, end) + precision
+    pairs = get_candidate_edge_pairs(mins, maxs)
+
+    # edges that share a vertex can't intersect in their interiors
+    ev_a = edge_verts[pairs[:, 0]]
+    ev_b = edge_verts[pairs[:, 1]]
+    shared = (ev_a[:, :, None] == ev_b[:, None, :]).any(axis=(1, 2))
+    pairs = pairs[~shared]
+
+    # closest points between the two lines
+    p1 = start[pairs[:, 0]]
+    d1 = end[pairs[:, 0]] - p1
+    p2 = start[pairs[:, 1]]
+    d2 = end[pairs[:, 1]] - p2
+    r = p1 - p2
+    a = np.einsum('ij,ij->i', d1, d1)
+    b = np.einsum('ij,ij->i', d1, d2)
+    c = np.einsum('ij,ij->i', d1, r)
+    e = np.einsum('ij,ij->i', d2, d2)
+    f = np.einsum('ij,ij->i', d2, r)
+    denom = a * e - b * b
+
+    valid = denom > 1.0e-12 * a * e
+    denom = np.where(valid, denom, 1.0)
+    s = (b * f - c * e) / denom
+    t = (a * f - b * c) / denom
+
+    pt1 = p1 + s[:, None] * d1
+    pt2 = p2 + t[:, None] * d2
+
+    # the closest points must coincide and lie on both edges
+    tol_1 = precision / np.sqrt(np.maximum(a, precision))
+    tol_2 = precision / np.sqrt(np.maximum(e, precision))
+    valid &= np.linalg.norm(pt1 - pt2, axis=1) < precision
+    valid &= (s >= -tol_1) & (s <= 1 + tol_1)
+    valid &= (t >= -tol_2) & (t <= 1 + tol_2)
+
+    return pairs[valid], pt1[valid]
@@ -212,6 +212,22 @@ def vectors_are_close(vec_1, vec_2, tolerance=0.0001):
         isclose(vec_1[2], vec_2[2], abs_tol=tolerance)
 
 
+def get_unit_multiplier(units):
+    """Return the number of mm in one of the passed in units.
+
+    Args:
+        units (enum in {'INCHES', 'CM'}): units
+
+    Returns:
+        float: multiplier
+    """
+    if units == 'CM':
+        return 10
+    if units == 'INCHES':
+        return 25.4
+    return 1
+
+
 def get_all_subclasses(python_class):
     """
     Helper function to get all the subclasses of a class.
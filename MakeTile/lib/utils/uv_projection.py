@@ -0,0 +1,101 @@
+"""Vectorised UV projection helpers built on foreach_get and numpy."""
+import numpy as np
+from .mesh_analysis import get_loop_arrays
+
+# for each projection direction (+X, -X, +Y, -Y, +Z, -Z) the axis and sign
+# used for u and the axis used for v, chosen so no direction is mirrored
+BOX_PROJECTION_AXES = [
+    (1, 1, 2),
+    (1, -1, 2),
+    (0, -1, 2),
+    (0, 1, 2),
+    (0, 1, 1),
+    (0, -1, 1)]
+
+
+def get_box_projection_directions(normals):
+    """Return the box projection direction of each polygon.
+
+    Args:
+        normals (numpy.ndarray): polygon normals of shape (n, 3)
+
+    Returns:
+        numpy.ndarray: direction index into BOX_PROJECTION_AXES for each polygon
+    """
+    if len(normals) == 0:
+        return np.empty(0, dtype=np.int64)
+    axis = np.abs(normals).argmax(axis=1)
+    negative = normals[np.arange(len(normals)), axis] < 0
+    return axis * 2 + negative
+
+
+def get_box_projection_uvs(loop_co, loop_directions, bounds_min, bounds_max, margin=0.0):
+    """Return box projected uvs laid out so the six directions don't overlap.
+
+    Each direction gets a square cell in a 3 x 2 grid. All directions share
+    the same scale so texel density is uniform across the mesh.
+
+    Args:
+        loop_co (numpy.ndarray): coordinates of each loop's vertex of shape (n, 3)
+        loop_directions (numpy.ndarray): projection direction of each loop
+        bounds_min (numpy.ndarray): lower corner of the mesh bounds
+        bounds_max (numpy.ndarray): upper corner of the mesh bounds
+        margin (float, optional): margin around each cell in uv space. Defaults to 0.0.
+
+    Returns:
+        numpy.ndarray: uvs of shape (n, 2)
+    """
+    cell_size = 1 / 3
+    extent = max(float((bounds_max - bounds_min).max()), 1e-6)
+    scale = max(cell_size - margin * 2, 0) / extent
+
+    axes = np.array(BOX_PROJECTION_AXES)[loop_directions]
+    rows = np.arange(len(loop_co))
+    u_sign = axes[:, 1]
+    u = loop_co[rows, axes[:, 0]] * u_sign
+    v = loop_co[rows, axes[:, 2]]
+
+    # offset so each projection starts at the corner of its cell
+    u_min = np.where(u_sign > 0, bounds_min[axes[:, 0]], -bounds_max[axes[:, 0]])
+    v_min = bounds_min[axes[:, 2]]
+
+    cell_u = (loop_directions % 3) * cell_size + margin
+    cell_v = (loop_directions // 3) * cell_size + margin
+
+    uvs = np.empty((len(loop_co), 2), dtype=np.float32)
+    uvs[:, 0] = cell_u + (u - u_min) * scale
+    uvs[:, 1] = cell_v + (v - v_min) * scale
+    return uvs
+
+
+def box_project(mesh, margin=0.0):
+    """Box project the active UV layer of a mesh, creating one if necessary.
+
+    A fast alternative to smart UV project for dense meshes such as scans.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        margin (float, optional): margin around each projection in uv space. Defaults to 0.0.
+    """
+    if len(mesh.uv_layers) == 0:
+        mesh.uv_layers.new(name='UVMap')
+    if len(mesh.polygons) == 0:
+        return
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape((-1, 3))
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float64)
+    mesh.polygons.foreach_get('normal', normals)
+    normals = normals.reshape((-1, 3))
+    loop_verts, loop_starts, loop_totals = get_loop_arrays(mesh)
+
+    directions = np.repeat(get_box_projection_directions(normals), loop_totals)
+    uvs = get_box_projection_uvs(
+        co[loop_verts],
+        directions,
+        co.min(axis=0),
+        co.max(axis=0),
+        margin)
+    mesh.uv_layers.active.data.foreach_set('uv', uvs.ravel())
+    mesh.update()
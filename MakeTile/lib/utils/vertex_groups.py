@@ -1,11 +1,7 @@
+from collections import defaultdict
 import bpy
 import bmesh
-from . selection import (
-    select_by_loc,
-    select_inverse_by_loc,
-    deselect_all,
-    select)
-from . utils import mode, view3d_find
+import numpy as np
 
 
 def clear_vert_group(vert_group, obj):
@@ -26,18 +22,58 @@ def get_verts_with_material(obj, material_name):
     return verts
 
 
+def get_vert_group_masks(mesh, group_indices):
+    """Return boolean arrays flagging which vertices belong to each vertex group.
+
+    Membership is read from the deform layer in a single pass over the vertices.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        group_indices (list[int]): vertex group indices
+
+    Returns:
+        dict{int: numpy.ndarray}: mask for each group index
+    """
+    num_verts = len(mesh.vertices)
+    masks = {index: np.zeros(num_verts, dtype=bool) for index in group_indices}
+    if num_verts == 0 or not masks:
+        return masks
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    deform = bm.verts.layers.deform.active
+    if deform is not None:
+        for i, v in enumerate(bm.verts):
+            for group_index in v[deform].keys():
+                if group_index in masks:
+                    masks[group_index][i] = True
+    bm.free()
+    return masks
+
+
+def get_vert_group_mask(mesh, group_index):
+    """Return a boolean array flagging which vertices belong to a vertex group.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        group_index (int): vertex group index
+
+    Returns:
+        numpy.ndarray: mask
+    """
+    return get_vert_group_masks(mesh, [group_index])[group_index]
+
+
 def get_vert_indexes_in_vert_group(vert_group_name, obj):
     '''returns a list of vert indexes in a vert group'''
     vg_index = obj.vertex_groups[vert_group_name].index
-    vert_indices = [v.index for v in obj.data.vertices if vg_index in [vg.group for vg in v.groups]]
-    return vert_indices
+    return np.flatnonzero(get_vert_group_mask(obj.data, vg_index)).tolist()
 
 
 def get_verts_in_vert_group(vert_group_name, obj):
     '''return a list of vert objects in a vert group'''
-    vg_index = obj.vertex_groups[vert_group_name].index
-    verts = [v for v in obj.data.vertices if vg_index in [vg.group for vg in v.groups]]
-    return verts
+    verts = obj.data.vertices
+    return [verts[i] for i in get_vert_indexes_in_vert_group(vert_group_name, obj)]
 
 
 def remove_verts_from_group(vert_group_name, obj, vert_indices):
@@ -88,207 +124,68 @@ def assign_material_to_faces(obj, face_list, material_index):
             poly.material_index = material_index
 
 
+def get_vert_group_weights(mesh):
+    """Return the vertices in each vertex group grouped by weight.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        dict{int: dict{float: list[int]}}: vertex indices by weight for each group index
+    """
+    weights = defaultdict(lambda: defaultdict(list))
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    deform = bm.verts.layers.deform.active
+    if deform is not None:
+        for i, v in enumerate(bm.verts):
+            for group_index, weight in v[deform].items():
+                weights[group_index][weight].append(i)
+    bm.free()
+    return weights
+
+
+def new_vertex_group_at_start(obj, name):
+    """Create a vertex group at index 0 without using vertex_group_move.
+
+    If the object already has vertex groups they are read in one pass over the
+    vertices and recreated after the new group with one add call per weight.
+
+    Args:
+        obj (bpy.types.Object): mesh object
+        name (str): name of new vertex group
+
+    Returns:
+        bpy.types.VertexGroup: new vertex group
+    """
+    groups = obj.vertex_groups
+    if len(groups) == 0:
+        return groups.new(name=name)
+
+    existing = [(group.name, group.lock_weight) for group in groups]
+    weights = get_vert_group_weights(obj.data)
+
+    groups.clear()
+    new_group = groups.new(name=name)
+    for group_index, (group_name, lock_weight) in enumerate(existing):
+        group = groups.new(name=group_name)
+        for weight, indices in weights[group_index].items():
+            group.add(indices, weight, 'REPLACE')
+        group.lock_weight = lock_weight
+    return new_group
+
+
 def construct_displacement_mod_vert_group(obj, textured_vert_group_names):
     '''Constructs a vertex group from the passed in group names for use by displacement modifier.
     This ensures that only correct vertices are being displaced.'''
 
-    disp_mod_vert_group = obj.vertex_groups.new(name='disp_mod_vert_group')
-    all_vert_groups = obj.vertex_groups
+    group_indices = [group.index for group in obj.vertex_groups
+                     if group.name in textured_vert_group_names]
+    masks = get_vert_group_masks(obj.data, group_indices)
 
-    for group in all_vert_groups:
-        if group.name in textured_vert_group_names:
-            verts = get_verts_in_vert_group(group.name, obj)
-            indices = [i.index for i in verts]
-            disp_mod_vert_group.add(index=indices, weight=1, type='ADD')
+    disp_mod_vert_group = obj.vertex_groups.new(name='disp_mod_vert_group')
+    textured = np.zeros(len(obj.data.vertices), dtype=bool)
+    for mask in masks.values():
+        textured |= mask
+    disp_mod_vert_group.add(index=np.flatnonzero(textured).tolist(), weight=1, type='ADD')
     return disp_mod_vert_group.name
-
-
-def tri_prism_to_vert_groups(obj, dim, height):
-    """Keyword arguments:
-    obj - bpy.types.Object
-    dim - DICT
-    height - float"""
-    # make vertex groups
-    obj.vertex_groups.new(name='Side b')
-    obj.vertex_groups.new(name='Side a')
-    obj.vertex_groups.new(name='Side c')
-    obj.vertex_groups.new(name='Bottom')
-    obj.vertex_groups.new(name='Top')
-
-    mode('EDIT')
-
-    deselect_all()
-    select_by_loc(
-        lbound=dim['loc_C'],
-        ubound=(
-            dim['loc_C'][0],
-            dim['loc_C'][1],
-            dim['loc_C'][2] + height),
-        additive=True
-    )
-    select_by_loc(
-        lbound=dim['loc_B'],
-        ubound=(
-            dim['loc_B'][0],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + height),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side a')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=dim['loc_A'],
-        ubound=(
-            dim['loc_B'][0],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + height),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side b')
-    bpy.ops.object.vertex_group_assign()
-
-    select_by_loc(
-        lbound=dim['loc_A'],
-        ubound=(
-            dim['loc_C'][0],
-            dim['loc_C'][1],
-            dim['loc_C'][2] + height)
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side c')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            dim['loc_A'][0],
-            dim['loc_A'][1],
-            dim['loc_A'][2] + height),
-        ubound=(
-            dim['loc_B'][0] + dim['a'],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + height),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            dim['loc_A'][0],
-            dim['loc_A'][1],
-            dim['loc_A'][2]),
-        ubound=(
-            dim['loc_B'][0] + dim['a'],
-            dim['loc_B'][1],
-            dim['loc_B'][2]),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-
-def cuboid_sides_to_vert_groups(obj):
-    """makes a vertex group for each side of cuboid
-    and assigns vertices to it"""
-
-    mode('OBJECT')
-    dim = obj.dimensions / 2
-
-    # get original location of object origin and of cursor
-    obj_original_loc = obj.location.copy()
-    cursor_original_loc = bpy.context.scene.cursor.location.copy()
-
-    # set origin to center of bounds
-    bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-    # make vertex groups
-    obj.vertex_groups.new(name='Left')
-    obj.vertex_groups.new(name='Right')
-    obj.vertex_groups.new(name='Front')
-    obj.vertex_groups.new(name='Back')
-    obj.vertex_groups.new(name='Top')
-    obj.vertex_groups.new(name='Bottom')
-
-    mode('EDIT')
-
-    # select X- and assign to X-
-    select_by_loc(
-        lbound=-dim,
-        ubound=[-dim[0], dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        additive=True)
-
-    bpy.ops.object.vertex_group_set_active(group='Left')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select X+ and assign to X+
-    select_by_loc(
-        lbound=[dim[0], -dim[1], -dim[2]],
-        ubound=[dim[0], dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Right')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Y- and assign to Y-
-    select_by_loc(
-        lbound=-dim,
-        ubound=[dim[0], -dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Front')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Y+ and assign to Y+
-    select_by_loc(
-        lbound=[-dim[0], dim[1], -dim[2]],
-        ubound=[dim[0], dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Back')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Z- and assign to Z-
-    select_by_loc(
-        lbound=-dim,
-        ubound=[dim[0], dim[1], -dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Z+ and assign to Z+
-    select_by_loc(
-        lbound=[-dim[0], -dim[1], dim[2]],
-        ubound=[dim[0], dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    mode('OBJECT')
-
-    # reset cursor and object origin
-    bpy.context.scene.cursor.location = obj_original_loc
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-    bpy.context.scene.cursor.location = cursor_original_loc
@@ -0,0 +1,94 @@
+"""Contains functions for caching the names of materials in material libraries.
+
+Opening a .blend file just to list its materials is slow, so we keep a
+manifest of the materials in each library keyed by file path. A library is
+only opened again if its modification time or size has changed.
+"""
+import os
+import json
+import bpy
+from .. utils.registration import get_prefs
+
+MANIFEST_FILENAME = 'material_manifest.json'
+
+
+def get_manifest_path():
+    """Return the path to the material library manifest."""
+    prefs = get_prefs()
+    return os.path.join(prefs.user_assets_path, MANIFEST_FILENAME)
+
+
+def load_library_manifest():
+    """Load the material library manifest.
+
+    Returns:
+        dict: manifest keyed by library path
+    """
+    manifest_path = get_manifest_path()
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path) as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError) as err:
+            print(err)
+    return {}
+
+
+def save_library_manifest(manifest):
+    """Save the material library manifest.
+
+    Args:
+        manifest (dict): manifest keyed by library path
+    """
+    manifest_path = get_manifest_path()
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(manifest_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=4, sort_keys=True)
+    except OSError as err:
+        print(err)
+
+
+def get_file_signature(path):
+    """Return the modification time and size of a file.
+
+    Args:
+        path (str): file path
+
+    Returns:
+        list[float, int]: modification time, size
+    """
+    stat = os.stat(path)
+    return [stat.st_mtime, stat.st_size]
+
+
+def get_library_materials(paths):
+    """Return the names of the materials in each library.
+
+    Libraries that haven't changed since they were last listed are read from
+    the manifest rather than opened.
+
+    Args:
+        paths (list[str]): paths to .blend files
+
+    Returns:
+        dict: material names keyed by library path
+    """
+    manifest = load_library_manifest()
+    changed = False
+    library_materials = {}
+
+    for path in paths:
+        signature = get_file_signature(path)
+        entry = manifest.get(path)
+        if entry is None or entry['signature'] != signature:
+            with bpy.data.libraries.load(path) as (data_from, data_to):
+                materials = list(data_from.materials)
+            entry = {'signature': signature, 'materials': materials}
+            manifest[path] = entry
+            changed = True
+        library_materials[path] = entry['materials']
+
+    if changed:
+        save_library_manifest(manifest)
+    return library_materials
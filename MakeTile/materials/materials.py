@@ -1,12 +1,12 @@
 import os
 import bpy
+import numpy as np
 from pathlib import Path
 from .. utils.registration import get_prefs
 from ..lib.utils.utils import slugify
 from ..lib.utils.file_handling import find_and_rename
-from .. lib.utils.vertex_groups import (
-    get_verts_in_vert_group,
-    get_vert_indexes_in_vert_group)
+from .. lib.utils.mesh_analysis import get_loop_arrays
+from .. lib.utils.vertex_groups import get_vert_group_mask
 
 
 def load_materials(filepath):
@@ -25,6 +25,30 @@ def load_materials(filepath):
             bpy.data.materials.remove(new_mat)
 
 
+def get_default_material(name):
+    """Return a material, linking it from its default material library the first time it is used.
+
+    Args:
+        name (str): material name
+
+    Raises:
+        KeyError: if the material is neither in the file nor a default material
+
+    Returns:
+        bpy.types.Material: material
+    """
+    if name in bpy.data.materials:
+        return bpy.data.materials[name]
+
+    prefs = get_prefs()
+    for mat in prefs.default_materials:
+        if mat.name == name and os.path.exists(mat.filepath):
+            with bpy.data.libraries.load(mat.filepath, link=True) as (data_from, data_to):
+                data_to.materials = [name]
+            break
+    return bpy.data.materials[name]
+
+
 def get_blend_filenames(directory_path):
     blend_filenames = []
     if os.path.exists(directory_path):
@@ -49,6 +73,25 @@ def get_material_index(obj, material):
     return material_index
 
 
+def get_faces_in_vert_group(vert_group_name, obj):
+    """Return a boolean mask of the polygons whose vertices are all in a vertex group.
+
+    Args:
+        vert_group_name (str): vertex group name
+        obj (bpy.types.Object): Owning object
+
+    Returns:
+        numpy.ndarray: mask
+    """
+    mesh = obj.data
+    group_index = obj.vertex_groups[vert_group_name].index
+    in_group = get_vert_group_mask(mesh, group_index).astype(np.int8)
+    loop_verts, loop_starts, loop_totals = get_loop_arrays(mesh)
+    if len(loop_starts) == 0:
+        return np.zeros(0, dtype=bool)
+    return np.minimum.reduceat(in_group[loop_verts], loop_starts).astype(bool)
+
+
 def assign_mat_to_vert_group(vert_group, obj, material):
     """Assign the passed in material to the passed in vertex group.
 
@@ -57,15 +100,13 @@ def assign_mat_to_vert_group(vert_group, obj, material):
         obj (bpy.types.Object): Owning object
         material (bpy.types.Material): material
     """
-    vert_group = get_vert_indexes_in_vert_group(vert_group, obj)
+    in_group = get_faces_in_vert_group(vert_group, obj)
     material_index = get_material_index(obj, material)
-    for poly in obj.data.polygons:
-        count = 0
-        for vert in poly.vertices:
-            if vert in vert_group:
-                count += 1
-        if count == len(poly.vertices):
-            poly.material_index = material_index
+    polys = obj.data.polygons
+    material_indices = np.empty(len(polys), dtype=np.int32)
+    polys.foreach_get('material_index', material_indices)
+    material_indices[in_group] = material_index
+    polys.foreach_set('material_index', material_indices)
 
 
 def get_vert_group_material(vert_group, obj):
@@ -78,14 +119,10 @@ def get_vert_group_material(vert_group, obj):
     Returns:
         bpy.types.Material: material
     """
-    vert_group = get_vert_indexes_in_vert_group(vert_group.name, obj)
-    for poly in obj.data.polygons:
-        count = 0
-        for vert in poly.vertices:
-            if vert in vert_group:
-                count += 1
-        if count == len(poly.vertices):
-            return obj.material_slots[poly.material_index].material
+    in_group = np.flatnonzero(get_faces_in_vert_group(vert_group.name, obj))
+    if len(in_group):
+        poly = obj.data.polygons[int(in_group[0])]
+        return obj.material_slots[poly.material_index].material
 
 
 def add_preview_mesh_subsurf(obj):
@@ -1,14 +1,25 @@
 '''contains operator class for baking displacement maps to tiles'''
+import numpy as np
 import bpy
 from .. materials.materials import (
     assign_mat_to_vert_group,
     get_vert_group_material,
-    get_material_index)
+    get_material_index,
+    get_default_material)
 from .. lib.utils.vertex_groups import (
     get_verts_with_material,
     clear_vert_group)
 from .. utils.registration import get_prefs
 from ..lib.utils.selection import deselect_all, select, activate
+from ..lib.utils.utils import get_unit_multiplier
+from ..lib.utils.mesh_analysis import get_loop_arrays, get_next_loops
+from ..lib.utils.collections import get_objects_owning_collections
+from ..lib.utils.memory import get_image_bytes, get_memory_headroom, format_bytes
+
+# smallest resolution we will bake at in AUTO mode or when downscaling to fit the memory budget
+MIN_BAKE_RESOLUTION = 256
+MAX_BAKE_RESOLUTION = 8192
+BAKE_MARGIN = 10
 
 class MT_OT_Assign_Material_To_Vert_Group(bpy.types.Operator):
     """Assigns the active material to the selected vertex group"""
@@ -28,7 +39,7 @@ class MT_OT_Assign_Material_To_Vert_Group(bpy.types.Operator):
         vert_group_name = active_obj.vertex_groups.active.name
 
         primary_material = context.object.active_material
-        secondary_material = bpy.data.materials[prefs.secondary_material]
+        secondary_material = get_default_material(prefs.secondary_material)
 
         selected_objects = context.selected_objects
 
@@ -79,7 +90,7 @@ class MT_OT_Remove_Material_From_Vert_Group(bpy.types.Operator):
         active_obj = context.active_object
         vert_group_name = active_obj.vertex_groups.active.name
 
-        secondary_material = bpy.data.materials[prefs.secondary_material]
+        secondary_material = get_default_material(prefs.secondary_material)
 
         selected_objects = context.selected_objects
 
@@ -127,37 +138,34 @@ class MT_OT_Make_3D(bpy.types.Operator):
     def execute(self, context):
         selected_objects = context.selected_objects
         orig_render_settings = set_cycles_to_bake_mode()
-
-        for obj in selected_objects:
-            obj_props = obj.mt_object_props
-
-            # if obj_props.geometry_type == 'PREVIEW':
-            if obj_props.is_displacement and not obj_props.is_displaced:
-                # tile = bpy.data.collections[obj_props.tile_name]
-                disp_strength = obj_props.displacement_strength
-                # disp_strength = context.scene.mt_scene_props.displacement_strength
-
-                disp_image = bake_displacement_map(obj)
-
-                disp_texture = obj_props.disp_texture
-                disp_texture.image = disp_image
-                disp_mod = obj.modifiers[obj_props.disp_mod_name]
-                disp_mod.texture = disp_texture
-                disp_mod.strength = disp_strength
-                subsurf_mod = obj.modifiers[obj_props.subsurf_mod_name]
-                #subsurf_mod.levels = bpy.context.scene.mt_scene_props.subdivisions
-                subsurf_mod.show_viewport = True
-
-                ctx = {
-                    'selected_objects': [obj],
-                    'selected_editable_objects': [obj],
-                    'active_object': obj,
-                    'object': obj}
-                bpy.ops.object.modifier_move_to_index(
-                    ctx, modifier=subsurf_mod.name, index=0)
-
-                # obj_props.geometry_type = 'DISPLACEMENT'
-                obj_props.is_displaced = True
+        budget = get_memory_budget(context.scene.mt_scene_props.bake_memory_budget)
+
+        to_bake = [obj for obj in selected_objects
+                   if obj.mt_object_props.is_displacement and not obj.mt_object_props.is_displaced]
+
+        if context.scene.mt_scene_props.atlas_bake and to_bake:
+            # one atlas per tile so cells are sized to objects of similar size
+            disp_images = {}
+            for tile_objs in group_by_tile(to_bake):
+                max_bytes, warning = fit_bake_to_memory_budget(context, tile_objs, budget, atlas=True)
+                if warning:
+                    self.report({'WARNING'}, warning)
+                tile_images = bake_displacement_atlas(tile_objs, max_bytes)
+                disp_images.update(tile_images)
+                if budget is not None:
+                    budget -= sum(get_image_bytes(img) for img in tile_images.values())
+        else:
+            disp_images = {}
+            for obj in to_bake:
+                max_bytes, warning = fit_bake_to_memory_budget(context, [obj], budget)
+                if warning:
+                    self.report({'WARNING'}, warning)
+                disp_images[obj] = bake_displacement_map(obj, max_bytes)
+                if budget is not None:
+                    budget -= get_image_bytes(disp_images[obj])
+
+        for obj, disp_image in disp_images.items():
+            set_to_displaced(obj, disp_image)
 
         reset_renderer_from_bake(orig_render_settings)
         return {'FINISHED'}
@@ -198,76 +206,201 @@ def reset_renderer_from_bake(orig_settings):
     context.scene.render.engine = orig_settings['orig_engine']
 
 
-def bake_displacement_map(obj):
-    """Bake a displacement map for an object with MakeTile displacement materials.
+def get_image_buffer_bytes(resolution, float_buffer):
+    """Return the size in bytes of a square RGBA image buffer.
+
+    Args:
+        resolution (int): width and height of image
+        float_buffer (bool): whether image uses a 32 bit float buffer
+
+    Returns:
+        int: size in bytes
+    """
+    bytes_per_channel = 4 if float_buffer else 1
+    return resolution * resolution * 4 * bytes_per_channel
+
+
+def get_memory_budget(megabytes):
+    """Return a memory budget set in the scene props in bytes.
+
+    bake_memory_budget limits the total size of the baked images kept in one run.
+    memory_budget limits the memory of the whole Blender process before each bake.
+
+    Args:
+        megabytes (int): budget in MB. 0 or less is unlimited
+
+    Returns:
+        int or None: budget in bytes. None if unlimited.
+    """
+    if megabytes <= 0:
+        return None
+    return megabytes * 1024 * 1024
+
+
+def estimate_bake_bytes(objs, max_bytes=None, atlas=False):
+    """Estimate the memory needed to bake objs in one go.
+
+    For an atlas bake this is the atlas, the float copy of its pixels that is read
+    back and the image each object's cell is copied into. The mesh isn't changed,
+    so objects without UVs are estimated at tile_resolution.
+
+    Args:
+        objs (list[bpy.types.Object]): objects
+        max_bytes (int, optional): maximum size of the baked images. Defaults to None.
+        atlas (bool, optional): whether objs are baked to an atlas. Defaults to False.
+
+    Returns:
+        tuple(int, int): bytes needed, bytes of the images that max_bytes limits
+    """
+    if not atlas or len(objs) == 1:
+        limited = sum(
+            get_image_buffer_bytes(*get_bake_image_settings(obj, max_bytes)) for obj in objs)
+        return limited, limited
+
+    cols, rows, cell_res, padding, float_buffer = get_atlas_settings(objs, max_bytes)
+    atlas_pixels = cell_res * cols * cell_res * rows
+    atlas_bytes = atlas_pixels * 4 * (4 if float_buffer else 1)
+    pixel_read_bytes = atlas_pixels * 4 * 4
+    split_bytes = len(objs) * get_image_buffer_bytes(cell_res - 2 * padding, float_buffer)
+    return atlas_bytes + pixel_read_bytes + split_bytes, atlas_bytes
+
+
+def fit_bake_to_memory_budget(context, objs, max_bytes=None, atlas=False):
+    """Check whether baking objs in one go would take Blender over the Blender memory budget.
+
+    If it would and the memory budget action is DOWNSCALE, max_bytes is lowered in
+    proportion to the memory that is left so the bake is downscaled to fit.
+
+    Args:
+        context (bpy.context): context
+        objs (list[bpy.types.Object]): objects to bake
+        max_bytes (int, optional): maximum size of the baked images. Defaults to None.
+        atlas (bool, optional): whether objs are baked to an atlas. Defaults to False.
+
+    Returns:
+        tuple(int, str): maximum size of the baked images, warning. warning is None if the bake fits.
+    """
+    headroom = get_memory_headroom(get_memory_budget(context.scene.mt_scene_props.memory_budget))
+    if headroom is None:
+        return max_bytes, None
+
+    required, limited = estimate_bake_bytes(objs, max_bytes, atlas)
+    if required <= headroom:
+        return max_bytes, None
+
+    warning = 'Baking {0} needs about {1} but only {2} of the Blender memory budget is left'.format(
+        ', '.join(obj.name for obj in objs),
+        format_bytes(required),
+        format_bytes(headroom))
+    if context.scene.mt_scene_props.memory_budget_action == 'DOWNSCALE':
+        warning += '. Downscaling bake'
+        fit_bytes = limited * headroom // required
+        max_bytes = fit_bytes if max_bytes is None else min(max_bytes, fit_bytes)
+    return max_bytes, warning
+
+
+def get_textured_face_mask(obj):
+    """Return a boolean array flagging faces that have a displacement material.
 
     Args:
         obj (bpy.types.Object): object
 
     Returns:
-        bpy.types.image: Displacement Map
+        numpy.ndarray: mask
     """
-    hide_render = obj.hide_render
-    obj.hide_render = False
-    context = bpy.context
-    prefs = get_prefs()
-    image_resolution = context.scene.mt_scene_props.tile_resolution
-    disp_image = bpy.data.images.new(
-        obj.name + '.image',
-        width=image_resolution,
-        height=image_resolution,
-        alpha=True,
-        float_buffer=False,
-        is_data=True
-    )
-    disp_image.file_format = 'PNG'
+    mesh = obj.data
+    disp_indices = [i for i, slot in enumerate(obj.material_slots)
+                    if slot.material and slot.material.node_tree
+                    and 'disp_emission' in slot.material.node_tree.nodes]
+    mat_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', mat_indices)
+    return np.isin(mat_indices, disp_indices)
 
-    disp_materials = []
-    mat_set = set()
-    for item in obj.material_slots.items():
-        if item[0]:
-            material = bpy.data.materials[item[0]]
-            tree = material.node_tree
-
-            if 'disp_emission' in tree.nodes and material not in mat_set:
-                # plug emission node into output for baking
-                disp_materials.append(material)
-                mat_set.add(material)
-                displacement_emission_node = tree.nodes['disp_emission']
-                mat_output_node = tree.nodes['Material Output']
-
-                tree.links.new(
-                    displacement_emission_node.outputs['Emission'],
-                    mat_output_node.inputs['Surface'])
-
-                # sever displacement node link because otherwise it screws up baking
-                displacement_node = tree.nodes['final_disp']
-                link = displacement_node.outputs[0].links[0]
-                tree.links.remove(link)
-
-                # save displacement strength
-                strength_node = tree.nodes['Strength']
-
-                # assign image to image node
-                texture_node = tree.nodes['disp_texture_node']
-                texture_node.image = disp_image
 
-    context.scene.render.bake_type = 'DISPLACEMENT'
-    context.scene.render.bake_margin = 10
+def get_uv_and_surface_area(obj, face_mask):
+    """Return the UV area and world space surface area of the masked faces.
 
-    ctx = {
-        'selected_objects': [obj],
-        'selected_editable_objects': [obj],
-        'selectable_objects': [obj],
-        'active_object': obj,
-        'object': obj,
-        'visible_objects': [obj],
-        'editable_objects': [obj],
-        'objects_in_mode': [obj]
-    }
+    Args:
+        obj (bpy.types.Object): object with a UV layer
+        face_mask (numpy.ndarray): faces to include
+
+    Returns:
+        tuple(float, float): uv_area, surface_area
+    """
+    mesh = obj.data
+    loop_verts, loop_starts, loop_totals = get_loop_arrays(mesh)
+    if len(loop_starts) == 0:
+        return 0, 0
+
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float64)
+    mesh.uv_layers.active.data.foreach_get('uv', uvs)
+    uvs = uvs.reshape((-1, 2))
+
+    # shoelace formula over each polygon's loops
+    nxt = get_next_loops(loop_starts, loop_totals, len(mesh.loops))
+    cross = uvs[:, 0] * uvs[nxt, 1] - uvs[nxt, 0] * uvs[:, 1]
+    uv_areas = np.abs(np.add.reduceat(cross, loop_starts)) * 0.5
+
+    areas = np.empty(len(mesh.polygons), dtype=np.float64)
+    mesh.polygons.foreach_get('area', areas)
+    scale = obj.matrix_world.to_scale()
+    area_scale = (abs(scale[0] * scale[1] * scale[2])) ** (2 / 3)
+
+    return float(uv_areas[face_mask].sum()), float(areas[face_mask].sum() * area_scale)
 
 
-    # check to see if there is a UV layer and if not make one. Can't get context override to work.
+def get_bake_image_settings(obj, max_bytes=None):
+    """Return the resolution and buffer type to bake obj's displacement map with.
+
+    In FIXED mode this is tile_resolution. In AUTO mode the resolution is chosen so that
+    the textured surface gets texel_density texels per mm and a float buffer is only used
+    if an 8 bit image can't resolve the displacement to within one texel. Objects without
+    a UV layer get tile_resolution. If max_bytes is passed in the image is downscaled
+    until it fits.
+
+    Args:
+        obj (bpy.types.Object): object
+        max_bytes (int, optional): maximum size of image buffer. Defaults to None.
+
+    Returns:
+        tuple(int, bool): resolution, float_buffer
+    """
+    scene_props = bpy.context.scene.mt_scene_props
+    resolution = scene_props.tile_resolution
+    float_buffer = False
+
+    if scene_props.bake_resolution_mode == 'AUTO':
+        unit_multiplier = get_unit_multiplier(scene_props.export_units)
+        # without UVs we can't measure texel density so fall back to tile_resolution
+        if len(obj.data.uv_layers) > 0:
+            uv_area, surface_area = get_uv_and_surface_area(obj, get_textured_face_mask(obj))
+            if uv_area > 0 and surface_area > 0:
+                surface_area_mm = surface_area * unit_multiplier ** 2
+                texels = scene_props.texel_density * (surface_area_mm / uv_area) ** 0.5
+                # round up to multiple of 128
+                resolution = int(-(-texels // 128) * 128)
+                resolution = max(MIN_BAKE_RESOLUTION, min(MAX_BAKE_RESOLUTION, resolution))
+
+        # 8 bit gives us 255 displacement steps
+        strength_mm = obj.mt_object_props.displacement_strength * unit_multiplier
+        float_buffer = strength_mm / 255 > 1 / scene_props.texel_density
+
+    if max_bytes is not None:
+        if get_image_buffer_bytes(resolution, float_buffer) > max_bytes:
+            float_buffer = False
+        while get_image_buffer_bytes(resolution, float_buffer) > max_bytes and resolution > MIN_BAKE_RESOLUTION:
+            resolution = max(MIN_BAKE_RESOLUTION, resolution // 2)
+
+    return resolution, float_buffer
+
+
+def ensure_uv_layer(obj):
+    """Smart UV project obj if it has no UV layer.
+
+    Args:
+        obj (bpy.types.Object): object
+    """
+    # Can't get context override to work.
     if len(obj.data.uv_layers) == 0:
         deselect_all()
         select(obj.name)
@@ -280,13 +413,53 @@ def bake_displacement_map(obj):
         bpy.ops.mesh.select_all(action='DESELECT')
         bpy.ops.object.editmode_toggle()
 
-    # bake
-    bpy.ops.object.bake(ctx, type='EMIT')
 
-    # pack image
-    disp_image.pack()
+def link_bake_materials(objs, disp_image):
+    """Plug the displacement emission node of each displacement material into its output for baking.
 
-    # reset shaders
+    Args:
+        objs (list[bpy.types.Object]): objects
+        disp_image (bpy.types.Image): image to bake to
+
+    Returns:
+        list[bpy.types.Material]: materials that have been changed
+    """
+    disp_materials = []
+    mat_set = set()
+    for obj in objs:
+        for item in obj.material_slots.items():
+            if item[0]:
+                material = bpy.data.materials[item[0]]
+                tree = material.node_tree
+
+                if 'disp_emission' in tree.nodes and material not in mat_set:
+                    # plug emission node into output for baking
+                    disp_materials.append(material)
+                    mat_set.add(material)
+                    displacement_emission_node = tree.nodes['disp_emission']
+                    mat_output_node = tree.nodes['Material Output']
+
+                    tree.links.new(
+                        displacement_emission_node.outputs['Emission'],
+                        mat_output_node.inputs['Surface'])
+
+                    # sever displacement node link because otherwise it screws up baking
+                    displacement_node = tree.nodes['final_disp']
+                    link = displacement_node.outputs[0].links[0]
+                    tree.links.remove(link)
+
+                    # assign image to image node
+                    texture_node = tree.nodes['disp_texture_node']
+                    texture_node.image = disp_image
+    return disp_materials
+
+
+def reset_bake_materials(disp_materials):
+    """Reset shaders changed by link_bake_materials.
+
+    Args:
+        disp_materials (list[bpy.types.Material]): materials
+    """
     for material in disp_materials:
         tree = material.node_tree
         surface_shader_node = tree.nodes['surface_shader']
@@ -297,6 +470,38 @@ def bake_displacement_map(obj):
         tree.links.new(
             displacement_node.outputs['Displacement'], mat_output_node.inputs['Displacement'])
 
+
+def bake_objects(objs):
+    """Bake the emission of objs in a single Cycles bake.
+
+    Args:
+        objs (list[bpy.types.Object]): objects
+    """
+    context = bpy.context
+    context.scene.render.bake_type = 'DISPLACEMENT'
+    context.scene.render.bake_margin = BAKE_MARGIN
+
+    ctx = {
+        'selected_objects': objs,
+        'selected_editable_objects': objs,
+        'selectable_objects': objs,
+        'active_object': objs[0],
+        'object': objs[0],
+        'visible_objects': objs,
+        'editable_objects': objs,
+        'objects_in_mode': objs
+    }
+
+    bpy.ops.object.bake(ctx, type='EMIT')
+
+
+def assign_secondary_material_after_bake(obj):
+    """Store the object's preview materials and assign the secondary material to the entire mesh.
+
+    Args:
+        obj (bpy.types.Object): object
+    """
+    prefs = get_prefs()
     preview_materials = obj.mt_object_props.preview_materials
     preview_materials.clear()
 
@@ -310,16 +515,290 @@ def bake_displacement_map(obj):
     # We do this because when the mesh is being displaced we want to see what the actual geometry is without any texture
     try:
         sec_mat_index = get_material_index(
-            obj, bpy.data.materials[prefs.secondary_material])
+            obj, get_default_material(prefs.secondary_material))
     except ValueError:
         # we may need to add in ther secondary material if the user has used Blender's internal
         # asset browser or linked the collection in manually
-        obj.data.materials.append(bpy.data.materials[prefs.secondary_material])
+        obj.data.materials.append(get_default_material(prefs.secondary_material))
         sec_mat_index = get_material_index(
-            obj, bpy.data.materials[prefs.secondary_material])
+            obj, get_default_material(prefs.secondary_material))
 
     for poly in obj.data.polygons:
         poly.material_index = sec_mat_index
 
-    obj.hide_render = hide_render
+
+def bake_displacement_map(obj, max_bytes=None):
+    """Bake a displacement map for an object with MakeTile displacement materials.
+
+    Args:
+        obj (bpy.types.Object): object
+        max_bytes (int, optional): maximum size of the image buffer. Defaults to None.
+
+    Returns:
+        bpy.types.image: Displacement Map
+    """
+    hide_render = obj.hide_render
+    obj.hide_render = False
+
+    # check to see if there is a UV layer and if not make one.
+    ensure_uv_layer(obj)
+
+    image_resolution, float_buffer = get_bake_image_settings(obj, max_bytes)
+    disp_image = bpy.data.images.new(
+        obj.name + '.image',
+        width=image_resolution,
+        height=image_resolution,
+        alpha=True,
+        float_buffer=float_buffer,
+        is_data=True
+    )
+    disp_image.file_format = 'PNG'
+
+    disp_materials = []
+    try:
+        disp_materials = link_bake_materials([obj], disp_image)
+
+        # bake
+        bake_objects([obj])
+
+        # pack image
+        disp_image.pack()
+    except Exception:
+        bpy.data.images.remove(disp_image)
+        raise
+    finally:
+        reset_bake_materials(disp_materials)
+        obj.hide_render = hide_render
+
+    assign_secondary_material_after_bake(obj)
+    return disp_image
+
+
+def get_atlas_layout(num_objs):
+    """Return the number of columns and rows of an atlas containing num_objs cells.
+
+    Args:
+        num_objs (int): number of objects
+
+    Returns:
+        tuple(int, int): columns, rows
+    """
+    cols = 1
+    while cols * cols < num_objs:
+        cols += 1
+    rows = -(-num_objs // cols)
+    return cols, rows
+
+
+def get_atlas_settings(objs, max_bytes=None):
+    """Return the layout and buffer type of the atlas objs are baked to.
+
+    Args:
+        objs (list[bpy.types.Object]): objects
+        max_bytes (int, optional): maximum size of the atlas buffer. Defaults to None.
+
+    Returns:
+        tuple(int, int, int, int, bool): columns, rows, cell resolution including padding, padding, float_buffer
+    """
+    # gap between cells so bake margins don't bleed into neighbouring cells
+    padding = BAKE_MARGIN
+    cols, rows = get_atlas_layout(len(objs))
+    settings = [get_bake_image_settings(obj) for obj in objs]
+    cell_res = max(res for res, float_buffer in settings) + 2 * padding
+    float_buffer = any(float_buffer for res, float_buffer in settings)
+
+    if max_bytes is not None:
+        bytes_per_pixel = 16 if float_buffer else 4
+        while cell_res * cell_res * cols * rows * bytes_per_pixel > max_bytes \
+                and cell_res - 2 * padding > MIN_BAKE_RESOLUTION:
+            cell_res = (cell_res - 2 * padding) // 2 + 2 * padding
+    return cols, rows, cell_res, padding, float_buffer
+
+
+def set_atlas_uvs(obj, cell_index, cols, rows, cell_res, padding):
+    """Add an atlas UV layer to obj that maps its active UVs into a cell of the atlas.
+
+    Args:
+        obj (bpy.types.Object): object
+        cell_index (int): index of cell
+        cols (int): number of atlas columns
+        rows (int): number of atlas rows
+        cell_res (int): size of each cell in pixels including padding
+        padding (int): padding around each cell in pixels
+
+    Returns:
+        tuple(bpy.types.MeshUVLoopLayer, bpy.types.MeshUVLoopLayer): original active layer, atlas layer
+    """
+    mesh = obj.data
+    orig_layer = mesh.uv_layers.active
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    orig_layer.data.foreach_get('uv', uvs)
+    uvs = uvs.reshape((-1, 2))
+
+    col = cell_index % cols
+    row = cell_index // cols
+    inner = cell_res - 2 * padding
+    uvs[:, 0] = (col * cell_res + padding + uvs[:, 0] * inner) / (cols * cell_res)
+    uvs[:, 1] = (row * cell_res + padding + uvs[:, 1] * inner) / (rows * cell_res)
+
+    atlas_layer = mesh.uv_layers.new(name='mt_atlas')
+    atlas_layer.data.foreach_set('uv', uvs.ravel())
+    mesh.uv_layers.active = atlas_layer
+    return orig_layer, atlas_layer
+
+
+def split_atlas(pixels, obj, cell_index, cols, cell_res, padding, float_buffer):
+    """Copy obj's cell out of the atlas into its own displacement map.
+
+    Args:
+        pixels (numpy.ndarray): atlas pixels of shape (height, width, 4)
+        obj (bpy.types.Object): object
+        cell_index (int): index of cell
+        cols (int): number of atlas columns
+        cell_res (int): size of each cell in pixels including padding
+        padding (int): padding around each cell in pixels
+        float_buffer (bool): use a float buffer
+
+    Returns:
+        bpy.types.Image: displacement map
+    """
+    col = cell_index % cols
+    row = cell_index // cols
+    inner = cell_res - 2 * padding
+    x = col * cell_res + padding
+    y = row * cell_res + padding
+    cell = np.ascontiguousarray(pixels[y:y + inner, x:x + inner])
+
+    disp_image = bpy.data.images.new(
+        obj.name + '.image',
+        width=inner,
+        height=inner,
+        alpha=True,
+        float_buffer=float_buffer,
+        is_data=True
+    )
+    disp_image.file_format = 'PNG'
+    disp_image.pixels.foreach_set(cell.ravel())
+    disp_image.pack()
     return disp_image
+
+
+def bake_displacement_atlas(objs, max_bytes=None):
+    """Bake the displacement maps of several objects in a single Cycles bake.
+
+    Each object's UVs are packed into a cell of a shared atlas which is
+    then split back into one displacement map per object. This means
+    we only pay the cost of Cycles syncing the scene once.
+
+    Args:
+        objs (list[bpy.types.Object]): objects
+        max_bytes (int, optional): maximum size of the atlas buffer. Defaults to None.
+
+    Returns:
+        dict{bpy.types.Object: bpy.types.Image}: displacement map for each object
+    """
+    if len(objs) == 1:
+        return {objs[0]: bake_displacement_map(objs[0], max_bytes)}
+
+    hide_render = {obj: obj.hide_render for obj in objs}
+    for obj in objs:
+        obj.hide_render = False
+        ensure_uv_layer(obj)
+
+    cols, rows, cell_res, padding, float_buffer = get_atlas_settings(objs, max_bytes)
+
+    atlas = bpy.data.images.new(
+        'mt_atlas.image',
+        width=cell_res * cols,
+        height=cell_res * rows,
+        alpha=True,
+        float_buffer=float_buffer,
+        is_data=True
+    )
+
+    uv_layers = {}
+    disp_materials = []
+    disp_images = {}
+    try:
+        for i, obj in enumerate(objs):
+            uv_layers[obj] = set_atlas_uvs(obj, i, cols, rows, cell_res, padding)
+
+        disp_materials = link_bake_materials(objs, atlas)
+        bake_objects(objs)
+
+        # read the atlas once and slice each object's cell out of it
+        width, height = atlas.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        atlas.pixels.foreach_get(pixels)
+        pixels = pixels.reshape((height, width, 4))
+
+        for i, obj in enumerate(objs):
+            disp_images[obj] = split_atlas(pixels, obj, i, cols, cell_res, padding, float_buffer)
+    except Exception:
+        # don't leave half baked images behind
+        for disp_image in disp_images.values():
+            bpy.data.images.remove(disp_image)
+        raise
+    finally:
+        reset_bake_materials(disp_materials)
+        for obj, (orig_layer, atlas_layer) in uv_layers.items():
+            obj.data.uv_layers.active = orig_layer
+            obj.data.uv_layers.remove(atlas_layer)
+        for obj in objs:
+            obj.hide_render = hide_render[obj]
+        bpy.data.images.remove(atlas)
+
+    for obj in objs:
+        assign_secondary_material_after_bake(obj)
+    return disp_images
+
+
+def group_by_tile(objs):
+    """Group objects by the tile collection they belong to.
+
+    Args:
+        objs (list[bpy.types.Object]): objects
+
+    Returns:
+        list[list[bpy.types.Object]]: objects in each tile. Objects not in a tile are grouped together.
+    """
+    groups = {}
+    for obj in objs:
+        tile_name = None
+        for collection in get_objects_owning_collections(obj.name):
+            if collection.mt_tile_props.is_mt_collection:
+                tile_name = collection.name
+                break
+        groups.setdefault(tile_name, []).append(obj)
+    return list(groups.values())
+
+
+def set_to_displaced(obj, disp_image, subdivs=None):
+    """Use disp_image to displace obj.
+
+    Args:
+        obj (bpy.types.Object): displacement object
+        disp_image (bpy.types.Image): baked displacement map
+        subdivs (int, optional): subsurf levels to use. Defaults to None.
+    """
+    obj_props = obj.mt_object_props
+    disp_texture = obj_props.disp_texture
+    disp_texture.image = disp_image
+    disp_mod = obj.modifiers[obj_props.disp_mod_name]
+    disp_mod.texture = disp_texture
+    disp_mod.mid_level = 0
+    disp_mod.strength = obj_props.displacement_strength
+    subsurf_mod = obj.modifiers[obj_props.subsurf_mod_name]
+    if subdivs is not None:
+        subsurf_mod.levels = subdivs
+    subsurf_mod.show_viewport = True
+
+    ctx = {
+        'selected_objects': [obj],
+        'selected_editable_objects': [obj],
+        'active_object': obj,
+        'object': obj}
+    bpy.ops.object.modifier_move_to_index(
+        ctx, modifier=subsurf_mod.name, index=0)
+
+    obj_props.is_displaced = True
@@ -1,8 +1,9 @@
-import textwrap
-import addon_utils
+import time
 from math import radians
 import bpy
+import bmesh
 from bpy.types import Panel, Operator
+from ..lib.utils.mesh_analysis import get_triangle_count
 
 
 class MT_PT_Decimator_Panel(Panel):
@@ -47,8 +48,14 @@ class MT_OT_Object_Decimator(Operator):
         merge = scene_props.decimation_merge
         selected_objects = [obj for obj in context.selected_editable_objects if obj.type == 'MESH']
 
+        tris_before = 0
+        tris_after = 0
+        elapsed = 0
         for obj in selected_objects:
-            decimate(context, obj)
+            stats = decimate(context, obj)
+            tris_before += stats['tris_before']
+            tris_after += stats['tris_after']
+            elapsed += stats['time']
 
         ctx = {
             'selected_objects': selected_objects,
@@ -60,34 +67,61 @@ class MT_OT_Object_Decimator(Operator):
         if merge is True:
             bpy.ops.object.join(ctx)
 
+        self.report(
+            {'INFO'},
+            f'Decimated {len(selected_objects)} objects from {tris_before} to {tris_after} triangles in {elapsed:.2f}s.')
         return {'FINISHED'}
 
 
 def decimate(context, obj):
     """Decimate the passed in object using the setting in mt_scene_props.
 
+    Collapse decimation and planar decimation are done in one pass. The object's
+    modifier stack and a collapse decimate modifier are evaluated once, planar
+    decimation is done in bmesh and the result is written back to the object's
+    mesh so we don't leave orphaned meshes behind.
+
     Args:
         obj (bpy.types.Object): object
+
+    Returns:
+        dict: triangle count before and after decimation and time taken.
+            The before count is of the object's mesh before modifiers are applied.
     """
     props = context.scene.mt_scene_props
+    start_time = time.time()
+    tris_before = get_triangle_count(obj.data)
 
     if props.decimation_ratio < 1:
-        mod = obj.modifiers.new('Decimation 1', 'DECIMATE')
+        mod = obj.modifiers.new('Decimation', 'DECIMATE')
         mod.ratio = props.decimation_ratio
 
-    depsgraph = context.evaluated_depsgraph_get()
-    object_eval = obj.evaluated_get(depsgraph)
-    mesh_from_eval = bpy.data.meshes.new_from_object(object_eval)
-    obj.modifiers.clear()
+    bm = bmesh.new()
+    if len(obj.modifiers) > 0:
+        # apply all modifiers including decimation in one evaluation
+        depsgraph = context.evaluated_depsgraph_get()
+        object_eval = obj.evaluated_get(depsgraph)
+        bm.from_mesh(object_eval.to_mesh())
+        object_eval.to_mesh_clear()
+        obj.modifiers.clear()
+    else:
+        bm.from_mesh(obj.data)
 
-    obj.data = mesh_from_eval
     if props.planar_decimation:
-        mod = obj.modifiers.new('Decimation 2', 'DECIMATE')
-        mod.decimate_type = 'DISSOLVE'
-        mod.angle_limit = radians(props.planar_decimation_angle)
-
-    depsgraph = context.evaluated_depsgraph_get()
-    object_eval = obj.evaluated_get(depsgraph)
-    mesh_from_eval = bpy.data.meshes.new_from_object(object_eval)
-    obj.modifiers.clear()
-    obj.data = mesh_from_eval
+        bmesh.ops.dissolve_limit(
+            bm,
+            angle_limit=radians(props.planar_decimation_angle),
+            verts=bm.verts,
+            edges=bm.edges)
+
+    # don't overwrite mesh data shared with other objects
+    if obj.data.users > 1:
+        obj.data = bpy.data.meshes.new(obj.data.name)
+    bm.to_mesh(obj.data)
+    bm.free()
+    obj.data.update()
+
+    return {
+        'tris_before': tris_before,
+        'tris_after': get_triangle_count(obj.data),
+        'time': time.time() - start_time}
@@ -0,0 +1,233 @@
+"""Contains functions for applying baked displacement maps to meshes on the CPU.
+
+This is an alternative to letting the subsurf and displacement modifiers do the
+work on export. Only faces in the displacement vertex group are subdivided and the
+baked image is sampled once and applied in bulk using numpy.
+"""
+import bmesh
+import numpy as np
+import bpy
+from ..lib.utils.mesh_analysis import get_loop_arrays
+from ..lib.utils.vertex_groups import get_vert_group_mask
+
+# name of the temporary face attribute used to track textured faces through subdivision
+TEXTURED_FACE_ATTR = 'mt_textured'
+
+
+def read_image_pixels(image):
+    """Return the pixels of an image as an array of shape (height, width, channels).
+
+    Args:
+        image (bpy.types.Image): image
+
+    Returns:
+        numpy.ndarray: pixels
+    """
+    width, height = image.size
+    channels = image.channels
+    pixels = np.empty(width * height * channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape((height, width, channels))
+
+
+def sample_image_bilinear(pixels, uvs):
+    """Return the intensity of an image at each uv using bilinear interpolation.
+
+    Intensity is the average of the RGB channels, which matches what the
+    displace modifier uses. UVs outside 0 - 1 wrap around.
+
+    Args:
+        pixels (numpy.ndarray): pixels of shape (height, width, channels)
+        uvs (numpy.ndarray): uv coordinates of shape (n, 2)
+
+    Returns:
+        numpy.ndarray: intensities of shape (n,)
+    """
+    height, width = pixels.shape[:2]
+    channels = min(pixels.shape[2], 3)
+    intensity = pixels[:, :, :channels].mean(axis=2)
+
+    x = uvs[:, 0] * width - 0.5
+    y = uvs[:, 1] * height - 0.5
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = x - x0
+    fy = y - y0
+
+    x0 = x0.astype(np.int64) % width
+    y0 = y0.astype(np.int64) % height
+    x1 = (x0 + 1) % width
+    y1 = (y0 + 1) % height
+
+    top = intensity[y0, x0] * (1 - fx) + intensity[y0, x1] * fx
+    bottom = intensity[y1, x0] * (1 - fx) + intensity[y1, x1] * fx
+    return top * (1 - fy) + bottom * fy
+
+
+def tag_textured_faces(mesh, vert_mask):
+    """Store which faces have all their vertices in vert_mask in a face attribute.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        vert_mask (numpy.ndarray): vertex mask
+
+    Returns:
+        int: number of textured faces
+    """
+    loop_verts, loop_starts, loop_totals = get_loop_arrays(mesh)
+    if len(loop_starts) == 0:
+        return 0
+    tags = np.minimum.reduceat(vert_mask[loop_verts].astype(np.int32), loop_starts)
+    attr = mesh.attributes.new(TEXTURED_FACE_ATTR, 'INT', 'FACE')
+    attr.data.foreach_set('value', tags)
+    return int(tags.sum())
+
+
+def subdivide_textured_faces(mesh, subdivs):
+    """Subdivide only those faces tagged as textured.
+
+    Untextured faces that share an edge with a textured face gain the new
+    vertices on that edge, so they are poked into triangles rather than left
+    as n-gons with vertices part way along their sides.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        subdivs (int): equivalent subsurf levels
+    """
+    if subdivs <= 0:
+        return
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    layer = bm.faces.layers.int[TEXTURED_FACE_ATTR]
+    edges = {e for f in bm.faces if f[layer] for e in f.edges}
+    if edges:
+        num_orig_verts = len(bm.verts)
+        bmesh.ops.subdivide_edges(
+            bm,
+            edges=list(edges),
+            cuts=2 ** subdivs - 1,
+            use_grid_fill=True)
+        bm.verts.index_update()
+        split_faces = [f for f in bm.faces
+                       if not f[layer] and any(v.index >= num_orig_verts for v in f.verts)]
+        if split_faces:
+            bmesh.ops.poke(bm, faces=split_faces)
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+def apply_displacement(mesh, image, strength, subdivs, group_index):
+    """Subdivide and displace the textured part of a mesh using a baked displacement map.
+
+    Equivalent to a simple subsurf modifier followed by a displace modifier with its
+    mid level set to 0, but only textured faces are subdivided.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh to displace. Must have a UV layer.
+        image (bpy.types.Image): baked displacement map
+        strength (float): displacement strength
+        subdivs (int): subdivision levels
+        group_index (int): index of the displacement vertex group
+
+    Returns:
+        int: number of displaced vertices
+    """
+    if len(mesh.uv_layers) == 0:
+        return 0
+
+    vert_mask = get_vert_group_mask(mesh, group_index)
+    if not tag_textured_faces(mesh, vert_mask):
+        if TEXTURED_FACE_ATTR in mesh.attributes:
+            mesh.attributes.remove(mesh.attributes[TEXTURED_FACE_ATTR])
+        return 0
+
+    subdivide_textured_faces(mesh, subdivs)
+
+    num_verts = len(mesh.vertices)
+    loop_verts, loop_starts, loop_totals = get_loop_arrays(mesh)
+
+    tags = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.attributes[TEXTURED_FACE_ATTR].data.foreach_get('value', tags)
+    mesh.attributes.remove(mesh.attributes[TEXTURED_FACE_ATTR])
+
+    # vertices belonging to textured faces
+    displaced = np.zeros(num_verts, dtype=bool)
+    displaced[loop_verts[np.repeat(tags, loop_totals).astype(bool)]] = True
+
+    # per vertex uvs. As in the displace modifier the last loop wins at seams
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get('uv', uvs)
+    texco = np.zeros((num_verts, 2), dtype=np.float32)
+    texco[loop_verts] = uvs.reshape((-1, 2))
+
+    co = np.empty(num_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape((-1, 3))
+    mesh.calc_normals()
+    normals = np.empty(num_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('normal', normals)
+    normals = normals.reshape((-1, 3))
+
+    pixels = read_image_pixels(image)
+    values = sample_image_bilinear(pixels, texco[displaced])
+    co[displaced] += normals[displaced] * (values * strength)[:, None]
+
+    mesh.vertices.foreach_set('co', co.ravel())
+    mesh.update()
+    return int(displaced.sum())
+
+
+def disable_displacement_modifiers(obj):
+    """Hide the subsurf and displacement modifiers of a displacement object.
+
+    Args:
+        obj (bpy.types.Object): object
+
+    Returns:
+        dict: original show_viewport state keyed by modifier name
+    """
+    props = obj.mt_object_props
+    orig_state = {}
+    for mod_name in (props.subsurf_mod_name, props.disp_mod_name):
+        if mod_name in obj.modifiers:
+            mod = obj.modifiers[mod_name]
+            orig_state[mod_name] = mod.show_viewport
+            mod.show_viewport = False
+    return orig_state
+
+
+def restore_displacement_modifiers(obj, orig_state):
+    """Restore modifier visibility saved by disable_displacement_modifiers.
+
+    Args:
+        obj (bpy.types.Object): object
+        orig_state (dict): original show_viewport state keyed by modifier name
+    """
+    for mod_name, show_viewport in orig_state.items():
+        if mod_name in obj.modifiers:
+            obj.modifiers[mod_name].show_viewport = show_viewport
+
+
+def displace_evaluated_mesh(obj, mesh, subdivs):
+    """Apply the baked displacement of obj to mesh, a copy of its evaluated mesh.
+
+    Args:
+        obj (bpy.types.Object): displacement object that has been baked
+        mesh (bpy.types.Mesh): mesh evaluated with displacement modifiers disabled
+        subdivs (int): subdivision levels
+
+    Returns:
+        int: number of displaced vertices
+    """
+    props = obj.mt_object_props
+    if 'disp_mod_vert_group' not in obj.vertex_groups:
+        return 0
+    disp_texture = props.disp_texture
+    if disp_texture is None or disp_texture.image is None:
+        return 0
+    return apply_displacement(
+        mesh,
+        disp_texture.image,
+        props.displacement_strength,
+        subdivs,
+        obj.vertex_groups['disp_mod_vert_group'].index)
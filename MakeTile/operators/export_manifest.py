@@ -0,0 +1,347 @@
+"""Contains functions for incremental export.
+
+Each exported variant is named after a hash of everything that affects its
+geometry. A manifest in the export directory records which hashes have
+already been exported so unchanged tiles can be skipped.
+"""
+import os
+import json
+import hashlib
+from datetime import datetime
+import numpy as np
+
+MANIFEST_FILENAME = 'maketile_export_manifest.json'
+
+# scene props that affect the exported geometry
+EXPORT_OPTIONS = [
+    'export_units',
+    'export_subdivs',
+    'export_displacement_method',
+    'bake_resolution_mode',
+    'tile_resolution',
+    'texel_density',
+    'atlas_bake',
+    'voxelise_on_export',
+    'voxel_size_mode',
+    'target_triangles',
+    'min_feature_size',
+    'voxel_size',
+    'voxel_adaptivity',
+    'voxel_chunked',
+    'max_chunk_voxels',
+    'decimate_on_export',
+    'decimation_ratio',
+    'planar_decimation',
+    'planar_decimation_angle',
+    'fix_non_manifold']
+
+# modifier properties that only affect how the modifier is shown in the UI
+MODIFIER_UI_PROPS = {
+    'rna_type',
+    'name',
+    'show_expanded',
+    'show_in_editmode',
+    'show_on_cage',
+    'show_render',
+    'is_active',
+    'is_override_data_editable'}
+
+
+def to_hashable(value):
+    """Return value in a form that can be serialised to json consistently.
+
+    Args:
+        value (any): value
+
+    Returns:
+        any: json serialisable value
+    """
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    if isinstance(value, (set, frozenset)):
+        return sorted(to_hashable(v) for v in value)
+    if hasattr(value, 'name') and hasattr(value, 'rna_type'):
+        return value.name
+    try:
+        return [to_hashable(v) for v in value]
+    except TypeError:
+        return str(value)
+
+
+def hash_data(data):
+    """Return a sha1 hex digest of json serialisable data.
+
+    Args:
+        data (any): data
+
+    Returns:
+        str: hex digest
+    """
+    serialised = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha1(serialised.encode('utf-8')).hexdigest()
+
+
+def get_material_settings(material):
+    """Return the unlinked input values of a material's nodes, excluding the seed.
+
+    Args:
+        material (bpy.types.Material): material
+
+    Returns:
+        dict: settings
+    """
+    settings = {}
+    if not material.node_tree:
+        return settings
+    for node in material.node_tree.nodes:
+        if node.name == 'Seed':
+            continue
+        values = {}
+        for socket in node.inputs:
+            if not socket.is_linked and hasattr(socket, 'default_value'):
+                values[socket.identifier] = to_hashable(socket.default_value)
+        if node.type == 'VALUE':
+            values['value'] = to_hashable(node.outputs[0].default_value)
+        if values:
+            settings[node.name] = values
+    return settings
+
+
+def get_seeds(obj):
+    """Return the seed values of obj's materials.
+
+    Args:
+        obj (bpy.types.Object): object
+
+    Returns:
+        list[float]: seeds
+    """
+    seeds = []
+    for slot in obj.material_slots:
+        material = slot.material
+        if material and material.node_tree and 'Seed' in material.node_tree.nodes:
+            seeds.append(round(material.node_tree.nodes['Seed'].outputs[0].default_value, 6))
+    return seeds
+
+
+def get_mesh_hash(mesh):
+    """Return a hash of a mesh's vertex coordinates and polygons.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        str: hex digest
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+
+    digest = hashlib.sha256()
+    for array in (co, loop_verts, loop_totals):
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def get_modifier_settings(mod, seen):
+    """Return the settings of a modifier including the objects it references.
+
+    Args:
+        mod (bpy.types.Modifier): modifier
+        seen (set[str]): names of objects already hashed, to avoid cycles
+
+    Returns:
+        dict: settings
+    """
+    settings = {'type': mod.type}
+    for prop in mod.bl_rna.properties:
+        key = prop.identifier
+        if key in MODIFIER_UI_PROPS or prop.type == 'COLLECTION':
+            continue
+        value = getattr(mod, key)
+        if prop.type != 'POINTER' or value is None:
+            settings[key] = to_hashable(value)
+        elif prop.fixed_type.identifier == 'Object':
+            settings[key] = get_object_settings(value, seen)
+        elif prop.fixed_type.identifier == 'Collection':
+            settings[key] = {
+                obj.name: get_object_settings(obj, seen) for obj in value.all_objects}
+        else:
+            settings[key] = to_hashable(value)
+    return settings
+
+
+def get_object_settings(obj, seen=None):
+    """Return the transform, mesh and modifiers of an object.
+
+    Objects referenced by the modifiers, such as boolean cutters, are included
+    so moving or editing a cutter changes the hash.
+
+    Args:
+        obj (bpy.types.Object): object
+        seen (set[str], optional): names of objects already hashed. Defaults to None.
+
+    Returns:
+        dict or str: settings, or the object's name if it has already been hashed
+    """
+    if seen is None:
+        seen = set()
+    if obj.name in seen:
+        return obj.name
+    seen.add(obj.name)
+    return {
+        'name': obj.name,
+        'matrix_world': to_hashable(obj.matrix_world),
+        'mesh': get_mesh_hash(obj.data) if obj.type == 'MESH' else None,
+        'modifiers': [
+            (mod.name, get_modifier_settings(mod, seen)) for mod in obj.modifiers]}
+
+
+def get_tile_hash(context, collection, visible_objects):
+    """Return a hash of everything except seeds that affects the exported tile.
+
+    Args:
+        context (bpy.context): context
+        collection (bpy.types.Collection): tile collection
+        visible_objects (list[bpy.types.Object]): objects that will be exported
+
+    Returns:
+        str: hex digest
+    """
+    scene_props = context.scene.mt_scene_props
+    tile_props = collection.mt_tile_props
+
+    data = {
+        'tile_props': {
+            key: to_hashable(getattr(tile_props, key))
+            for key in tile_props.__annotations__.keys()
+            if key not in ('tile_name', 'phase_timings')},
+        'export_options': {
+            key: to_hashable(getattr(scene_props, key)) for key in EXPORT_OPTIONS},
+        'objects': {},
+        'materials': {}}
+
+    for obj in visible_objects:
+        obj_props = obj.mt_object_props
+        data['objects'][obj.name] = {
+            'object': get_object_settings(obj),
+            'cutters': [(item.name, item.value) for item in obj_props.cutters_collection],
+            'displacement_strength': to_hashable(obj_props.displacement_strength)}
+
+        materials = [slot.material for slot in obj.material_slots if slot.material]
+        if obj_props.is_displacement and obj_props.is_displaced:
+            # while displaced the preview materials are stored on the object
+            materials += [mat.material for mat in obj_props.preview_materials if mat.material]
+        for material in materials:
+            data['materials'][material.name] = get_material_settings(material)
+
+    return hash_data(data)
+
+
+def get_variant_seed(tile_hash, variant):
+    """Return a deterministic seed for a variant of a tile.
+
+    Args:
+        tile_hash (str): hash of tile
+        variant (int): variant number
+
+    Returns:
+        float: seed between 0 and 1000
+    """
+    digest = hash_data([tile_hash, variant])
+    return int(digest[:8], 16) / 0xFFFFFFFF * 1000
+
+
+def get_variant_hash(tile_hash, seeds):
+    """Return the hash identifying an exported variant.
+
+    Args:
+        tile_hash (str): hash of tile
+        seeds (list[float]): seeds used for variant
+
+    Returns:
+        str: hex digest
+    """
+    return hash_data([tile_hash, [round(seed, 6) for seed in seeds]])
+
+
+def get_variant_filename(collection_name, variant_hash):
+    """Return the deterministic filename of an exported variant.
+
+    Args:
+        collection_name (str): name of tile collection
+        variant_hash (str): hash of variant
+
+    Returns:
+        str: filename
+    """
+    return collection_name + '.' + variant_hash[:16] + '.stl'
+
+
+def load_manifest(export_path):
+    """Load the export manifest from the export directory.
+
+    Args:
+        export_path (str): export directory
+
+    Returns:
+        dict: manifest keyed by variant hash
+    """
+    manifest_path = os.path.join(export_path, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path) as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError) as err:
+            print(err)
+    return {}
+
+
+def save_manifest(export_path, manifest):
+    """Save the export manifest to the export directory.
+
+    Args:
+        export_path (str): export directory
+        manifest (dict): manifest keyed by variant hash
+    """
+    manifest_path = os.path.join(export_path, MANIFEST_FILENAME)
+    with open(manifest_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=4, sort_keys=True)
+
+
+def is_exported(export_path, manifest, variant_hash):
+    """Return True if a variant with this hash has already been exported.
+
+    Args:
+        export_path (str): export directory
+        manifest (dict): manifest keyed by variant hash
+        variant_hash (str): hash of variant
+
+    Returns:
+        bool: whether the exported file exists
+    """
+    if variant_hash not in manifest:
+        return False
+    return os.path.exists(os.path.join(export_path, manifest[variant_hash]['file']))
+
+
+def add_to_manifest(manifest, variant_hash, filename, collection_name, variant):
+    """Record an exported variant in the manifest.
+
+    Args:
+        manifest (dict): manifest keyed by variant hash
+        variant_hash (str): hash of variant
+        filename (str): name of exported file
+        collection_name (str): name of tile collection
+        variant (int): variant number
+    """
+    manifest[variant_hash] = {
+        'file': filename,
+        'tile': collection_name,
+        'variant': variant,
+        'exported': datetime.now().isoformat(timespec='seconds')}
@@ -1,20 +1,53 @@
 import os
-import textwrap
+import time
+import traceback
 from random import random
 import bpy
-import addon_utils
 from bpy.types import Panel, PropertyGroup
 from bpy.props import BoolProperty, StringProperty, EnumProperty
 from bpy_extras.io_utils import ExportHelper
 from .. utils.registration import get_prefs
 from .voxeliser import voxelise, make_manifold
 from .decimator import decimate
+from .displacer import (
+    disable_displacement_modifiers,
+    restore_displacement_modifiers,
+    displace_evaluated_mesh)
 from .. lib.utils.collections import get_objects_owning_collections
+from .. lib.utils.utils import get_unit_multiplier
 from . bakedisplacement import (
     set_cycles_to_bake_mode,
     reset_renderer_from_bake,
-    bake_displacement_map)
+    bake_displacement_map,
+    bake_displacement_atlas,
+    set_to_displaced,
+    get_memory_budget,
+    fit_bake_to_memory_budget,
+    get_image_bytes)
 from . return_to_preview import set_to_preview
+from .mesh_analyser import (
+    analysis_results,
+    analyse_collection,
+    get_analysis_problems,
+    get_visible_tile_objects,
+    format_analysis)
+from .export_manifest import (
+    load_manifest,
+    save_manifest,
+    is_exported,
+    add_to_manifest,
+    get_tile_hash,
+    get_seeds,
+    get_variant_seed,
+    get_variant_hash,
+    get_variant_filename)
+from ..lib.utils.memory import (
+    memory_report,
+    track_memory,
+    reset_memory_report,
+    format_snapshot,
+    format_stage,
+    format_bytes)
 from ..enums.enums import units
 
 # TODO: Currently if you select an architectural element rather than a tile the exporter fails.
@@ -38,20 +71,6 @@ class MT_PT_Export_Panel(Panel):
         obj = context.object
         prefs = get_prefs()
 
-        char_width = 9  # TODO find a way of actually getting this rather than guessing
-        print_tools_txt = "For more options please enable the 3D print Tools addon included with blender."
-
-        # get panel width so we can line wrap print_tools_txt
-        tool_shelf = None
-        area = bpy.context.area
-
-        for region in area.regions:
-            if region.type == 'UI':
-                tool_shelf = region
-
-        width = tool_shelf.width / char_width
-        wrapped = textwrap.wrap(print_tools_txt, width)
-
         layout = self.layout
 
         layout.operator('scene.mt_export_tile', text='Export Tile')
@@ -68,18 +87,49 @@ class MT_PT_Export_Panel(Panel):
         layout.prop(scene_props, 'export_units')
         layout.prop(scene_props, 'voxelise_on_export')
         layout.prop(scene_props, 'randomise_on_export')
+        layout.prop(scene_props, 'incremental_export')
         layout.prop(scene_props, 'decimate_on_export')
         layout.prop(scene_props, 'export_subdivs')
+        layout.prop(scene_props, 'export_displacement_method')
+
+        layout.label(text="Bake Resolution")
+        layout.prop(scene_props, 'bake_resolution_mode', text="")
+        if scene_props.bake_resolution_mode == 'AUTO':
+            layout.prop(scene_props, 'texel_density')
+        else:
+            layout.prop(scene_props, 'tile_resolution')
+        layout.prop(scene_props, 'atlas_bake')
+
+        layout.label(text="Memory")
+        layout.operator('scene.mt_memory_report', text='Memory Report')
+        layout.prop(scene_props, 'bake_memory_budget')
+        layout.prop(scene_props, 'memory_budget')
+        layout.prop(scene_props, 'memory_budget_action')
+        if memory_report['snapshot'] is not None:
+            box = layout.box()
+            for line in format_snapshot(memory_report['snapshot']):
+                box.label(text=line)
+            for name, num_bytes in memory_report['largest_images']:
+                box.label(text=name + ': ' + format_bytes(num_bytes), icon='IMAGE_DATA')
+            for stage in memory_report['stages']:
+                box.label(text=format_stage(stage))
 
         if scene_props.randomise_on_export is True:
             layout.prop(scene_props, 'num_variants')
-
-        if addon_utils.check("object_print3d_utils") == (True, True):
-            layout.prop(scene_props, 'fix_non_manifold')
-        else:
-            for line in wrapped:
-                row = layout.row()
-                row.label(text=line)
+        layout.prop(scene_props, 'fix_non_manifold')
+
+        layout.label(text="Analysis")
+        layout.operator('scene.mt_analyse_tile', text='Analyse Tiles')
+        layout.prop(scene_props, 'analyse_on_export')
+        layout.prop(scene_props, 'nozzle_width')
+        for collection in get_objects_owning_collections(obj.name):
+            if collection.name in analysis_results:
+                results = analysis_results[collection.name]
+                box = layout.box()
+                for line in format_analysis(collection.name, results):
+                    box.label(text=line.strip())
+                for problem in get_analysis_problems(results):
+                    box.label(text=problem, icon='ERROR')
 
 
 class MT_OT_Export_Object(bpy.types.Operator, ExportHelper):
@@ -131,13 +181,7 @@ class MT_OT_Export_Object(bpy.types.Operator, ExportHelper):
         fix_non_manifold = self.make_manifold
 
         # Controls if we rescale on export
-        blend_units = self.export_units
-        if blend_units == 'CM':
-            unit_multiplier = 10
-        elif blend_units == 'INCHES':
-            unit_multiplier = 25.4
-        else:
-            unit_multiplier = 1
+        unit_multiplier = get_unit_multiplier(self.export_units)
 
         # The object to export
         obj = context.active_object
@@ -200,52 +244,129 @@ class MT_OT_Export_Object(bpy.types.Operator, ExportHelper):
         return {'FINISHED'}
 
 class MT_OT_Export_Tile_Variants(bpy.types.Operator):
+    """Exports all selected tiles.
+
+    When invoked from the UI this runs as a modal operator, exporting one
+    variant of one tile per timer tick so we can show progress and the
+    user can cancel with Esc.
+    """
     bl_idname = "scene.mt_export_tile"
     bl_label = "Export multiple tile variants"
     bl_options = {'REGISTER'}
     bl_description = "Exports all selected tiles."
 
+    _timer = None
+
     @classmethod
     def poll(cls, context):
         obj = context.object
         return obj is not None and obj.mode == 'OBJECT' and obj.mt_object_props.is_mt_object is True
 
+    def invoke(self, context, event):
+        if not self.start(context):
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self.units))
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel(context)
+            self.report({'INFO'}, 'Export cancelled. ' + self.get_summary())
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        try:
+            self.export_next_variant(context)
+        except Exception as err:
+            # remove our timer and restore tiles and renderer before giving up
+            traceback.print_exc()
+            self.cancel(context)
+            self.report({'ERROR'}, f'Export failed: {err}. ' + self.get_summary())
+            return {'CANCELLED'}
+
+        # update progress
+        num_done = self.num_units - len(self.units)
+        context.window_manager.progress_update(num_done)
+        elapsed = time.time() - self.start_time
+        eta = elapsed / num_done * len(self.units)
+        context.workspace.status_text_set(
+            f'MakeTile: Exported {num_done} of {self.num_units} tiles. '
+            f'About {eta:.0f}s remaining. Press Esc to cancel.')
+
+        if not self.units:
+            self.finish(context)
+            self.report({'INFO'}, self.get_summary())
+            return {'FINISHED'}
+
+        return {'RUNNING_MODAL'}
+
     def execute(self, context):
-        # set up exporter options
+        if not self.start(context):
+            return {'CANCELLED'}
+
+        try:
+            while self.units:
+                self.export_next_variant(context)
+        except Exception:
+            self.cancel(context)
+            raise
+
+        self.finish(context)
+        self.report({'INFO'}, self.get_summary())
+        return {'FINISHED'}
+
+    def get_summary(self):
+        """Return a summary of the export for reporting."""
+        summary = f'{self.num_exported} tiles exported to {self.export_path}.'
+        if self.num_skipped:
+            summary += f' {self.num_skipped} unchanged tiles skipped.'
+        return summary
+
+    def cancel(self, context):
+        """Reset any tiles we haven't finished and restore renderer settings."""
+        for collection_name in self.started:
+            self.reset_tile(collection_name)
+        self.started.clear()
+        self.finish(context)
+
+    def start(self, context):
+        """Set up exporter options and build the list of (collection, variant) units to export.
+
+        Returns:
+            bool: True if there is anything to export
+        """
         prefs = get_prefs()
         scene_props = context.scene.mt_scene_props
 
         # number of variants we will generate
         if scene_props.randomise_on_export:
-            num_variants = scene_props.num_variants
+            self.num_variants = scene_props.num_variants
         else:
-            num_variants = 1
-
-        # set cycles to bake mode and store original settings
-        orig_settings = set_cycles_to_bake_mode()
-
-        # voxelise options
-        voxelise_on_export = scene_props.voxelise_on_export
-
-        # decimate options
-        decimate_on_export = scene_props.decimate_on_export
+            self.num_variants = 1
 
         # ensure export path exists
-        export_path = prefs.default_export_path
-        if not os.path.exists(export_path):
-            os.mkdir(export_path)
+        self.export_path = prefs.default_export_path
+        if not os.path.exists(self.export_path):
+            os.mkdir(self.export_path)
 
         # Controls if we rescale on export
-        blend_units = scene_props.export_units
-        if blend_units == 'CM':
-            unit_multiplier = 10
-        elif blend_units == 'INCHES':
-            unit_multiplier = 25.4
-        else:
-            unit_multiplier = 1
+        self.unit_multiplier = get_unit_multiplier(scene_props.export_units)
+
+        # memory budget for baked images in this batch. Memory is returned to
+        # the budget when the images of earlier variants are freed
+        self.budget = get_memory_budget(scene_props.bake_memory_budget)
+        self.baked_images = []
+        reset_memory_report()
 
-        objects = bpy.data.objects
-        visible_objects = []
+        # if exporting incrementally we skip variants already in the manifest
+        self.incremental = scene_props.incremental_export
+        self.manifest = load_manifest(self.export_path) if self.incremental else {}
 
         # get list of tile collections our selected objects are in. We export
         # all visible objects in the collections
@@ -258,142 +379,281 @@ class MT_OT_Export_Tile_Variants(bpy.types.Operator):
                 if collection.mt_tile_props.is_mt_collection is True:
                     tile_collections.add(collection)
 
-        for collection in tile_collections:
-            visible_objects = []
+        # stores visible objects, original displacement state and hash of each tile
+        self.tiles = {}
+        self.units = []
+        for collection in sorted(tile_collections, key=lambda c: c.name):
+            visible_objects = get_visible_tile_objects(collection)
+
+            # catch problems before we spend time baking and exporting
+            if scene_props.analyse_on_export:
+                results = analyse_collection(context, collection)
+                if bpy.app.background:
+                    print('\n'.join(format_analysis(collection.name, results)))
+                for problem in get_analysis_problems(results):
+                    self.report({'WARNING'}, f'{collection.name}: {problem}')
+
+            displacement_obs = [
+                (obj, obj.mt_object_props.is_displaced) for obj in visible_objects
+                if obj.mt_object_props.is_displacement]
+
+            tile_hash = get_tile_hash(context, collection, visible_objects) if self.incremental else None
+            self.tiles[collection.name] = (visible_objects, displacement_obs, tile_hash)
+
+            for i in range(self.num_variants):
+                self.units.append((collection.name, i))
+
+        self.units.reverse()
+        self.num_units = len(self.units)
+        self.num_exported = 0
+        self.num_skipped = 0
+        self.started = set()
+        self.start_time = time.time()
+
+        if not self.units:
+            self.report({'INFO'}, 'No tiles to export.')
+            return False
 
-            for obj in collection.objects:
-                if obj.type == 'MESH' and obj.visible_get() is True and obj.display_type in ['SOLID', 'TEXTURED']:
-                    visible_objects.append(obj)
+        # set cycles to bake mode and store original settings
+        self.orig_settings = set_cycles_to_bake_mode()
+        return True
+
+    def finish(self, context):
+        """Restore renderer settings and clean up the UI."""
+        reset_renderer_from_bake(self.orig_settings)
+        if self._timer:
+            wm = context.window_manager
+            wm.event_timer_remove(self._timer)
+            wm.progress_end()
+            context.workspace.status_text_set(None)
+            self._timer = None
+
+    def reset_tile(self, collection_name):
+        """Return displacement objects that weren't displaced before export to preview mode."""
+        visible_objects, displacement_obs, tile_hash = self.tiles[collection_name]
+        for obj, is_displaced in displacement_obs:
+            if is_displaced is False:
+                set_to_preview(obj)
+
+    def export_next_variant(self, context):
+        """Export the next (collection, variant) unit."""
+        collection_name, i = self.units.pop()
+        collection = bpy.data.collections[collection_name]
+        self.started.add(collection_name)
+        visible_objects, displacement_obs, tile_hash = self.tiles[collection_name]
+
+        self.export_variant(context, collection, i, visible_objects, displacement_obs, tile_hash)
+
+        # reset displacement obs once we've exported all variants of a tile
+        if i == self.num_variants - 1:
+            self.reset_tile(collection_name)
+            self.started.discard(collection_name)
+
+    def export_variant(self, context, collection, i, visible_objects, displacement_obs, tile_hash=None):
+        """Bake, process and export a single variant of a tile.
+
+        Args:
+            context (bpy.context): context
+            collection (bpy.types.Collection): tile collection
+            i (int): variant number
+            visible_objects (list[bpy.types.Object]): objects to export
+            displacement_obs (list[tuple(bpy.types.Object, bool)]): displacement objects and whether they were displaced before export
+            tile_hash (str, optional): hash of tile if exporting incrementally. Defaults to None.
+        """
+        scene_props = context.scene.mt_scene_props
+        num_variants = self.num_variants
+        variant_seed = None
+
+        if self.incremental:
+            # name variant after a hash of its contents and skip it if we've already exported it
+            if scene_props.randomise_on_export:
+                variant_seed = get_variant_seed(tile_hash, i)
+                seeds = [variant_seed]
+            else:
+                seeds = sorted(seed for ob in displacement_obs for seed in get_seeds(ob[0]))
+            variant_hash = get_variant_hash(tile_hash, seeds)
+
+            if is_exported(self.export_path, self.manifest, variant_hash):
+                self.num_skipped += 1
+                return
+
+            filename = get_variant_filename(collection.name, variant_hash)
+        else:
+            # construct a random name for our variant
+            filename = collection.name + '.' + str(random()) + '.stl'
 
-            #generate variants of displacement obs equal to num_variants
-            displacement_obs = []
-            for obj in visible_objects:
-                if obj.mt_object_props.is_displacement:
-                    displacement_obs.append((obj, obj.mt_object_props.is_displaced))
-
-            i = 0
-            while i < num_variants:
-                # construct a random name for our variant
-                file_path = os.path.join(
-                    export_path,
-                    collection.name + '.' + str(random()) + '.stl')
-
-                for ob in displacement_obs:
-                    obj = ob[0]
-                    obj_props = obj.mt_object_props
-
-                    # check if displacement modifier exists. If it doesn't user has removed it.
-                    if obj_props.disp_mod_name in obj.modifiers:
-
-                        if obj_props.is_displacement and obj_props.is_displaced and scene_props.randomise_on_export:
-                            set_to_preview(obj)
-
-                        if obj_props.is_displacement and not obj_props.is_displaced:
-                            ctx = {
-                                'selected_objects': [obj],
-                                'selected_editable_objects': [obj],
-                                'active_object': obj,
-                                'object': obj}
-
-                            for item in obj.material_slots.items():
-                                if item[0]:
-                                    material = bpy.data.materials[item[0]]
-                                    tree = material.node_tree
-
-                                    # generate a random variant for each displacement object
-                                    if scene_props.randomise_on_export:
-                                        if num_variants == 1:
-                                            if 'Seed' in tree.nodes:
-                                                rand = random()
-                                                seed_node = tree.nodes['Seed']
-                                                seed_node.outputs[0].default_value = rand * 1000
-                                        else:
-                                            # only generate a random variant on second iteration
-                                            if i > 0:
-                                                if 'Seed' in tree.nodes:
-                                                    rand = random()
-                                                    seed_node = tree.nodes['Seed']
-                                                    seed_node.outputs[0].default_value = rand * 1000
-
-                            disp_image = bake_displacement_map(obj)
-                            disp_strength = obj_props.displacement_strength
-                            disp_texture = obj_props.disp_texture
-
-                            disp_texture.image = disp_image
-                            disp_mod = obj.modifiers[obj_props.disp_mod_name]
-                            disp_mod.texture = disp_texture
-                            disp_mod.mid_level = 0
-                            disp_mod.strength = disp_strength
-                            subsurf_mod = obj.modifiers[obj_props.subsurf_mod_name]
-                            subsurf_mod.levels = scene_props.export_subdivs
-                            subsurf_mod.show_viewport = True
-                            bpy.ops.object.modifier_move_to_index(ctx, modifier=subsurf_mod.name, index=0)
-                            obj_props.is_displaced = True
-
-                depsgraph = context.evaluated_depsgraph_get()
-                dupes = []
-
-                for obj in visible_objects:
-                    object_eval = obj.evaluated_get(depsgraph)
-                    mesh_from_eval = bpy.data.meshes.new_from_object(object_eval)
-                    dup_obj = bpy.data.objects.new('dupe', mesh_from_eval)
-                    dup_obj.data.transform(obj.matrix_world)
-                    collection.objects.link(dup_obj)
-                    dupes.append(dup_obj)
-
-                context.view_layer.update()
-                # join dupes together
-                if len(dupes) > 0:
-                    ctx = {
-                        'object': dupes[0],
-                        'active_object': dupes[0],
-                        'selected_objects': dupes,
-                        'selected_editable_objects': dupes}
-                    bpy.ops.object.join(ctx)
-
-                    if voxelise_on_export:
-                        voxelise(context, dupes[0])
-                    if decimate_on_export:
-                        decimate(context, dupes[0])
-                    if scene_props.fix_non_manifold:
-                        make_manifold(context, dupes[0])
-
-                    ctx = {
-                        'object': dupes[0],
-                        'active_object': dupes[0],
-                        'selected_objects': [dupes[0]],
-                        'selected_editable_objects': [dupes[0]]}
-
-                    # set origin to center
-                    bpy.ops.object.origin_set(ctx, type='ORIGIN_GEOMETRY')
-                    dupes[0].location = (0, 0, 0)
-
-                    # export our object
-                    bpy.ops.export_mesh.stl(
-                        ctx,
-                        filepath=file_path,
-                        check_existing=True,
-                        filter_glob="*.stl",
-                        use_selection=True,
-                        global_scale=unit_multiplier,
-                        use_mesh_modifiers=True)
-
-                    objects.remove(dupes[0], do_unlink=True)
-
-                    # clean up orphaned meshes
-                    for mesh in bpy.data.meshes:
-                        if mesh.users == 0:
-                            bpy.data.meshes.remove(mesh)
-                    i += 1
-
-            # reset displacement obs
-            for ob in displacement_obs:
-                obj, is_displaced = ob
-                if is_displaced is False:
+        file_path = os.path.join(self.export_path, filename)
+
+        to_bake = []
+        for ob in displacement_obs:
+            obj = ob[0]
+            obj_props = obj.mt_object_props
+
+            # check if displacement modifier exists. If it doesn't user has removed it.
+            if obj_props.disp_mod_name in obj.modifiers:
+
+                if obj_props.is_displacement and obj_props.is_displaced and scene_props.randomise_on_export:
                     set_to_preview(obj)
 
-        reset_renderer_from_bake(orig_settings)
+                if obj_props.is_displacement and not obj_props.is_displaced:
+                    for item in obj.material_slots.items():
+                        if item[0]:
+                            material = bpy.data.materials[item[0]]
+                            tree = material.node_tree
+
+                            # generate a random variant for each displacement object
+                            if variant_seed is not None:
+                                if 'Seed' in tree.nodes:
+                                    tree.nodes['Seed'].outputs[0].default_value = variant_seed
+                            elif scene_props.randomise_on_export:
+                                if num_variants == 1:
+                                    if 'Seed' in tree.nodes:
+                                        rand = random()
+                                        seed_node = tree.nodes['Seed']
+                                        seed_node.outputs[0].default_value = rand * 1000
+                                else:
+                                    # only generate a random variant on second iteration
+                                    if i > 0:
+                                        if 'Seed' in tree.nodes:
+                                            rand = random()
+                                            seed_node = tree.nodes['Seed']
+                                            seed_node.outputs[0].default_value = rand * 1000
+                    to_bake.append(obj)
+
+        stage = collection.name + ' variant ' + str(i) + ': '
+
+        # bake all displacement objects in the tile at once or one at a time
+        with track_memory(stage + 'bake'):
+            if scene_props.atlas_bake and to_bake:
+                max_bytes = self.fit_bake_to_memory_budget(context, to_bake, atlas=True)
+                disp_images = bake_displacement_atlas(to_bake, max_bytes)
+                if self.budget is not None:
+                    self.budget -= sum(get_image_bytes(img) for img in disp_images.values())
+            else:
+                disp_images = {}
+                for obj in to_bake:
+                    max_bytes = self.fit_bake_to_memory_budget(context, [obj])
+                    disp_images[obj] = bake_displacement_map(obj, max_bytes)
+                    if self.budget is not None:
+                        self.budget -= get_image_bytes(disp_images[obj])
+
+            for obj, disp_image in disp_images.items():
+                set_to_displaced(obj, disp_image, scene_props.export_subdivs)
+                self.baked_images.append(disp_image.name)
+
+        # evaluate displacement objects without their subsurf and displacement
+        # modifiers so we can displace them ourselves.
+        cpu_displaced = {}
+        if scene_props.export_displacement_method == 'CPU':
+            for ob in displacement_obs:
+                obj = ob[0]
+                if obj.mt_object_props.is_displaced:
+                    cpu_displaced[obj] = disable_displacement_modifiers(obj)
 
-        self.report({'INFO'}, f'{num_variants * len(tile_collections)} tiles exported to {prefs.default_export_path}.')
+        dupes = []
+        with track_memory(stage + 'evaluate'):
+            depsgraph = context.evaluated_depsgraph_get()
 
-        return {'FINISHED'}
+            for obj in visible_objects:
+                object_eval = obj.evaluated_get(depsgraph)
+                mesh_from_eval = bpy.data.meshes.new_from_object(object_eval)
+                if obj in cpu_displaced:
+                    displace_evaluated_mesh(obj, mesh_from_eval, scene_props.export_subdivs)
+                dup_obj = bpy.data.objects.new('dupe', mesh_from_eval)
+                dup_obj.data.transform(obj.matrix_world)
+                collection.objects.link(dup_obj)
+                dupes.append(dup_obj)
+
+            for obj, orig_state in cpu_displaced.items():
+                restore_displacement_modifiers(obj, orig_state)
+
+            context.view_layer.update()
+        # join dupes together
+        if len(dupes) > 0:
+            ctx = {
+                'object': dupes[0],
+                'active_object': dupes[0],
+                'selected_objects': dupes,
+                'selected_editable_objects': dupes}
+            with track_memory(stage + 'join'):
+                bpy.ops.object.join(ctx)
+
+            if scene_props.voxelise_on_export:
+                with track_memory(stage + 'voxelise'):
+                    voxelise(context, dupes[0])
+            if scene_props.decimate_on_export:
+                with track_memory(stage + 'decimate'):
+                    stats = decimate(context, dupes[0])
+                if bpy.app.background:
+                    print(f"{collection.name}: decimated from {stats['tris_before']} to "
+                          f"{stats['tris_after']} triangles in {stats['time']:.2f}s")
+            if scene_props.fix_non_manifold:
+                with track_memory(stage + 'make manifold'):
+                    make_manifold(context, dupes[0])
+
+            ctx = {
+                'object': dupes[0],
+                'active_object': dupes[0],
+                'selected_objects': [dupes[0]],
+                'selected_editable_objects': [dupes[0]]}
+
+            with track_memory(stage + 'export'):
+                # set origin to center
+                bpy.ops.object.origin_set(ctx, type='ORIGIN_GEOMETRY')
+                dupes[0].location = (0, 0, 0)
+
+                # export our object
+                bpy.ops.export_mesh.stl(
+                    ctx,
+                    filepath=file_path,
+                    check_existing=True,
+                    filter_glob="*.stl",
+                    use_selection=True,
+                    global_scale=self.unit_multiplier,
+                    use_mesh_modifiers=True)
+
+            if self.incremental:
+                add_to_manifest(self.manifest, variant_hash, filename, collection.name, i)
+                save_manifest(self.export_path, self.manifest)
+
+            with track_memory(stage + 'clean up'):
+                bpy.data.objects.remove(dupes[0], do_unlink=True)
+
+                # clean up orphaned meshes
+                for mesh in bpy.data.meshes:
+                    if mesh.users == 0:
+                        bpy.data.meshes.remove(mesh)
+                self.free_unused_images()
+            self.num_exported += 1
+
+    def fit_bake_to_memory_budget(self, context, objs, atlas=False):
+        """Return the maximum size of images baked for objs, warning if they won't fit in the Blender memory budget.
+
+        Args:
+            context (bpy.context): context
+            objs (list[bpy.types.Object]): objects baked in one go
+            atlas (bool, optional): whether objs are baked to an atlas. Defaults to False.
+
+        Returns:
+            int: maximum size of baked images in bytes. None if unlimited.
+        """
+        max_bytes, warning = fit_bake_to_memory_budget(context, objs, self.budget, atlas)
+        if warning:
+            self.report({'WARNING'}, warning)
+        return max_bytes
+
+    def free_unused_images(self):
+        """Remove images baked for earlier variants that nothing uses any more.
+
+        Each variant bakes new displacement maps so without this the maps of every
+        variant stay packed in memory until the end of the batch.
+        """
+        for name in list(self.baked_images):
+            image = bpy.data.images.get(name)
+            if image is None:
+                self.baked_images.remove(name)
+            elif image.users == 0:
+                if self.budget is not None:
+                    self.budget += get_image_bytes(image)
+                self.baked_images.remove(name)
+                bpy.data.images.remove(image)
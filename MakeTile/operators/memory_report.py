@@ -0,0 +1,26 @@
+from bpy.types import Operator
+from ..lib.utils.memory import (
+    memory_report,
+    get_memory_snapshot,
+    get_largest_images,
+    format_snapshot)
+
+# number of images listed in the memory report
+NUM_LARGEST_IMAGES = 5
+
+
+class MT_OT_Memory_Report(Operator):
+    """Report the memory used by images, meshes and Blender and by each stage of the last export."""
+    bl_idname = "scene.mt_memory_report"
+    bl_label = "Memory Report"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        snapshot = get_memory_snapshot()
+        largest_images = get_largest_images(NUM_LARGEST_IMAGES)
+        memory_report['snapshot'] = snapshot
+        memory_report['largest_images'] = largest_images
+
+        # the largest images and export stages are listed in the export panel
+        self.report({'INFO'}, '. '.join(format_snapshot(snapshot)))
+        return {'FINISHED'}
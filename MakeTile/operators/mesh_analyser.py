@@ -0,0 +1,272 @@
+"""Contains a fast analysis pass that checks tiles for problems before export.
+
+Analysing the evaluated meshes of a tile takes milliseconds, so problems like
+non-manifold geometry or walls too thin to print can be caught before we spend
+minutes baking, voxelising and exporting.
+"""
+import time
+import bpy
+import numpy as np
+from bpy.types import Operator
+from mathutils.bvhtree import BVHTree
+from .. lib.utils.collections import get_objects_owning_collections
+from .. lib.utils.utils import get_unit_multiplier
+from .. lib.utils.mesh_analysis import (
+    get_edge_face_counts,
+    get_edge_verts,
+    get_component_labels,
+    get_loose_part_count,
+    get_inverted_part_count,
+    get_stl_size)
+
+# maximum number of triangles we sample when checking wall thickness
+MAX_THICKNESS_SAMPLES = 5000
+
+# results of the last analysis keyed by collection name
+analysis_results = {}
+
+
+def get_world_coords(mesh, matrix):
+    """Return the world space vertex coordinates of a mesh.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        matrix (mathutils.Matrix): world matrix
+
+    Returns:
+        numpy.ndarray: coordinates of shape (n, 3)
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape((-1, 3))
+    mat = np.array(matrix, dtype=np.float64)
+    return co @ mat[:3, :3].T + mat[:3, 3]
+
+
+def get_thin_triangle_count(co, tris, min_thickness):
+    """Estimate how many triangles are on walls thinner than min_thickness.
+
+    Casts a ray inwards from the centre of at most MAX_THICKNESS_SAMPLES evenly
+    spaced triangles and counts those that hit the other side of the wall
+    within min_thickness.
+
+    Args:
+        co (numpy.ndarray): world space vertex coordinates of shape (n, 3)
+        tris (numpy.ndarray): vertex indices of each loop triangle of shape (m, 3)
+        min_thickness (float): minimum wall thickness in blender units
+
+    Returns:
+        int: estimated number of thin triangles
+    """
+    num_tris = len(tris)
+    if num_tris == 0 or min_thickness <= 0:
+        return 0
+
+    bvh = BVHTree.FromPolygons(co.tolist(), tris.tolist(), all_triangles=True)
+
+    samples = tris[np.linspace(0, num_tris - 1, min(num_tris, MAX_THICKNESS_SAMPLES)).astype(np.int64)]
+    v0 = co[samples[:, 0]]
+    v1 = co[samples[:, 1]]
+    v2 = co[samples[:, 2]]
+    centers = (v0 + v1 + v2) / 3
+    normals = np.cross(v1 - v0, v2 - v0)
+    lengths = np.linalg.norm(normals, axis=1)
+    normals = normals / np.where(lengths == 0, 1, lengths)[:, None]
+
+    # start just inside the surface so we don't hit the face we're casting from
+    offset = min_thickness * 0.001
+    origins = centers - normals * offset
+    thin = 0
+    for origin, normal in zip(origins.tolist(), (-normals).tolist()):
+        if bvh.ray_cast(origin, normal, min_thickness)[0] is not None:
+            thin += 1
+    return int(thin / len(origins) * num_tris)
+
+
+def analyse_mesh(mesh, matrix, min_thickness):
+    """Analyse a mesh for problems that would affect printing.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        matrix (mathutils.Matrix): world matrix
+        min_thickness (float): minimum wall thickness in blender units
+
+    Returns:
+        dict: analysis results
+    """
+    co = get_world_coords(mesh, matrix)
+    mesh.calc_loop_triangles()
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('vertices', tris)
+    tris = tris.reshape((-1, 3))
+
+    face_counts, forward_counts = get_edge_face_counts(mesh)
+    non_manifold = int(np.count_nonzero(face_counts != 2))
+    inconsistent = int(np.count_nonzero((face_counts == 2) & (forward_counts != 1)))
+
+    edge_verts = get_edge_verts(mesh)
+    labels = get_component_labels(len(co), edge_verts)
+
+    return {
+        'triangles': len(tris),
+        'non_manifold_edges': non_manifold,
+        'inconsistent_normals': inconsistent,
+        'inverted_parts': get_inverted_part_count(co, tris, edge_verts, labels, face_counts),
+        'loose_parts': get_loose_part_count(labels, edge_verts),
+        'thin_triangles': get_thin_triangle_count(co, tris, min_thickness)}
+
+
+def analyse_objects(context, objects):
+    """Analyse the evaluated meshes of objects as they would be exported.
+
+    Args:
+        context (bpy.context): context
+        objects (list[bpy.types.Object]): objects
+
+    Returns:
+        dict: combined analysis results
+    """
+    scene_props = context.scene.mt_scene_props
+    # nozzle width is in mm so convert to blender units
+    min_thickness = scene_props.nozzle_width / get_unit_multiplier(scene_props.export_units)
+
+    start = time.time()
+    depsgraph = context.evaluated_depsgraph_get()
+    results = {
+        'triangles': 0,
+        'non_manifold_edges': 0,
+        'inconsistent_normals': 0,
+        'inverted_parts': 0,
+        'loose_parts': 0,
+        'thin_triangles': 0}
+
+    for obj in objects:
+        object_eval = obj.evaluated_get(depsgraph)
+        mesh = object_eval.to_mesh()
+        try:
+            for key, value in analyse_mesh(mesh, obj.matrix_world, min_thickness).items():
+                results[key] += value
+        finally:
+            object_eval.to_mesh_clear()
+
+    results['stl_size'] = get_stl_size(results['triangles'])
+    results['time'] = time.time() - start
+    return results
+
+
+def get_visible_tile_objects(collection):
+    """Return the objects in a tile collection that will be exported.
+
+    Args:
+        collection (bpy.types.Collection): tile collection
+
+    Returns:
+        list[bpy.types.Object]: objects
+    """
+    return [
+        obj for obj in collection.objects
+        if obj.type == 'MESH' and obj.visible_get() is True and obj.display_type in ['SOLID', 'TEXTURED']]
+
+
+def analyse_collection(context, collection):
+    """Analyse a tile collection and store the results.
+
+    Args:
+        context (bpy.context): context
+        collection (bpy.types.Collection): tile collection
+
+    Returns:
+        dict: analysis results
+    """
+    results = analyse_objects(context, get_visible_tile_objects(collection))
+    analysis_results[collection.name] = results
+    return results
+
+
+def get_analysis_problems(results):
+    """Return human readable descriptions of any problems found.
+
+    Args:
+        results (dict): analysis results
+
+    Returns:
+        list[str]: problems
+    """
+    problems = []
+    if results['non_manifold_edges']:
+        problems.append(f"{results['non_manifold_edges']} non-manifold edges")
+    if results['inconsistent_normals']:
+        problems.append(f"{results['inconsistent_normals']} edges with inconsistent normals")
+    if results['inverted_parts']:
+        problems.append(f"{results['inverted_parts']} parts with inverted normals")
+    if results['thin_triangles']:
+        problems.append(f"about {results['thin_triangles']} triangles on walls thinner than the nozzle width")
+    return problems
+
+
+def format_analysis(collection_name, results):
+    """Return the analysis results as lines of text.
+
+    Args:
+        collection_name (str): name of tile collection
+        results (dict): analysis results
+
+    Returns:
+        list[str]: lines
+    """
+    lines = [
+        f"{collection_name}:",
+        f"  Triangles: {results['triangles']}",
+        f"  Estimated STL size: {results['stl_size'] / 1048576:.1f} MB",
+        f"  Loose parts: {results['loose_parts']}",
+        f"  Non-manifold edges: {results['non_manifold_edges']}",
+        f"  Inconsistent normals: {results['inconsistent_normals']}",
+        f"  Inverted parts: {results['inverted_parts']}",
+        f"  Thin wall triangles: {results['thin_triangles']}",
+        f"  Analysed in {results['time'] * 1000:.0f} ms"]
+    return lines
+
+
+def get_selected_tile_collections(context):
+    """Return the tile collections the selected objects belong to.
+
+    Args:
+        context (bpy.context): context
+
+    Returns:
+        list[bpy.types.Collection]: tile collections sorted by name
+    """
+    tile_collections = set()
+    for obj in context.selected_objects:
+        for collection in get_objects_owning_collections(obj.name):
+            if collection.mt_tile_props.is_mt_collection is True:
+                tile_collections.add(collection)
+    return sorted(tile_collections, key=lambda c: c.name)
+
+
+class MT_OT_Analyse_Tile(Operator):
+    """Check the selected tiles for problems before exporting them."""
+    bl_idname = "scene.mt_analyse_tile"
+    bl_label = "Analyse Tiles"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj is not None and obj.mode == 'OBJECT' and obj.mt_object_props.is_mt_object is True
+
+    def execute(self, context):
+        collections = get_selected_tile_collections(context)
+        num_problems = 0
+        for collection in collections:
+            results = analyse_collection(context, collection)
+            problems = get_analysis_problems(results)
+            num_problems += len(problems)
+            if bpy.app.background:
+                print('\n'.join(format_analysis(collection.name, results)))
+            for problem in problems:
+                self.report({'WARNING'}, f"{collection.name}: {problem}")
+
+        if num_problems == 0:
+            self.report({'INFO'}, f"{len(collections)} tiles analysed. No problems found.")
+        return {'FINISHED'}
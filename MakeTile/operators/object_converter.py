@@ -21,7 +21,11 @@ from .. lib.utils.collections import (
 from .assign_reference_object import create_helper_object
 from ..tile_creation.create_tile import create_material_enums
 
+from ..lib.utils.vertex_groups import new_vertex_group_at_start
+from ..lib.utils.uv_projection import box_project
+from ..enums.enums import uv_projection_methods
 from ..utils.registration import get_prefs
+from ..materials.materials import get_default_material
 
 
 class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
@@ -38,6 +42,12 @@ class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
         name="Material"
     )
 
+    uv_projection: EnumProperty(
+        items=uv_projection_methods,
+        name="UV Projection",
+        default='SMART'
+    )
+
     @classmethod
     def poll(cls, context):
         obj = context.object
@@ -47,6 +57,7 @@ class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
         self.invoked = True
         scene_props = context.scene.mt_scene_props
         self.converter_material = scene_props.converter_material
+        self.uv_projection = scene_props.converter_uv_projection
         return self.execute(context)
 
     def execute(self, context):
@@ -88,20 +99,16 @@ class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
         bpy.ops.object.parent_set(ctx, type='OBJECT', keep_transform=True)
 
         # UV Project
-        ctx = {
-            'selected_objects': [obj],
-            'selected_editable_objects': [obj],
-            'object': obj,
-            'active_object': obj
-        }
-
-        select(obj.name)
-        activate(obj.name)
-        bpy.ops.object.mode_set(mode='EDIT')
-        select_all()
-        bpy.ops.uv.smart_project(island_margin=tile_props.UV_island_margin)
-        deselect_all()
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if self.uv_projection == 'BOX':
+            box_project(obj.data, tile_props.UV_island_margin)
+        else:
+            select(obj.name)
+            activate(obj.name)
+            bpy.ops.object.mode_set(mode='EDIT')
+            select_all()
+            bpy.ops.uv.smart_project(island_margin=tile_props.UV_island_margin)
+            deselect_all()
+            bpy.ops.object.mode_set(mode='OBJECT')
 
         # set object props
         obj_props = obj.mt_object_props
@@ -116,19 +123,13 @@ class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
         # Remove any existing materials
         obj.data.materials.clear()
         # append secondary material
-        obj.data.materials.append(bpy.data.materials[prefs.secondary_material])
+        obj.data.materials.append(get_default_material(prefs.secondary_material))
 
         # create an all vertex group and ensure it is at index 0 as otherwise
         # the return to preview feature doesn't work properly
-        group = obj.vertex_groups.new(name="All")
-        verts = []
-        for vert in obj.data.vertices:
-            verts.append(vert.index)
-        group.add(verts, 1.0, 'ADD')
-
+        group = new_vertex_group_at_start(obj, "All")
+        group.add(list(range(len(obj.data.vertices))), 1.0, 'ADD')
         obj.vertex_groups.active_index = group.index
-        while group.index > 0:
-            bpy.ops.object.vertex_group_move(ctx, direction='UP')
 
         # check to see if there are already vertex groups on the object.
         # If there are we assume that we want the material to be applied to each
@@ -160,3 +161,4 @@ class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
         """Draw the Redo panel."""
         layout = self.layout
         layout.prop(self, 'converter_material')
+        layout.prop(self, 'uv_projection')
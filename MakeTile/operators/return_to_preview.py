@@ -1,5 +1,5 @@
 import bpy
-from ..materials.materials import assign_mat_to_vert_group
+from ..materials.materials import assign_mat_to_vert_group, get_default_material
 from ..utils.registration import get_prefs
 from .. lib.utils.utils import view3d_find
 
@@ -33,7 +33,7 @@ def set_to_preview(obj):
         obj (bpy.types.Object): object
     """
     prefs = get_prefs()
-    secondary_material = bpy.data.materials[prefs.secondary_material]
+    secondary_material = get_default_material(prefs.secondary_material)
     props = obj.mt_object_props
 
     # check if displacement modifier exists. If it doesn't user has removed it.
@@ -1,9 +1,14 @@
-import textwrap
+from math import sqrt, ceil
+import numpy as np
 import bpy
-import addon_utils
+import bmesh
 from bpy.types import Panel
-from .. lib.utils.collections import get_objects_owning_collections
-from ..lib.utils.selection import deselect_all, select, activate
+from mathutils import kdtree
+from ..lib.utils.mesh_analysis import (
+    get_loop_arrays,
+    get_non_manifold_edge_count,
+    get_triangle_count,
+    get_surface_area)
 
 class MT_PT_Voxelise_Panel(Panel):
     bl_order = 9
@@ -24,31 +29,21 @@ class MT_PT_Voxelise_Panel(Panel):
         scene_props = scene.mt_scene_props
         layout = self.layout
 
-        char_width = 9  # TODO find a way of actually getting this rather than guessing
-        print_tools_txt = "For more options please enable the 3D print Tools addon included with blender"
-
-        # get panel width so we can line wrap print_tools_txt
-        tool_shelf = None
-        area = bpy.context.area
-
-        for region in area.regions:
-            if region.type == 'UI':
-                tool_shelf = region
-
-        width = tool_shelf.width / char_width
-        wrapped = textwrap.wrap(print_tools_txt, width)
-
         layout.operator('scene.mt_voxelise_objects', text='Voxelise Objects')
-        layout.prop(scene_props, 'voxel_size')
+        layout.prop(scene_props, 'voxel_size_mode')
+        if scene_props.voxel_size_mode == 'TRIANGLES':
+            layout.prop(scene_props, 'target_triangles')
+        elif scene_props.voxel_size_mode == 'FEATURE':
+            layout.prop(scene_props, 'min_feature_size')
+        else:
+            layout.prop(scene_props, 'voxel_size')
         layout.prop(scene_props, 'voxel_adaptivity')
         layout.prop(scene_props, 'voxel_merge')
+        layout.prop(scene_props, 'voxel_chunked')
+        if scene_props.voxel_chunked:
+            layout.prop(scene_props, 'max_chunk_voxels')
 
-        if addon_utils.check("object_print3d_utils") == (True, True):
-            layout.prop(scene_props, 'fix_non_manifold')
-        else:
-            for line in wrapped:
-                row = layout.row()
-                row.label(text=line)
+        layout.prop(scene_props, 'fix_non_manifold')
 
 
 class MT_OT_Object_Voxeliser(bpy.types.Operator):
@@ -105,15 +100,23 @@ class MT_OT_Object_Voxeliser(bpy.types.Operator):
         return {'FINISHED'}
 
 
-def voxelise(context, obj):
-    """Voxelise the passed in object.
+# Ratio between the voxel size used to probe triangle density and the estimated voxel size
+PROBE_SCALE = 2
+
+# Voxel remesh gets very slow and memory hungry above this many voxels along an axis
+MAX_VOXELS_PER_AXIS = 2048
+
+
+def remesh(obj, voxel_size, adaptivity):
+    """Voxel remesh the passed in object.
 
     Args:
-        obj (bpy.types.Object): object to be voxelised
+        obj (bpy.types.Object): object
+        voxel_size (float): voxel size
+        adaptivity (float): voxel adaptivity
     """
-    props = context.scene.mt_scene_props
-    obj.data.remesh_voxel_size = props.voxel_size
-    obj.data.remesh_voxel_adaptivity = props.voxel_adaptivity
+    obj.data.remesh_voxel_size = voxel_size
+    obj.data.remesh_voxel_adaptivity = adaptivity
 
     ctx = {
         'object': obj,
@@ -122,26 +125,470 @@ def voxelise(context, obj):
         'selected_editable_objects': [obj]}
 
     bpy.ops.object.voxel_remesh(ctx)
+
+
+def get_local_dimensions(obj):
+    """Return the dimensions of an object's bounding box in object space.
+
+    Args:
+        obj (bpy.types.Object): object
+
+    Returns:
+        numpy.ndarray: dimensions
+    """
+    bound_box = np.array([corner[:] for corner in obj.bound_box])
+    return bound_box.max(axis=0) - bound_box.min(axis=0)
+
+
+def get_mean_scale(obj):
+    """Return the average scale of an object, used to convert world space sizes to object space.
+
+    Args:
+        obj (bpy.types.Object): object
+
+    Returns:
+        float: scale
+    """
+    scale = obj.matrix_world.to_scale()
+    return abs(scale[0] * scale[1] * scale[2]) ** (1 / 3) or 1
+
+
+def clamp_voxel_size(obj, voxel_size):
+    """Clamp voxel size so the remesh neither loses the shape of the object nor has too many voxels.
+
+    Args:
+        obj (bpy.types.Object): object
+        voxel_size (float): voxel size in object space
+
+    Returns:
+        float: clamped voxel size
+    """
+    dims = [d for d in get_local_dimensions(obj) if d > 0]
+    if not dims:
+        return voxel_size
+    return max(max(dims) / MAX_VOXELS_PER_AXIS, min(voxel_size, min(dims) / 4))
+
+
+def get_auto_voxel_size(context, obj):
+    """Return a voxel size based on the voxel size mode in mt_scene_props.
+
+    In TRIANGLES mode we estimate the voxel size from the object's surface area,
+    assuming each voxel on the surface produces two triangles. We then refine the
+    estimate by voxelising a copy of the object at a coarser voxel size and
+    measuring how many triangles it actually produces per unit area.
+
+    In FEATURE mode the voxel size is half the minimum feature size.
+
+    The remesh runs on the mesh in object space so the returned size is in
+    object space too. Scaled objects get a voxel size scaled to match.
+
+    Args:
+        context (bpy.context): context
+        obj (bpy.types.Object): object
+
+    Returns:
+        float: voxel size
+    """
+    props = context.scene.mt_scene_props
+
+    if props.voxel_size_mode == 'FEATURE':
+        return clamp_voxel_size(obj, props.min_feature_size / 2 / get_mean_scale(obj))
+
+    if props.voxel_size_mode == 'TRIANGLES':
+        area = get_surface_area(obj, coords='LOCAL')
+        if area == 0 or props.target_triangles <= 0:
+            return props.voxel_size
+        voxel_size = clamp_voxel_size(obj, sqrt(2 * area / props.target_triangles))
+
+        # probe at a coarser size to measure triangles per voxel face
+        probe_size = voxel_size * PROBE_SCALE
+        probe = bpy.data.objects.new('mt_voxel_probe', obj.data.copy())
+        probe.matrix_world = obj.matrix_world
+        context.scene.collection.objects.link(probe)
+        try:
+            remesh(probe, probe_size, props.voxel_adaptivity)
+            probe_tris = get_triangle_count(probe.data)
+        finally:
+            probe_mesh = probe.data
+            bpy.data.objects.remove(probe, do_unlink=True)
+            bpy.data.meshes.remove(probe_mesh)
+
+        if probe_tris > 0:
+            tris_per_area = probe_tris * probe_size * probe_size / area
+            voxel_size = clamp_voxel_size(obj, sqrt(tris_per_area * area / props.target_triangles))
+        return voxel_size
+
+    return props.voxel_size
+
+
+def get_chunk_bounds(mesh_min, mesh_max, chunk_size):
+    """Return the XY bounds of a grid of chunks covering a mesh.
+
+    Args:
+        mesh_min (numpy.ndarray): minimum corner of mesh
+        mesh_max (numpy.ndarray): maximum corner of mesh
+        chunk_size (float): maximum size of a chunk along X and Y
+
+    Returns:
+        list[tuple(float, float, float, float)]: min x, max x, min y, max y of each chunk
+    """
+    size = mesh_max - mesh_min
+    cols = max(1, ceil(size[0] / chunk_size))
+    rows = max(1, ceil(size[1] / chunk_size))
+    xs = np.linspace(mesh_min[0], mesh_max[0], cols + 1)
+    ys = np.linspace(mesh_min[1], mesh_max[1], rows + 1)
+    return [
+        (xs[i], xs[i + 1], ys[j], ys[j + 1])
+        for j in range(rows) for i in range(cols)]
+
+
+def clip_bmesh(bm, bounds, fill=True, keep_outer=(False, False, False, False)):
+    """Cut away the parts of a bmesh outside bounds in X and Y.
+
+    Args:
+        bm (bmesh.types.BMesh): bmesh
+        bounds (tuple(float, float, float, float)): min x, max x, min y, max y
+        fill (bool, optional): fill the holes left by cutting. Defaults to True.
+        keep_outer (tuple(bool, bool, bool, bool), optional): skip cutting at
+            min x, max x, min y, max y. Defaults to cutting at all four.
+
+    Returns:
+        list[bmesh.types.BMVert]: vertices created by the cuts
+    """
+    planes = [
+        ((bounds[0], 0, 0), (-1, 0, 0)),
+        ((bounds[1], 0, 0), (1, 0, 0)),
+        ((0, bounds[2], 0), (0, -1, 0)),
+        ((0, bounds[3], 0), (0, 1, 0))]
+
+    cut_edges = set()
+    for (plane_co, plane_no), keep in zip(planes, keep_outer):
+        if keep:
+            continue
+        result = bmesh.ops.bisect_plane(
+            bm,
+            geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
+            plane_co=plane_co,
+            plane_no=plane_no,
+            clear_outer=True)
+        cut_edges.update(e for e in result['geom_cut'] if isinstance(e, bmesh.types.BMEdge))
+
+    cut_edges = [e for e in cut_edges if e.is_valid]
+    if fill and cut_edges:
+        bmesh.ops.holes_fill(bm, edges=cut_edges, sides=0)
+    return list({v for e in cut_edges for v in e.verts})
+
+
+def get_mesh_arrays(mesh):
+    """Return the vertex coordinates, loop vertex indices and polygon loop totals of a mesh.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): co, loop_verts, loop_totals
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get('co', co)
+    loop_verts, loop_starts, loop_totals = get_loop_arrays(mesh)
+    return co.reshape((-1, 3)), loop_verts, loop_totals
+
+
+def set_mesh_arrays(mesh, co, loop_verts, loop_totals):
+    """Replace the geometry of a mesh with the passed in arrays.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+        co (numpy.ndarray): vertex coordinates of shape (n, 3)
+        loop_verts (numpy.ndarray): vertex index of each loop
+        loop_totals (numpy.ndarray): number of loops in each polygon
+    """
+    mesh.clear_geometry()
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set('co', co.astype(np.float32).ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set('vertex_index', loop_verts.astype(np.int32))
+    mesh.polygons.add(len(loop_totals))
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    loop_starts[1:] = np.cumsum(loop_totals)[:-1]
+    mesh.polygons.foreach_set('loop_start', loop_starts)
+    mesh.polygons.foreach_set('loop_total', loop_totals.astype(np.int32))
+    mesh.update(calc_edges=True)
+
+
+def extract_faces(co, loop_verts, loop_totals, face_mask):
+    """Return the vertices and polygons of the faces flagged in face_mask.
+
+    Args:
+        co (numpy.ndarray): vertex coordinates of shape (n, 3)
+        loop_verts (numpy.ndarray): vertex index of each loop
+        loop_totals (numpy.ndarray): number of loops in each polygon
+        face_mask (numpy.ndarray): faces to extract
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): co, loop_verts, loop_totals of the extracted faces
+    """
+    sub_loop_verts = loop_verts[np.repeat(face_mask, loop_totals)]
+    used, sub_loop_verts = np.unique(sub_loop_verts, return_inverse=True)
+    return co[used], sub_loop_verts, loop_totals[face_mask]
+
+
+def weld_vertices(co, candidates, dist):
+    """Return an index map that merges candidate vertices closer together than dist.
+
+    Args:
+        co (numpy.ndarray): vertex coordinates of shape (n, 3)
+        candidates (numpy.ndarray): indices of vertices that may be merged
+        dist (float): merge distance
+
+    Returns:
+        numpy.ndarray: index of the vertex each vertex is merged into
+    """
+    remap = np.arange(len(co))
+    tree = kdtree.KDTree(len(candidates))
+    for i in candidates:
+        tree.insert(co[i], int(i))
+    tree.balance()
+    for i in candidates:
+        if remap[i] != i:
+            continue
+        for found_co, j, found_dist in tree.find_range(co[i], dist):
+            if j != i and remap[j] == j:
+                remap[j] = i
+    return remap
+
+
+def merge_mesh_arrays(pieces):
+    """Concatenate the (co, loop_verts, loop_totals) arrays of several meshes.
+
+    Args:
+        pieces (list[tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)]): mesh arrays
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): co, loop_verts, loop_totals
+    """
+    offsets = np.cumsum([0] + [len(co) for co, loop_verts, loop_totals in pieces[:-1]])
+    return (
+        np.concatenate([piece[0] for piece in pieces]),
+        np.concatenate([piece[1] + offset for piece, offset in zip(pieces, offsets)]),
+        np.concatenate([piece[2] for piece in pieces]))
+
+
+def remove_unused_vertices(co, loop_verts):
+    """Remove vertices no loop uses and renumber the loops.
+
+    Args:
+        co (numpy.ndarray): vertex coordinates of shape (n, 3)
+        loop_verts (numpy.ndarray): vertex index of each loop
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): co, loop_verts
+    """
+    used, loop_verts = np.unique(loop_verts, return_inverse=True)
+    return co[used], loop_verts
+
+
+def remesh_chunked(context, obj, voxel_size, adaptivity, max_chunk_voxels):
+    """Voxel remesh the passed in object in overlapping blocks to bound peak memory.
+
+    The mesh is split once into a grid of blocks in X and Y, each holding the faces
+    that reach into the block plus an overlap of a few voxels. Each block is cut to
+    its bounds plus the overlap, capped and remeshed on its own, then trimmed back to
+    its exact bounds. Only the trimmed blocks' vertex and polygon arrays are kept,
+    and at the end they are written to the mesh with the seam vertices welded.
+
+    Because every block is remeshed on the same voxel grid the surfaces in the
+    overlap line up. This only holds for a uniform grid so adaptivity is ignored
+    when the mesh is split into more than one block.
+
+    Args:
+        context (bpy.context): context
+        obj (bpy.types.Object): object
+        voxel_size (float): voxel size
+        adaptivity (float): voxel adaptivity. Only used if the mesh fits in one block.
+        max_chunk_voxels (int): maximum number of voxels along X and Y in a block
+
+    Returns:
+        int: number of blocks remeshed
+    """
+    ensure_single_user_mesh(obj)
+    mesh = obj.data
+    co, loop_verts, loop_totals = get_mesh_arrays(mesh)
+    if len(loop_totals) == 0:
+        return 0
+    mesh_min = co.min(axis=0)
+    mesh_max = co.max(axis=0)
+
+    chunk_size = voxel_size * max_chunk_voxels
+    chunks = get_chunk_bounds(mesh_min, mesh_max, chunk_size)
+    if len(chunks) == 1:
+        remesh(obj, voxel_size, adaptivity)
+        return 1
+
+    overlap = voxel_size * 4
+    # cut vertices on either side of a seam should be the same to within rounding error
+    weld_dist = voxel_size * 0.01
+
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int64)
+    loop_starts[1:] = np.cumsum(loop_totals)[:-1]
+    loop_co = co[loop_verts]
+    face_min = np.minimum.reduceat(loop_co, loop_starts)
+    face_max = np.maximum.reduceat(loop_co, loop_starts)
+    del loop_co
+
+    pieces = []
+    for bounds in chunks:
+        grown = (
+            bounds[0] - overlap,
+            bounds[1] + overlap,
+            bounds[2] - overlap,
+            bounds[3] + overlap)
+        face_mask = (
+            (face_max[:, 0] >= grown[0]) & (face_min[:, 0] <= grown[1])
+            & (face_max[:, 1] >= grown[2]) & (face_min[:, 1] <= grown[3]))
+        if not face_mask.any():
+            continue
+
+        chunk_mesh = bpy.data.meshes.new('mt_voxel_chunk')
+        set_mesh_arrays(chunk_mesh, *extract_faces(co, loop_verts, loop_totals, face_mask))
+        bm = bmesh.new()
+        bm.from_mesh(chunk_mesh)
+        clip_bmesh(bm, grown)
+        bm.to_mesh(chunk_mesh)
+        bm.free()
+        chunk_obj = bpy.data.objects.new('mt_voxel_chunk', chunk_mesh)
+        chunk_obj.matrix_world = obj.matrix_world
+        context.scene.collection.objects.link(chunk_obj)
+
+        try:
+            if not chunk_mesh.polygons:
+                continue
+            remesh(chunk_obj, voxel_size, 0)
+
+            # trim back to the block, leaving the outside edges of the grid alone
+            bm = bmesh.new()
+            bm.from_mesh(chunk_obj.data)
+            clip_bmesh(bm, bounds, fill=False, keep_outer=(
+                bounds[0] <= mesh_min[0],
+                bounds[1] >= mesh_max[0],
+                bounds[2] <= mesh_min[1],
+                bounds[3] >= mesh_max[1]))
+            bm.to_mesh(chunk_obj.data)
+            bm.free()
+            pieces.append(get_mesh_arrays(chunk_obj.data))
+        finally:
+            chunk_mesh = chunk_obj.data
+            bpy.data.objects.remove(chunk_obj, do_unlink=True)
+            bpy.data.meshes.remove(chunk_mesh)
+
+    del face_min, face_max
+    if not pieces:
+        return 0
+    co, loop_verts, loop_totals = merge_mesh_arrays(pieces)
+    del pieces
+
+    # weld the vertices the trims created along the inner seams
+    inner_xs = np.array(sorted({b[0] for b in chunks if b[0] > mesh_min[0]}))
+    inner_ys = np.array(sorted({b[2] for b in chunks if b[2] > mesh_min[1]}))
+    on_seam = np.zeros(len(co), dtype=bool)
+    if len(inner_xs):
+        on_seam |= (np.abs(co[:, 0][:, None] - inner_xs[None, :]) < weld_dist).any(axis=1)
+    if len(inner_ys):
+        on_seam |= (np.abs(co[:, 1][:, None] - inner_ys[None, :]) < weld_dist).any(axis=1)
+    remap = weld_vertices(co, np.flatnonzero(on_seam), weld_dist)
+    co, loop_verts = remove_unused_vertices(co, remap[loop_verts])
+
+    set_mesh_arrays(mesh, co, loop_verts, loop_totals)
+    return len(chunks)
+
+
+def voxelise(context, obj):
+    """Voxelise the passed in object.
+
+    Args:
+        obj (bpy.types.Object): object to be voxelised
+    """
+    props = context.scene.mt_scene_props
+    ensure_single_user_mesh(obj)
+    voxel_size = get_auto_voxel_size(context, obj)
+    if props.voxel_chunked:
+        remesh_chunked(context, obj, voxel_size, props.voxel_adaptivity, props.max_chunk_voxels)
+    else:
+        remesh(obj, voxel_size, props.voxel_adaptivity)
     obj.mt_object_props.geometry_type = 'VOXELISED'
 
 
-def make_manifold(context, obj):
-    """Make the passed in object manifold using the 3dPrint toolkit addon
+def ensure_single_user_mesh(obj):
+    """Give obj its own copy of its mesh if the mesh is shared with other objects.
+
+    Args:
+        obj (bpy.types.Object): object
+    """
+    if obj.data.users > 1:
+        obj.data = obj.data.copy()
+
+
+def make_manifold(context, obj, merge_distance=0.0001, max_passes=3):
+    """Attempt to make the passed in object manifold.
+
+    Works directly on the object's mesh in bmesh so doesn't need the 3D print toolbox,
+    mode switching or selection changes. Each pass removes doubles, dissolves
+    degenerate geometry, deletes loose geometry, fills holes and recalculates normals.
+    We stop once the mesh is manifold or a pass doesn't reduce the number of
+    non-manifold edges.
 
     Args:
         context (bpy.context): context
         obj (bpy.types.Object): object
+        merge_distance (float, optional): distance within which to merge vertices. Defaults to 0.0001.
+        max_passes (int, optional): maximum number of repair passes. Defaults to 3.
+
+    Returns:
+        dict: number of non-manifold edges before and after repair
     """
-    # TODO See if we can speed this up by calling the individual methods of the print3D toolkit
-    # check 3d print toolkit is installed and active
-    if addon_utils.check("object_print3d_utils") == (True, True):
-        selected = context.selected_objects
-        active = context.active_object
-        deselect_all()
-        select(obj.name)
-        activate(obj.name)
-        bpy.ops.mesh.print3d_clean_non_manifold()
-        deselect_all()
-        for obj in selected:
-            select(obj.name)
-        activate(active.name)
+    ensure_single_user_mesh(obj)
+    mesh = obj.data
+    non_manifold_before = get_non_manifold_edge_count(mesh)
+    non_manifold = non_manifold_before
+
+    passes = 0
+    while non_manifold > 0 and passes < max_passes:
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+        bmesh.ops.dissolve_degenerate(bm, edges=bm.edges, dist=merge_distance)
+
+        # delete loose geometry
+        loose_edges = [e for e in bm.edges if not e.link_faces]
+        bmesh.ops.delete(bm, geom=loose_edges, context='EDGES')
+        loose_verts = [v for v in bm.verts if not v.link_edges]
+        bmesh.ops.delete(bm, geom=loose_verts, context='VERTS')
+
+        # fill holes of any size
+        bmesh.ops.holes_fill(bm, edges=bm.edges, sides=0)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
+
+        passes += 1
+        remaining = get_non_manifold_edge_count(mesh)
+        if remaining >= non_manifold:
+            non_manifold = remaining
+            break
+        non_manifold = remaining
+
+    if non_manifold == non_manifold_before:
+        # still make normals consistent if mesh was already manifold
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
+
+    return {
+        'non_manifold_before': non_manifold_before,
+        'non_manifold_after': non_manifold}
@@ -14,6 +14,7 @@ from . utils.registration import get_path
 from . utils.system import makedir, abspath
 from . enums.enums import tile_blueprints, units
 from .tile_creation.create_tile import (
+    clear_enum_items_cache,
     create_tile_type_enums,
     create_base_blueprint_enums,
     create_main_part_blueprint_enums)
@@ -117,12 +118,37 @@ class MT_MakeTilePreferences(bpy.types.AddonPreferences):
         default="APPEND"
     )
 
+    profile_operators: BoolProperty(
+        name="Profile Operators",
+        description="Profile every MakeTile operator and save the results as .prof files",
+        default=False
+    )
+
+    profile_dir: StringProperty(
+        name="Profile Folder",
+        subtype='DIR_PATH',
+        description="Folder to save profiles to. Defaults to the system temp folder",
+        default=""
+    )
+
+    profile_top_n: IntProperty(
+        name="Profile Entries",
+        description="Number of entries with the highest cumulative time to list in the profiling panel",
+        default=15,
+        min=1,
+        max=100
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.prop(self, 'user_assets_path')
         layout.prop(self, 'default_export_path')
         layout.prop(self, 'default_units')
         layout.prop(self, 'default_mat_behaviour')
+        layout.prop(self, 'profile_operators')
+        if self.profile_operators:
+            layout.prop(self, 'profile_dir')
+            layout.prop(self, 'profile_top_n')
         layout.label(text="Default Materials:")
         # Draw list of default materials
         i = 0
@@ -147,6 +173,7 @@ class MT_OT_Restore_Default_Materials(Operator):
 
     def execute(self, context):
         create_default_materials(context)
+        clear_enum_items_cache()
         self.report({'INFO'}, "Default materials restored.")
         return {'FINISHED'}
 
@@ -166,6 +193,7 @@ class MT_OT_Add_Active_Material_To_Defaults(Operator):
         new_mat = default_mats.add()
         new_mat.name = context.active_object.active_material.name
         new_mat.filepath = bpy.data.filepath
+        clear_enum_items_cache()
         return {'FINISHED'}
 
 
@@ -191,6 +219,7 @@ class MT_OT_Remove_Material_From_Defaults(Operator):
         prefs = get_prefs()
         default_mats = prefs.default_materials
         default_mats.remove(self.index)
+        clear_enum_items_cache()
         self.report({'INFO'}, self.material +
                     " removed from default material list.")
 
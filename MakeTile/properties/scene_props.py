@@ -8,11 +8,16 @@ from bpy.props import (
     PointerProperty)
 from ..enums.enums import (
     units,
-    material_mapping)
-from ..tile_creation.create_tile import MT_Tile_Generator
-from ..lib.utils.utils import get_all_subclasses, get_annotations
-from ..tile_creation.create_tile import create_tile_type_enums
-from ..app_handlers import load_tile_defaults
+    material_mapping,
+    displacement_methods,
+    bake_resolution_modes,
+    voxel_size_modes,
+    uv_projection_methods,
+    memory_budget_actions)
+from ..tile_creation.create_tile import (
+    create_tile_type_enums,
+    get_generator_annotations)
+from ..app_handlers import get_tile_type_defaults, get_part_defaults
 
 def update_disp_strength(self, context):
     """Update the displacement strength of the maketile displacement modifier on active object.
@@ -80,43 +85,23 @@ def update_material_mapping(self, context):
 
 
 def reset_part_defaults(self, context):
-    tile_type = self.tile_type
-    base_blueprint = self.base_blueprint
-    main_part_blueprint = self.main_part_blueprint
-    tile_defaults = load_tile_defaults(context)
-    for tile in tile_defaults:
-        if tile['type'] == tile_type:
-            defaults = tile['defaults']
-            base_defaults = defaults['base_defaults']
-            for key, value in base_defaults.items():
-                if key == base_blueprint:
-                    for k, v in value.items():
-                        setattr(self, k, v)
-                    break
-            try:
-                main_part_defaults = defaults['tile_defaults']
-                for key, value in main_part_defaults.items():
-                    if key == main_part_blueprint:
-                        for k, v in value.items():
-                            setattr(self, k, v)
-                        break
-            # Some tiles like mini bases don;t have main parts
-            except KeyError:
-                pass
+    part_defaults = get_part_defaults(
+        context,
+        self.tile_type,
+        self.main_part_blueprint,
+        self.base_blueprint)
+    for key, value in part_defaults.items():
+        setattr(self, key, value)
 
 def update_scene_defaults(self, context):
-    tile_type = self.tile_type
-    tile_defaults = load_tile_defaults(context)
-    for tile in tile_defaults:
-        if tile['type'] == tile_type:
-            defaults = tile['defaults']
-            for key, value in defaults.items():
-                if hasattr(self, key):
-                    try:
-                        setattr(self, key, value)
-                    except TypeError:
-                        pass
-            break
+    tile = get_tile_type_defaults(context, self.tile_type)
+    if tile is not None:
+        for key, value in tile['defaults'].items():
+            if hasattr(self, key):
+                try:
+                    setattr(self, key, value)
+                except TypeError:
+                    pass
     reset_part_defaults(self, context)
 
 def create_scene_props():
@@ -154,6 +139,67 @@ def create_scene_props():
             min=1024,
             max=8192,
             step=1024),
+        "bake_resolution_mode": EnumProperty(
+            name="Bake Resolution Mode",
+            items=bake_resolution_modes,
+            description="How to choose the resolution of baked displacement maps",
+            default='FIXED'),
+        "texel_density": FloatProperty(
+            name="Texels per mm",
+            description="Target number of displacement map pixels per mm of textured surface in Auto mode",
+            default=10,
+            min=1,
+            soft_max=50),
+        "bake_memory_budget": IntProperty(
+            name="Bake Image Budget (MB)",
+            description="Maximum total size of the displacement maps kept from baking in one export or Make 3D run. Only counts baked maps, not the rest of Blender's memory. Maps are downscaled to fit and maps freed after export are returned to the budget. 0 = Unlimited",
+            default=0,
+            min=0),
+        "memory_budget": IntProperty(
+            name="Blender Memory Budget (MB)",
+            description="Maximum memory the whole Blender process should use while baking. Checked against Blender's current memory use before each bake, independently of the Bake Image Budget. Over Budget sets what happens when a bake would exceed it. 0 = Unlimited",
+            default=0,
+            min=0),
+        "memory_budget_action": EnumProperty(
+            name="Over Budget",
+            items=memory_budget_actions,
+            description="What to do when a bake would take Blender over the Blender memory budget",
+            default='DOWNSCALE'),
+        "atlas_bake": BoolProperty(
+            name="Atlas Bake",
+            description="Bake all displacement objects in a tile in one go. Faster for tiles with more than one textured part",
+            default=False),
+        "converter_uv_projection": EnumProperty(
+            name="UV Projection",
+            items=uv_projection_methods,
+            description="How to UV unwrap converted objects",
+            default='SMART'),
+        "analyse_on_export": BoolProperty(
+            name="Analyse on Export",
+            description="Check tiles for problems before exporting them",
+            default=False),
+        "nozzle_width": FloatProperty(
+            name="Nozzle Width (mm)",
+            description="Walls thinner than this are reported as too thin to print",
+            default=0.4,
+            min=0,
+            precision=2),
+        "voxel_size_mode": EnumProperty(
+            name="Voxel Size Mode",
+            items=voxel_size_modes,
+            description="How to choose the voxel size",
+            default='FIXED'),
+        "target_triangles": IntProperty(
+            name="Target Triangles",
+            description="Approximate number of triangles in the voxelised mesh",
+            default=500000,
+            min=1000),
+        "min_feature_size": FloatProperty(
+            name="Min Feature Size",
+            description="Smallest detail the voxelised mesh should preserve",
+            default=0.02,
+            min=0.0001,
+            precision=4),
         "voxel_size": FloatProperty(
             name="Voxel Size",
             description="Quality of the voxelisation. Smaller = Better",
@@ -165,6 +211,15 @@ def create_scene_props():
             description="Amount by which to simplify mesh",
             default=0.25,
             precision=3),
+        "voxel_chunked": BoolProperty(
+            name="Chunked Remesh",
+            description="Voxelise large meshes in blocks to reduce peak memory use. Adaptivity is ignored when a mesh is split into blocks",
+            default=False),
+        "max_chunk_voxels": IntProperty(
+            name="Max Chunk Voxels",
+            description="Maximum number of voxels along X and Y in each block",
+            default=512,
+            min=32),
         "voxel_merge": BoolProperty(
             name="Merge",
             description="Merge objects on voxelisation? Creates a single mesh.",
@@ -204,12 +259,21 @@ def create_scene_props():
             name="Randomise",
             description="Create random variant on export?",
             default=True),
+        "incremental_export": BoolProperty(
+            name="Incremental",
+            description="Name exported files after a hash of their settings and skip tiles that have already been exported",
+            default=False),
         "voxelise_on_export": BoolProperty(
             name="Voxelise",
             default=True),
         "decimate_on_export": BoolProperty(
             name="Decimate",
             default=False),
+        "export_displacement_method": EnumProperty(
+            name="Displacement",
+            items=displacement_methods,
+            description="How to apply baked displacement maps on export. CPU only subdivides textured faces",
+            default='MODIFIER'),
         "export_units": EnumProperty(
             name="Units",
             items=units,
@@ -234,14 +298,8 @@ def create_scene_props():
     }
 
     # dynamically created properties constructed from all annotations in subclasses of MT_Tile_Generator
-    subclasses = get_all_subclasses(MT_Tile_Generator)
-    annotations = {}
-
-    for subclass in subclasses:
-        # make sure we also get annotations of parent classes such as mixins
-        annotations.update(get_annotations(subclass))
-        annotations.update(subclass.__annotations__)
-        annotations.update(props)
+    annotations = dict(get_generator_annotations())
+    annotations.update(props)
 
     # exclusion list
     exclude = ["invoked", "executed"]
@@ -2,15 +2,24 @@ import bpy
 from bpy.types import PropertyGroup
 from bpy.props import (
     EnumProperty,
+    StringProperty,
+    FloatProperty,
+    CollectionProperty,
     PointerProperty)
 
 
 from ..tile_creation.create_tile import (
-    MT_Tile_Generator)
+    create_tile_type_enums,
+    get_generator_annotations)
 
-from ..lib.utils.utils import get_all_subclasses, get_annotations
+class MT_Phase_Timing(PropertyGroup):
+    """Seconds spent in a phase of tile generation."""
+    name: StringProperty(
+        name="Phase")
+
+    value: FloatProperty(
+        name="Seconds")
 
-from ..tile_creation.create_tile import create_tile_type_enums
 
 def create_tile_props():
     """Dynamically create new_mt_tile_props PropertyGroup based on properties in MT_Tile_Generator and subclasses."""
@@ -20,16 +29,15 @@ def create_tile_props():
             items=create_tile_type_enums,
             name="Tile Type",
             description="The type of tile e.g. Straight Wall, Curved Floor"
+        ),
+        "phase_timings": CollectionProperty(
+            type=MT_Phase_Timing,
+            name="Phase Timings",
+            description="Seconds spent in each phase when the tile was last generated"
         )
     }
-    subclasses = get_all_subclasses(MT_Tile_Generator)
-    annotations = {}
-
-    for subclass in subclasses:
-        # make sure we also get annotations of parent classes such as mixins
-        annotations.update(get_annotations(subclass))
-        annotations.update(subclass.__annotations__)
-        annotations.update(props)
+    annotations = dict(get_generator_annotations())
+    annotations.update(props)
 
     New_MT_Tile_Props = type(
         'New_MT_Tile_Props',
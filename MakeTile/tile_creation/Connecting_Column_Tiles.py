@@ -13,6 +13,8 @@ from .. lib.utils.collections import (
     add_object_to_collection)
 from .create_tile import (
     spawn_empty_base,
+    spawn_prefab,
+    register_prefab_builder,
     convert_to_displacement_core,
     set_bool_obj_props,
     set_bool_props,
@@ -38,7 +40,8 @@ from ..lib.bmturtle.commands import (
 from ..lib.bmturtle.helpers import (
     bm_select_all,
     assign_verts_to_group,
-    select_verts_in_bounds)
+    select_verts_in_bounds,
+    get_bmesh_coord_index)
 '''
 from line_profiler import LineProfiler
 from os.path import splitext
@@ -158,20 +161,9 @@ class MT_OT_Make_Connecting_Column_Tile(Operator, MT_Tile_Generator):
         core_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(tile_props)
-
-        if core_blueprint == 'NONE':
-            core = None
-        elif core_blueprint == 'OPENLOCK':
-            core = spawn_openlock_connecting_column_core(
-                self, tile_props, base)
-        elif core_blueprint == 'PLAIN':
-            core = spawn_plain_connecting_column_core(self, tile_props)
+        base = spawn_prefab(context, self, tile_props, 'CONNECTING_COLUMN_BASE', base_blueprint)
+        core = spawn_prefab(
+            context, self, tile_props, 'CONNECTING_COLUMN_CORE', core_blueprint, base)
 
         self.finalise_tile(context, base, core)
         #profile.dump_stats(splitext(__file__)[0] + '.prof')
@@ -242,8 +234,8 @@ class MT_OT_Make_Openlock_Connecting_Column_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_openlock_base(self, tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Plain_Connecting_Column_Base(MT_Tile_Generator, Operator):
@@ -258,8 +250,8 @@ class MT_OT_Make_Plain_Connecting_Column_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Connecting_Column_Base(MT_Tile_Generator, Operator):
@@ -274,8 +266,8 @@ class MT_OT_Make_Empty_Connecting_Column_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Plain_Connecting_Column_Core(MT_Tile_Generator, Operator):
@@ -291,8 +283,9 @@ class MT_OT_Make_Plain_Connecting_Column_Core(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_plain_connecting_column_core(self, tile_props)
-        return{'FINISHED'}
+        base = bpy.data.objects.get(self.base_name)
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint, base)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Openlock_Connecting_Column_Core(MT_Tile_Generator, Operator):
@@ -308,10 +301,10 @@ class MT_OT_Make_Openlock_Connecting_Column_Core(MT_Tile_Generator, Operator):
 
     def execute(self, context):
         """Execute the operator."""
-        base = bpy.data.objects[self.base_name]
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_openlock_connecting_column_core(self, tile_props, base)
-        return{'FINISHED'}
+        base = bpy.data.objects.get(self.base_name)
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint, base)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Connecting_Column_Core(MT_Tile_Generator, Operator):
@@ -1398,33 +1391,35 @@ def make_generic_core_vert_groups(obj, bm, dims, margin, top_verts, bottom_verts
     Returns:
         bpy.types.Object: core
     """
+    coord_index = get_bmesh_coord_index(bm)
+
     # select front verts
     lbound = (0, 0, 0)
     ubound = (dims[0], 0, dims[2])
     buffer = margin / 2
 
-    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select left verts
     lbound = (0, 0, 0)
     ubound = (0, dims[1], dims[2])
     buffer = margin / 2
 
-    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select right verts
     lbound = (dims[0], 0, 0)
     ubound = dims
     buffer = margin / 2
 
-    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select back side
     lbound = (0, dims[1], 0)
     ubound = (dims[0], dims[1], dims[2])
     buffer = margin / 2
 
-    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # ensure vert groups only contain the verts we want.
     front_verts = [v for v in front_verts_orig
@@ -1470,33 +1465,35 @@ def make_L_core_vert_groups(obj, bm, dims, margin, top_verts, bottom_verts, defo
     Returns:
         bpy.types.Object: core
     """
+    coord_index = get_bmesh_coord_index(bm)
+
     # select front verts
     lbound = (0, 0, 0)
     ubound = (dims[0], 0, dims[2])
     buffer = margin / 2
 
-    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select left verts
     lbound = (0, 0, 0)
     ubound = (0, dims[1], dims[2])
     buffer = margin / 2
 
-    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select right verts
     lbound = (dims[0], 0, 0)
     ubound = dims
     buffer = margin / 2
 
-    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select back side
     lbound = (0, dims[1], 0)
     ubound = (dims[0], dims[1], dims[2])
     buffer = margin / 2
 
-    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # ensure vert groups only contain the verts we want.
     front_verts = [v for v in front_verts_orig
@@ -1544,33 +1541,35 @@ def make_I_core_vert_groups(obj, bm, dims, margin, top_verts, bottom_verts, defo
     Returns:
         bpy.types.Object: core
     """
+    coord_index = get_bmesh_coord_index(bm)
+
     # select front verts
     lbound = (0, 0, 0)
     ubound = (dims[0], 0, dims[2])
     buffer = margin / 2
 
-    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select left verts
     lbound = (0, 0, 0)
     ubound = (0, dims[1], dims[2])
     buffer = margin / 2
 
-    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select right verts
     lbound = (dims[0], 0, 0)
     ubound = dims
     buffer = margin / 2
 
-    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select back side
     lbound = (0, dims[1], 0)
     ubound = (dims[0], dims[1], dims[2])
     buffer = margin / 2
 
-    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # ensure vert groups only contain the verts we want.
     front_verts = [v for v in front_verts_orig
@@ -1623,33 +1622,35 @@ def make_O_core_vert_groups(obj, bm, dims, margin, top_verts, bottom_verts, defo
     Returns:
         bpy.types.Object: core
     """
+    coord_index = get_bmesh_coord_index(bm)
+
     # select front verts
     lbound = (0, 0, 0)
     ubound = (dims[0], 0, dims[2])
     buffer = margin / 2
 
-    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select left verts
     lbound = (0, 0, 0)
     ubound = (0, dims[1], dims[2])
     buffer = margin / 2
 
-    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select right verts
     lbound = (dims[0], 0, 0)
     ubound = dims
     buffer = margin / 2
 
-    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select back side
     lbound = (0, dims[1], 0)
     ubound = (dims[0], dims[1], dims[2])
     buffer = margin / 2
 
-    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # ensure vert groups only contain the verts we want.
     front_verts = [v for v in front_verts_orig
@@ -1699,33 +1700,35 @@ def make_T_core_vert_groups(obj, bm, dims, margin, top_verts, bottom_verts, defo
     Returns:
         bpy.types.Object: core
     """
+    coord_index = get_bmesh_coord_index(bm)
+
     # select front verts
     lbound = (0, 0, 0)
     ubound = (dims[0], 0, dims[2])
     buffer = margin / 2
 
-    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    front_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select left verts
     lbound = (0, 0, 0)
     ubound = (0, dims[1], dims[2])
     buffer = margin / 2
 
-    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select right verts
     lbound = (dims[0], 0, 0)
     ubound = dims
     buffer = margin / 2
 
-    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # select back side
     lbound = (0, dims[1], 0)
     ubound = (dims[0], dims[1], dims[2])
     buffer = margin / 2
 
-    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
+    back_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm, coord_index)
 
     # ensure vert groups only contain the verts we want.
     front_verts = [v for v in front_verts_orig
@@ -1761,3 +1764,23 @@ def finalise_core(core, tile_props):
     obj_props = core.mt_object_props
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
+
+
+register_prefab_builder(
+    'CONNECTING_COLUMN_BASE', 'OPENLOCK',
+    lambda generator, tile_props, base: spawn_openlock_base(generator, tile_props))
+register_prefab_builder(
+    'CONNECTING_COLUMN_BASE', 'PLAIN',
+    lambda generator, tile_props, base: spawn_plain_base(tile_props))
+register_prefab_builder(
+    'CONNECTING_COLUMN_BASE', 'NONE',
+    lambda generator, tile_props, base: spawn_empty_base(tile_props))
+register_prefab_builder(
+    'CONNECTING_COLUMN_CORE', 'OPENLOCK',
+    lambda generator, tile_props, base: spawn_openlock_connecting_column_core(generator, tile_props, base))
+register_prefab_builder(
+    'CONNECTING_COLUMN_CORE', 'PLAIN',
+    lambda generator, tile_props, base: spawn_plain_connecting_column_core(generator, tile_props))
+register_prefab_builder(
+    'CONNECTING_COLUMN_CORE', 'NONE',
+    lambda generator, tile_props, base: None)
@@ -34,6 +34,8 @@ from .create_tile import (
     set_bool_props,
     load_openlock_top_peg,
     MT_Tile_Generator,
+    timed_phase,
+    phase_timer,
     get_subdivs,
     create_material_enums,
     create_wall_position_enums,
@@ -232,25 +234,27 @@ class MT_OT_Make_Curved_Wall_Tile(Operator, MT_Curved_Tile, MT_Tile_Generator):
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
         floor_core = None
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint in ['PLAIN']:
-            base = spawn_plain_base(self, tile_props)
-        elif base_blueprint in ['OPENLOCK']:
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint in ['PLAIN_S_WALL', 'OPENLOCK_S_WALL']:
-            base, floor_core = spawn_s_base(self, context, tile_props)
+        with phase_timer('base'):
+            if base_blueprint == 'NONE':
+                base = spawn_empty_base(tile_props)
+            elif base_blueprint in ['PLAIN']:
+                base = spawn_plain_base(self, tile_props)
+            elif base_blueprint in ['OPENLOCK']:
+                base = spawn_openlock_base(self, tile_props)
+            elif base_blueprint in ['PLAIN_S_WALL', 'OPENLOCK_S_WALL']:
+                base, floor_core = spawn_s_base(self, context, tile_props)
         if not base:
             self.delete_tile_collection(self.tile_name)
             self.report({'INFO'}, "Could not generate base. Cancelling")
             return {'CANCELLED'}
 
-        if wall_blueprint == 'NONE':
-            wall_core = None
-        elif wall_blueprint == 'PLAIN':
-            wall_core = spawn_plain_wall_cores(self, tile_props)
-        elif wall_blueprint == 'OPENLOCK':
-            wall_core = spawn_openlock_wall_cores(self, base, tile_props)
+        with phase_timer('core'):
+            if wall_blueprint == 'NONE':
+                wall_core = None
+            elif wall_blueprint == 'PLAIN':
+                wall_core = spawn_plain_wall_cores(self, tile_props)
+            elif wall_blueprint == 'OPENLOCK':
+                wall_core = spawn_openlock_wall_cores(self, base, tile_props)
 
 
         self.finalise_tile(context, base, wall_core, floor_core)
@@ -300,17 +304,19 @@ class MT_OT_Make_Curved_Floor_Tile(Operator, MT_Curved_Tile, MT_Tile_Generator):
         core_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(self, tile_props)
-
-        if core_blueprint == 'NONE':
-            core = None
-        else:
-            core = spawn_plain_floor_cores(self, tile_props)
+        with phase_timer('base'):
+            if base_blueprint == 'NONE':
+                base = spawn_empty_base(tile_props)
+            elif base_blueprint == 'OPENLOCK':
+                base = spawn_openlock_base(self, tile_props)
+            elif base_blueprint == 'PLAIN':
+                base = spawn_plain_base(self, tile_props)
+
+        with phase_timer('core'):
+            if core_blueprint == 'NONE':
+                core = None
+            else:
+                core = spawn_plain_floor_cores(self, tile_props)
 
         self.finalise_tile(context, base, core)
         return {'FINISHED'}
@@ -495,6 +501,7 @@ def spawn_openlock_top_pegs(base, **kwargs):
     return peg
 
 
+@timed_phase('cutters')
 def spawn_openlock_wall_cutters(tile_props):
     """Spawn OpenLOCK wall cutters into scene and position them.
 
@@ -637,6 +644,7 @@ def spawn_plain_base(self, tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_openlock_base_slot_cutter(self, base, tile_props, offset=0.236):
     """Spawns an openlock base slot cutter into the scene and positions it correctly.
 
@@ -749,6 +757,7 @@ def spawn_openlock_base(self, tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_openlock_base_clip_cutter(self, base, tile_props):
     """Spawn base clip cutter into scene.
 
@@ -32,6 +32,8 @@ from .create_tile import (
     set_bool_obj_props,
     load_openlock_top_peg,
     MT_Tile_Generator,
+    timed_phase,
+    phase_timer,
     create_material_enums,
     create_wall_position_enums,
     get_subdivs,
@@ -143,26 +145,28 @@ class MT_OT_Make_L_Wall_Tile(Operator, MT_Tile_Generator, MT_L_Tiles):
         floor_core = None
 
         ### Generate Bases ###
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint in ['PLAIN_S_WALL', 'OPENLOCK_S_WALL']:
-            base, floor_core = spawn_s_base(self, context, tile_props, base_blueprint)
+        with phase_timer('base'):
+            if base_blueprint == 'NONE':
+                base = spawn_empty_base(tile_props)
+            elif base_blueprint == 'PLAIN':
+                base = spawn_plain_base(tile_props)
+            elif base_blueprint == 'OPENLOCK':
+                base = spawn_openlock_base(self, tile_props)
+            elif base_blueprint in ['PLAIN_S_WALL', 'OPENLOCK_S_WALL']:
+                base, floor_core = spawn_s_base(self, context, tile_props, base_blueprint)
         if not base:
             self.delete_tile_collection(self.tile_name)
             self.report({'INFO'}, "Could not generate base. Cancelling")
             return {'CANCELLED'}
 
         ### Generate Walls ###
-        if wall_blueprint == 'NONE':
-            wall_core = None
-        elif wall_blueprint == 'PLAIN':
-            wall_core = spawn_plain_wall_cores(self, base, tile_props)
-        elif wall_blueprint == 'OPENLOCK':
-            wall_core = spawn_openlock_wall_cores(self, tile_props, base)
+        with phase_timer('core'):
+            if wall_blueprint == 'NONE':
+                wall_core = None
+            elif wall_blueprint == 'PLAIN':
+                wall_core = spawn_plain_wall_cores(self, base, tile_props)
+            elif wall_blueprint == 'OPENLOCK':
+                wall_core = spawn_openlock_wall_cores(self, tile_props, base)
 
         if wall_blueprint != 'NONE' and wall_core == None:
             self.delete_tile_collection(self.tile_name)
@@ -211,17 +215,19 @@ class MT_OT_Make_L_Floor_Tile(Operator, MT_L_Tiles, MT_Tile_Generator):
         core_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(tile_props)
+        with phase_timer('base'):
+            if base_blueprint == 'NONE':
+                base = spawn_empty_base(tile_props)
+            elif base_blueprint == 'OPENLOCK':
+                base = spawn_openlock_base(self, tile_props)
+            elif base_blueprint == 'PLAIN':
+                base = spawn_plain_base(tile_props)
 
-        if core_blueprint == 'NONE':
-            floor_core = None
-        else:
-            floor_core = spawn_plain_floor_cores(self, tile_props)
+        with phase_timer('core'):
+            if core_blueprint == 'NONE':
+                floor_core = None
+            else:
+                floor_core = spawn_plain_floor_cores(self, tile_props)
 
         self.finalise_tile(context, base, floor_core)
 
@@ -562,6 +568,7 @@ def spawn_openlock_top_pegs(core, tile_props):
     return pegs
 
 
+@timed_phase('cutters')
 def spawn_openlock_wall_cutters(self, core, tile_props):
     """Create the cutters for the wall and position them correctly.
 
@@ -1063,6 +1070,7 @@ def spawn_openlock_base(self, tile_props):
     return base
 
 
+@timed_phase('cutters')
 def create_openlock_base_slot_cutter(tile_props):
     """Create the base slot cutter for OpenLOCK tiles.
 
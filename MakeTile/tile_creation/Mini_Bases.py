@@ -31,6 +31,8 @@ from .create_tile import (
     set_bool_obj_props,
     set_bool_props,
     MT_Tile_Generator,
+    timed_phase,
+    phase_timer,
     get_subdivs,
     create_material_enums,
     add_subsurf_modifier,
@@ -168,14 +170,15 @@ class MT_OT_Make_Mini_Base(Operator, MT_Tile_Generator):
         base_blueprint = self.base_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
 
-        if base_blueprint in ["ROUND", "POLY"]:
-            base = spawn_poly_base(tile_props)
-        elif base_blueprint == "RECT":
-            base = spawn_rect_base(tile_props)
-        elif base_blueprint == "ROUNDED_RECT":
-            base = spawn_rounded_rect_base(tile_props)
-        elif base_blueprint == "OVAL":
-            base = spawn_oval_base(tile_props)
+        with phase_timer('base'):
+            if base_blueprint in ["ROUND", "POLY"]:
+                base = spawn_poly_base(tile_props)
+            elif base_blueprint == "RECT":
+                base = spawn_rect_base(tile_props)
+            elif base_blueprint == "ROUNDED_RECT":
+                base = spawn_rounded_rect_base(tile_props)
+            elif base_blueprint == "OVAL":
+                base = spawn_oval_base(tile_props)
         if not base:
             self.delete_tile_collection(self.tile_name)
             self.report({"INFO"}, "Could not generate base. Cancelling")
@@ -261,6 +264,7 @@ def spawn_poly_base(tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_poly_base_cutter(tile_props):
     """Spawn a cutter used for hollowing out polygonal bases.
 
@@ -328,6 +332,7 @@ def spawn_rect_base(tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_rect_base_cutter(tile_props):
     """Spawn a cutter for hollowing rectangular bases.
 
@@ -485,6 +490,7 @@ def spawn_rounded_rect_base(tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_rounded_rect_base_cutter(tile_props):
     """Spawn a rounded rectangular base cutter for hollowing base.
 
@@ -546,6 +552,7 @@ def spawn_oval_base(tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_oval_base_cutter(tile_props):
     """Spawn an oval base cutter.
 
@@ -16,10 +16,13 @@ from .. lib.bmturtle.scripts import draw_cuboid
 from ..lib.utils.selection import activate
 from .create_tile import (
     spawn_empty_base,
+    spawn_prefab,
+    register_prefab_builder,
     convert_to_displacement_core,
     set_bool_obj_props,
     set_bool_props,
     MT_Tile_Generator,
+    timed_phase,
     create_material_enums,
     add_subsurf_modifier)
 
@@ -220,15 +223,8 @@ class MT_OT_Make_Roof(Operator, MT_Tile_Generator):
         gable_blueprint = self.base_blueprint
         rooftop_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        if gable_blueprint == 'NONE':
-            gables = spawn_empty_base(tile_props)
-        elif gable_blueprint == 'PLAIN':
-            gables = spawn_base(self, tile_props)
-
-        if rooftop_blueprint == 'NONE':
-            rooftop = None
-        else:
-            rooftop = spawn_roof(self, tile_props)
+        gables = spawn_prefab(context, self, tile_props, 'ROOF_BASE', gable_blueprint)
+        rooftop = spawn_prefab(context, self, tile_props, 'ROOF_TOP', rooftop_blueprint, gables)
         self.finalise_tile(context, gables, rooftop)
 
     def execute(self, context):
@@ -311,10 +307,9 @@ class MT_OT_Make_Roof_Base(MT_Tile_Generator, Operator):
 
     def execute(self, context):
         """Execute the operator."""
-        # roof_props = context.collection.mt_roof_tile_props
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_base(self, tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Roof_Base(MT_Tile_Generator, Operator):
@@ -329,8 +324,8 @@ class MT_OT_Make_Empty_Roof_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Roof_Top(MT_Tile_Generator, Operator):
@@ -345,8 +340,8 @@ class MT_OT_Make_Roof_Top(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_roof(self, tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Roof_Top(MT_Tile_Generator, Operator):
@@ -425,6 +420,7 @@ def spawn_base(self, tile_props):
 
 
 # @profile
+@timed_phase('cutters')
 def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
     """Spawn an openlock base slot cutter into scene and positions it correctly.
 
@@ -521,3 +517,17 @@ def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
             base_location[2] + 0.24)
 
         return cutter_d
+
+
+register_prefab_builder(
+    'ROOF_BASE', 'PLAIN',
+    lambda generator, tile_props, base: spawn_base(generator, tile_props))
+register_prefab_builder(
+    'ROOF_BASE', 'NONE',
+    lambda generator, tile_props, base: spawn_empty_base(tile_props))
+register_prefab_builder(
+    'ROOF_TOP', 'PLAIN',
+    lambda generator, tile_props, base: spawn_roof(generator, tile_props))
+register_prefab_builder(
+    'ROOF_TOP', 'NONE',
+    lambda generator, tile_props, base: None)
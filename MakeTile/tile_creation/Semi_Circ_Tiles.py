@@ -16,9 +16,12 @@ from bpy.props import (
 from . create_tile import (
     convert_to_displacement_core,
     spawn_empty_base,
+    spawn_prefab,
+    register_prefab_builder,
     set_bool_obj_props,
     set_bool_props,
     MT_Tile_Generator,
+    timed_phase,
     get_subdivs,
     create_material_enums,
     add_subsurf_modifier)
@@ -36,6 +39,7 @@ from ..lib.bmturtle.helpers import (
     bm_select_all,
     bmesh_array,
     select_verts_in_bounds,
+    get_bmesh_coord_index,
     assign_verts_to_group,
     calculate_corner_wall_triangles)
 from ..lib.bmturtle.commands import (
@@ -159,17 +163,9 @@ class MT_OT_Make_Semi_Circ_Floor_Tile(Operator, MT_Tile_Generator):
         core_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(self, tile_props)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_plain_floor_cores(self, tile_props)
+        base = spawn_prefab(context, self, tile_props, 'SEMI_CIRC_BASE', base_blueprint)
+        preview_core = spawn_prefab(
+            context, self, tile_props, 'SEMI_CIRC_FLOOR_CORE', core_blueprint, base)
 
         self.finalise_tile(context, base, preview_core)
         # profile.dump_stats(splitext(__file__)[0] + '.prof')
@@ -233,8 +229,8 @@ class MT_OT_Make_Openlock_Semi_Circ_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_openlock_base(self, tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Plain_Semi_Circ_Base(MT_Tile_Generator, Operator):
@@ -249,8 +245,8 @@ class MT_OT_Make_Plain_Semi_Circ_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_plain_base(self, tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Semi_Circular_Base(MT_Tile_Generator, Operator):
@@ -265,8 +261,8 @@ class MT_OT_Make_Empty_Semi_Circular_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Plain_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
@@ -282,8 +278,9 @@ class MT_OT_Make_Plain_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_plain_floor_cores(self, tile_props)
-        return{'FINISHED'}
+        base = bpy.data.objects.get(self.base_name)
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint, base)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Openlock_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
@@ -299,8 +296,9 @@ class MT_OT_Make_Openlock_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_plain_floor_cores(self, tile_props)
-        return{'FINISHED'}
+        base = bpy.data.objects.get(self.base_name)
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint, base)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
@@ -483,6 +481,7 @@ def spawn_core(self, tile_props):
     return core
 
 
+@timed_phase('cutters')
 def create_openlock_base_clip_cutters(self, tile_props):
     """Generate base clip cutters for semi circular tiles.
 
@@ -932,20 +931,24 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     verts.layers.deform.verify()
     deform_groups = verts.layers.deform.active
 
+    coord_index = get_bmesh_coord_index(bm)
+
     side_b_verts = []
     for loc in vert_locs['Side b']:
         side_b_verts.extend(select_verts_in_bounds(
             lbound=loc,
             ubound=(loc[0], loc[1], loc[2] + height),
             buffer=margin / 2,
-            bm=bm))
+            bm=bm,
+            index=coord_index))
 
     side_c_verts = select_verts_in_bounds(
         lbound=obj.location,
         ubound=(obj.location[0], obj.location[1] +
                 radius, obj.location[2] + height),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     side_a_verts = []
     for loc in vert_locs['Side a']:
@@ -953,7 +956,8 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
             lbound=loc,
             ubound=(loc[0], loc[1], loc[2] + height),
             buffer=margin / 2,
-            bm=bm))
+            bm=bm,
+            index=coord_index))
 
     # verts not to include in top
     vert_list = bottom_verts + side_a_verts + side_b_verts + side_c_verts
@@ -1105,20 +1109,24 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     verts.layers.deform.verify()
     deform_groups = verts.layers.deform.active
 
+    coord_index = get_bmesh_coord_index(bm)
+
     side_b_verts = []
     for loc in vert_locs['Side b']:
         side_b_verts.extend(select_verts_in_bounds(
             lbound=loc,
             ubound=(loc[0], loc[1], loc[2] + height),
             buffer=margin / 2,
-            bm=bm))
+            bm=bm,
+            index=coord_index))
 
     side_c_verts = select_verts_in_bounds(
         lbound=obj.location,
         ubound=(obj.location[0], obj.location[1] +
                 radius, obj.location[2] + height),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     side_a_verts = []
     for loc in vert_locs['Side a']:
@@ -1126,7 +1134,8 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
             lbound=loc,
             ubound=(loc[0], loc[1], loc[2] + height),
             buffer=margin / 2,
-            bm=bm))
+            bm=bm,
+            index=coord_index))
 
     # verts not to include in top
     vert_list = bottom_verts + side_a_verts + side_b_verts + side_c_verts
@@ -1146,6 +1155,7 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     return obj
 
 
+@timed_phase('cutters')
 def draw_pos_curved_slot_cutter(dimensions, subdivs):
     """Return a positively curved base slot cutter.
 
@@ -1279,6 +1289,7 @@ def draw_pos_curved_slot_cutter(dimensions, subdivs):
     return obj
 
 
+@timed_phase('cutters')
 def draw_neg_curved_slot_cutter(dimensions):
     """Return a negatively curved base slot cutter.
 
@@ -1359,3 +1370,23 @@ def draw_neg_curved_slot_cutter(dimensions):
     home(obj)
     finalise_turtle(bm, obj)
     return obj
+
+
+register_prefab_builder(
+    'SEMI_CIRC_BASE', 'OPENLOCK',
+    lambda generator, tile_props, base: spawn_openlock_base(generator, tile_props))
+register_prefab_builder(
+    'SEMI_CIRC_BASE', 'PLAIN',
+    lambda generator, tile_props, base: spawn_plain_base(generator, tile_props))
+register_prefab_builder(
+    'SEMI_CIRC_BASE', 'NONE',
+    lambda generator, tile_props, base: spawn_empty_base(tile_props))
+register_prefab_builder(
+    'SEMI_CIRC_FLOOR_CORE', 'PLAIN',
+    lambda generator, tile_props, base: spawn_plain_floor_cores(generator, tile_props))
+register_prefab_builder(
+    'SEMI_CIRC_FLOOR_CORE', 'OPENLOCK',
+    lambda generator, tile_props, base: spawn_plain_floor_cores(generator, tile_props))
+register_prefab_builder(
+    'SEMI_CIRC_FLOOR_CORE', 'NONE',
+    lambda generator, tile_props, base: None)
@@ -24,6 +24,8 @@ from .create_tile import (
     set_bool_props,
     load_openlock_top_peg,
     MT_Tile_Generator,
+    timed_phase,
+    phase_timer,
     get_subdivs,
     create_material_enums,
     create_wall_position_enums,
@@ -171,25 +173,27 @@ class MT_OT_Make_Straight_Wall_Tile(Operator, MT_Tile_Generator):
         wall_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
         floor_core = None
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(self, tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint in ['PLAIN_S_WALL', 'OPENLOCK_S_WALL']:
-            base, floor_core = spawn_s_base(self, context, tile_props)
+        with phase_timer('base'):
+            if base_blueprint == 'NONE':
+                base = spawn_empty_base(tile_props)
+            elif base_blueprint == 'PLAIN':
+                base = spawn_plain_base(self, tile_props)
+            elif base_blueprint == 'OPENLOCK':
+                base = spawn_openlock_base(self, tile_props)
+            elif base_blueprint in ['PLAIN_S_WALL', 'OPENLOCK_S_WALL']:
+                base, floor_core = spawn_s_base(self, context, tile_props)
         if not base:
             self.delete_tile_collection(self.tile_name)
             self.report({'INFO'}, "Could not generate base. Cancelling")
             return {'CANCELLED'}
 
-        if wall_blueprint == 'PLAIN':
-            wall_core = spawn_plain_wall_cores(self, tile_props, base)
-        elif wall_blueprint == 'OPENLOCK':
-            wall_core = spawn_openlock_wall_cores(self, tile_props, base)
-        elif wall_blueprint == 'NONE':
-            wall_core = None
+        with phase_timer('core'):
+            if wall_blueprint == 'PLAIN':
+                wall_core = spawn_plain_wall_cores(self, tile_props, base)
+            elif wall_blueprint == 'OPENLOCK':
+                wall_core = spawn_openlock_wall_cores(self, tile_props, base)
+            elif wall_blueprint == 'NONE':
+                wall_core = None
 
         if wall_blueprint != 'NONE' and wall_core == None:
             self.delete_tile_collection(self.tile_name)
@@ -259,17 +263,19 @@ class MT_OT_Make_Rect_Floor_Tile(Operator, MT_Tile_Generator):
         core_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(self, tile_props)
-
-        if core_blueprint == 'NONE':
-            core = None
-        else:
-            core = create_plain_rect_floor_cores(self, tile_props)
+        with phase_timer('base'):
+            if base_blueprint == 'NONE':
+                base = spawn_empty_base(tile_props)
+            elif base_blueprint == 'OPENLOCK':
+                base = spawn_openlock_base(self, tile_props)
+            elif base_blueprint == 'PLAIN':
+                base = spawn_plain_base(self, tile_props)
+
+        with phase_timer('core'):
+            if core_blueprint == 'NONE':
+                core = None
+            else:
+                core = create_plain_rect_floor_cores(self, tile_props)
         self.finalise_tile(context, base, core)
 
     def init(self, context):
@@ -498,6 +504,7 @@ def spawn_openlock_top_pegs(core, base, tile_props):
     return peg
 
 
+@timed_phase('cutters')
 def spawn_openlock_wall_cutters(core, base, tile_props):
     """Create the cutters for the wall and position them correctly."""
     preferences = get_prefs()
@@ -793,6 +800,7 @@ def spawn_openlock_base(self, tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
     """Spawn an openlock base slot cutter into scene and positions it correctly.
 
@@ -882,6 +890,7 @@ def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
         return cutter_d
 
 
+@timed_phase('cutters')
 def spawn_openlock_base_clip_cutters(self, base, tile_props):
     """Make cutters for the openlock base clips.
 
@@ -30,9 +30,12 @@ from .. lib.utils.utils import mode
 from .create_tile import (
     convert_to_displacement_core,
     spawn_empty_base,
+    spawn_prefab,
+    register_prefab_builder,
     set_bool_obj_props,
     set_bool_props,
     MT_Tile_Generator,
+    timed_phase,
     get_subdivs,
     create_material_enums,
     add_subsurf_modifier)
@@ -141,17 +144,9 @@ class MT_OT_Make_Triangular_Floor_Tile(Operator, MT_Tile_Generator):
         core_blueprint = self.main_part_blueprint
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(tile_props)
-
-        if core_blueprint == 'NONE':
-            core = None
-        else:
-            core = create_plain_triangular_floor_cores(base, tile_props)
+        base = spawn_prefab(context, self, tile_props, 'TRIANGULAR_BASE', base_blueprint)
+        core = spawn_prefab(
+            context, self, tile_props, 'TRIANGULAR_FLOOR_CORE', core_blueprint, base)
         self.finalise_tile(context, base, core)
 
     def execute(self, context):
@@ -213,8 +208,8 @@ class MT_OT_Make_Openlock_Triangular_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Plain_Triangular_Base(MT_Tile_Generator, Operator):
@@ -229,8 +224,8 @@ class MT_OT_Make_Plain_Triangular_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Triangular_Base(MT_Tile_Generator, Operator):
@@ -245,8 +240,8 @@ class MT_OT_Make_Empty_Triangular_Base(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Plain_Triangular_Floor_Core(MT_Tile_Generator, Operator):
@@ -262,9 +257,9 @@ class MT_OT_Make_Plain_Triangular_Floor_Core(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        base = bpy.data.objects[self.base_name]
-        create_plain_triangular_floor_cores(base, tile_props)
-        return{'FINISHED'}
+        base = bpy.data.objects.get(self.base_name)
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint, base)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Openlock_Triangular_Floor_Core(MT_Tile_Generator, Operator):
@@ -280,9 +275,9 @@ class MT_OT_Make_Openlock_Triangular_Floor_Core(MT_Tile_Generator, Operator):
     def execute(self, context):
         """Execute the operator."""
         tile_props = bpy.data.collections[self.tile_name].mt_tile_props
-        base = bpy.data.objects[self.base_name]
-        create_plain_triangular_floor_cores(base, tile_props)
-        return{'FINISHED'}
+        base = bpy.data.objects.get(self.base_name)
+        spawn_prefab(context, self, tile_props, self.mt_type, self.mt_blueprint, base)
+        return {'FINISHED'}
 
 
 class MT_OT_Make_Empty_Triangular_Floor_Core(MT_Tile_Generator, Operator):
@@ -370,6 +365,7 @@ def spawn_openlock_base(self, tile_props):
 
 
 # @profile
+@timed_phase('cutters')
 def spawn_openlock_base_clip_cutters(self, dimensions, tile_props):
     """Make cutters for the openlock base clips.
 
@@ -691,3 +687,23 @@ def spawn_floor_core(tile_props):
     bpy.context.view_layer.objects.active = core
 
     return core
+
+
+register_prefab_builder(
+    'TRIANGULAR_BASE', 'OPENLOCK',
+    lambda generator, tile_props, base: spawn_openlock_base(generator, tile_props))
+register_prefab_builder(
+    'TRIANGULAR_BASE', 'PLAIN',
+    lambda generator, tile_props, base: spawn_plain_base(tile_props))
+register_prefab_builder(
+    'TRIANGULAR_BASE', 'NONE',
+    lambda generator, tile_props, base: spawn_empty_base(tile_props))
+register_prefab_builder(
+    'TRIANGULAR_FLOOR_CORE', 'PLAIN',
+    lambda generator, tile_props, base: create_plain_triangular_floor_cores(base, tile_props))
+register_prefab_builder(
+    'TRIANGULAR_FLOOR_CORE', 'OPENLOCK',
+    lambda generator, tile_props, base: create_plain_triangular_floor_cores(base, tile_props))
+register_prefab_builder(
+    'TRIANGULAR_FLOOR_CORE', 'NONE',
+    lambda generator, tile_props, base: None)
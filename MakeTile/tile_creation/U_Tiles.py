@@ -26,6 +26,7 @@ from ..lib.bmturtle.helpers import (
     bm_deselect_all,
     assign_verts_to_group,
     select_verts_in_bounds,
+    get_bmesh_coord_index,
     bm_shortest_path)
 from .. utils.registration import get_prefs
 from .. lib.utils.collections import (
@@ -37,6 +38,8 @@ from .create_tile import (
     set_bool_props,
     load_openlock_top_peg,
     MT_Tile_Generator,
+    timed_phase,
+    phase_timer,
     get_subdivs,
     create_material_enums,
     create_wall_position_enums,
@@ -178,25 +181,27 @@ class MT_OT_Make_U_Wall_Tile(MT_Tile_Generator, Operator):
         floor_core = None
         base = None
 
-        if base_blueprint == 'NONE':
-            base = spawn_empty_base(tile_props)
-        elif base_blueprint == 'OPENLOCK':
-            base = spawn_openlock_base(self, tile_props)
-        elif base_blueprint == 'PLAIN':
-            base = spawn_plain_base(tile_props)
-        elif base_blueprint in ['OPENLOCK_S_WALL', 'PLAIN_S_WALL']:
-            base, floor_core = spawn_s_base(self, context, tile_props)
+        with phase_timer('base'):
+            if base_blueprint == 'NONE':
+                base = spawn_empty_base(tile_props)
+            elif base_blueprint == 'OPENLOCK':
+                base = spawn_openlock_base(self, tile_props)
+            elif base_blueprint == 'PLAIN':
+                base = spawn_plain_base(tile_props)
+            elif base_blueprint in ['OPENLOCK_S_WALL', 'PLAIN_S_WALL']:
+                base, floor_core = spawn_s_base(self, context, tile_props)
         if not base:
             self.delete_tile_collection(self.tile_name)
             self.report({'INFO'}, "Could not generate base. Cancelling")
             return {'CANCELLED'}
 
-        if wall_blueprint == 'NONE':
-            wall_core = None
-        elif wall_blueprint == 'PLAIN':
-            wall_core = spawn_plain_wall_cores(tile_props)
-        elif wall_blueprint == 'OPENLOCK':
-            wall_core = spawn_openlock_wall_cores(base, tile_props)
+        with phase_timer('core'):
+            if wall_blueprint == 'NONE':
+                wall_core = None
+            elif wall_blueprint == 'PLAIN':
+                wall_core = spawn_plain_wall_cores(tile_props)
+            elif wall_blueprint == 'OPENLOCK':
+                wall_core = spawn_openlock_wall_cores(base, tile_props)
 
         if wall_blueprint != 'NONE' and wall_core == None:
             self.delete_tile_collection(self.tile_name)
@@ -294,6 +299,7 @@ def spawn_openlock_wall_cores(base, tile_props):
     return core
 
 
+@timed_phase('cutters')
 def spawn_openlock_wall_cutters(base, tile_props):
     """Spawn OpenLOCK wall cores into scene and position them.
 
@@ -750,6 +756,7 @@ def spawn_openlock_base(self, tile_props):
     return base
 
 
+@timed_phase('cutters')
 def spawn_openlock_base_slot_cutter(tile_props):
     """Spawn base slot cutter into scene.
 
@@ -838,6 +845,7 @@ def spawn_openlock_base_slot_cutter(tile_props):
     return slot_cutter
 
 
+@timed_phase('cutters')
 def spawn_openlock_base_clip_cutter(self, tile_props):
     """Spawn base clip cutter into scene.
 
@@ -1363,6 +1371,8 @@ def create_u_core_vert_groups_vert_lists_2(bm, dimensions, margin, vert_locs, su
 
     kd.balance()
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # leg_sides
     leg_sides = {
         'Leg 1 Inner': (vert_locs['Leg 1 Inner'][::-1], leg_1_inner_len),
@@ -1376,7 +1386,8 @@ def create_u_core_vert_groups_vert_lists_2(bm, dimensions, margin, vert_locs, su
             ubound=(value[0][-1][0], value[0][-1][1] +
                     value[1], value[0][-1][2] + height),
             buffer=margin / 2,
-            bm=bm)
+            bm=bm,
+            index=coord_index)
 
     end_wall_sides = {
         'End Wall Inner': vert_locs['End Wall Inner'],
@@ -1388,7 +1399,8 @@ def create_u_core_vert_groups_vert_lists_2(bm, dimensions, margin, vert_locs, su
             lbound=(value[0]),
             ubound=(value[-1][0], value[-1][1], value[-1][2] + height),
             buffer=margin / 2,
-            bm=bm)
+            bm=bm,
+            index=coord_index)
 
     # leg ends
     ends = {
@@ -1400,7 +1412,8 @@ def create_u_core_vert_groups_vert_lists_2(bm, dimensions, margin, vert_locs, su
             lbound=(value[0]),
             ubound=(value[1][0], value[1][1], value[1][2] + height),
             buffer=margin / 2,
-            bm=bm)
+            bm=bm,
+            index=coord_index)
     bm_deselect_all(bm)
 
     # bottom
@@ -24,6 +24,7 @@ from ..lib.bmturtle.helpers import (
     assign_verts_to_group,
     select_verts_in_bounds,
     select_edges_in_bounds,
+    get_bmesh_coord_index,
     points_are_inside_bmesh)
 
 from .create_tile import get_subdivs
@@ -162,6 +163,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
     fd(bm, margin, del_original=True)
     bm_deselect_all(bm)
 
+    coord_index = get_bmesh_coord_index(bm, edges=True)
+
     # select edges to split
     bm.select_mode = {'EDGE'}
     exclude_1 = select_edges_in_bounds(
@@ -171,7 +174,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
             draw_origin[1] + margin,
             peak_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     exclude_2 = select_edges_in_bounds(
         lbound=(
             draw_origin[0],
@@ -182,7 +186,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
             draw_origin[1] + base_dims[1],
             peak_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     bm_deselect_all(bm)
     edges_to_split = select_edges_in_bounds(
         lbound=(
@@ -194,7 +199,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
             draw_origin[1] + base_dims[1] - margin,
             peak_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     edges = [e for e in edges_to_split if e.select and e not in exclude_1 and e not in exclude_2]
     bmesh.ops.subdivide_edges(bm, edges=edges, cuts=subdivs[1] - 1, use_grid_fill=True)
     bm_deselect_all(bm)
@@ -352,6 +358,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
     bm_deselect_all(bm)
     turtle.location = draw_origin
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # Base Left
     left_verts = select_verts_in_bounds(
         lbound=(
@@ -363,7 +371,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             turtle.location[2] + base_dims[2] - margin / 2),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     assign_verts_to_group(left_verts, obj, deform_groups, "Base Left")
     bm_deselect_all(bm)
@@ -379,7 +388,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             turtle.location[2] + base_dims[2] - margin / 2),
         buffer=margin / 3,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     assign_verts_to_group(right_verts, obj, deform_groups, "Base Right")
     bm_deselect_all(bm)
@@ -395,7 +405,8 @@ def draw_apex_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             turtle.location[2]),
         buffer=margin / 3,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     assign_verts_to_group(bottom_verts, obj, deform_groups, "Bottom")
     bm_deselect_all(bm)
 
@@ -659,6 +670,8 @@ def draw_apex_roof_top(self, tile_props, margin=0.001):
     fd(bm, margin, del_original=True)
     bm_deselect_all(bm)
 
+    coord_index = get_bmesh_coord_index(bm, edges=True)
+
     bm.select_mode = {'EDGE'}
     exclude_1 = select_edges_in_bounds(
         lbound=vert_5_loc,
@@ -667,7 +680,8 @@ def draw_apex_roof_top(self, tile_props, margin=0.001):
             vert_5_loc[1] + margin,
             apex_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     exclude_2 = select_edges_in_bounds(
         lbound=(
             vert_5_loc[0],
@@ -678,7 +692,8 @@ def draw_apex_roof_top(self, tile_props, margin=0.001):
             vert_5_loc[1] + base_dims[1] + tile_props.end_eaves_neg + tile_props.end_eaves_pos,
             apex_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     bm_deselect_all(bm)
     edges_to_split = select_edges_in_bounds(
         lbound=(
@@ -690,7 +705,8 @@ def draw_apex_roof_top(self, tile_props, margin=0.001):
             vert_5_loc[1] + base_dims[1] + tile_props.end_eaves_neg + tile_props.end_eaves_pos,
             apex_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     edges = [e for e in edges_to_split if e.select and e not in exclude_1 and e not in exclude_2]
     bmesh.ops.subdivide_edges(bm, edges=edges, cuts=subdivs[1] - 1, use_grid_fill=True)
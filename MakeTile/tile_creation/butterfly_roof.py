@@ -21,6 +21,7 @@ from ..lib.bmturtle.helpers import (
     bm_deselect_all,
     assign_verts_to_group,
     select_verts_in_bounds,
+    get_bmesh_coord_index,
     points_are_inside_bmesh)
 
 from .create_tile import get_subdivs
@@ -414,6 +415,8 @@ def draw_butterfly_base(self, tile_props, margin=0.001):
     assign_verts_to_group(bottom_verts, obj, deform_groups, "Bottom")
     bm_deselect_all(bm)
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # left verts
     left_verts = select_verts_in_bounds(
         lbound=(turtle.location),
@@ -422,7 +425,8 @@ def draw_butterfly_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             turtle.location[2] + left_peak_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     left_verts = [v for v in bm.verts if v in left_verts and
                   v not in top_verts and
                   v not in bottom_verts]
@@ -440,7 +444,8 @@ def draw_butterfly_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             turtle.location[2] + right_peak_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     right_verts = [v for v in bm.verts if v in right_verts and
                    v not in top_verts and
                    v not in bottom_verts]
@@ -456,7 +461,8 @@ def draw_butterfly_base(self, tile_props, margin=0.001):
             turtle.location[1],
             left_peak_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     front_verts = [v for v in bm.verts if v in front_verts and
                    v not in top_verts and
                    v not in bottom_verts and
@@ -476,7 +482,8 @@ def draw_butterfly_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             left_peak_loc[2]),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     back_verts = [v for v in bm.verts if v in back_verts and
                   v not in top_verts and
                   v not in bottom_verts and
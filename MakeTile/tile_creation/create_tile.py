@@ -1,4 +1,7 @@
 import os
+import time
+import functools
+from contextlib import contextmanager
 from math import floor
 from weakref import KeyedRef
 import bpy
@@ -24,7 +27,7 @@ from ..lib.utils.collections import (
 
 from ..lib.utils.selection import deselect_all
 from ..lib.utils.multimethod import multimethod
-from ..materials.materials import assign_mat_to_vert_group
+from ..materials.materials import assign_mat_to_vert_group, get_default_material
 from ..lib.utils.utils import get_all_subclasses, get_annotations
 from ..lib.utils.file_handling import absolute_file_paths
 
@@ -32,7 +35,7 @@ from ..enums.enums import (
     units,
     collection_types)
 
-from ..app_handlers import load_tile_defaults
+from ..app_handlers import get_tile_type_defaults, get_part_defaults, tile_defaults_cache
 '''
 from line_profiler import LineProfiler
 from os.path import splitext
@@ -55,21 +58,131 @@ def tile_z_update(self, context):
         self.base_z = self.tile_z
 
 
+# phases of tile generation in the order they are displayed
+TILE_PHASES = ['init', 'base', 'core', 'cutters', 'booleans', 'displacement', 'finalise']
+
+# seconds spent in each phase of the tile currently being generated
+phase_timings = {}
+
+# [start time, time spent in nested phases] of each phase currently running
+phase_stack = []
+
+
+def reset_phase_timings():
+    """Clear phase timings before generating a new tile."""
+    phase_timings.clear()
+    phase_stack.clear()
+
+
+@contextmanager
+def phase_timer(phase):
+    """Add the time spent in the with block to phase_timings[phase].
+
+    Time spent in nested phases is only counted against the innermost phase,
+    so cutters spawned while spawning a base count as cutters, not base.
+
+    Args:
+        phase (str): phase name
+    """
+    phase_stack.append([time.perf_counter(), 0.0])
+    try:
+        yield
+    finally:
+        start, nested = phase_stack.pop()
+        elapsed = time.perf_counter() - start
+        phase_timings[phase] = phase_timings.get(phase, 0.0) + elapsed - nested
+        if phase_stack:
+            phase_stack[-1][1] += elapsed
+
+
+def timed_phase(phase):
+    """Decorate a function so the time spent in it is recorded against phase.
+
+    Args:
+        phase (str): phase name
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase_timer(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_phase_timings(tile_props):
+    """Store the phase timings of the last generated tile on its tile properties.
+
+    In background mode the timings are also printed.
+
+    Args:
+        tile_props (MakeTile.properties.MT_Tile_Properties): tile properties
+    """
+    phases = [phase for phase in TILE_PHASES if phase in phase_timings]
+    phases += sorted(phase for phase in phase_timings if phase not in TILE_PHASES)
+
+    tile_props.phase_timings.clear()
+    for phase in phases:
+        item = tile_props.phase_timings.add()
+        item.name = phase
+        item.value = phase_timings[phase]
+
+    if bpy.app.background:
+        print('MakeTile: generated {0} ({1}) in {2:.3f}s: {3}'.format(
+            tile_props.tile_name,
+            tile_props.tile_type,
+            sum(phase_timings.values()),
+            ', '.join('{0} {1:.3f}s'.format(phase, phase_timings[phase]) for phase in phases)))
+
+
+# Dynamic enum items keyed by what they were built from. Blender requires us to keep
+# a reference to the items returned by enum callbacks so we keep them here.
+enum_items_cache = {}
+
+
+def get_cached_enum_items(key, build):
+    """Return cached enum items, building them if they aren't cached.
+
+    Args:
+        key (tuple): cache key
+        build (function): function that returns enum items
+
+    Returns:
+        list[EnumPropertyItem]: enum items
+    """
+    enum_items = enum_items_cache.get(key)
+    if enum_items is None:
+        enum_items = build()
+        enum_items_cache[key] = enum_items
+    return enum_items
+
+
+def clear_enum_items_cache():
+    """Clear cached enum items. Call when generators are registered or default materials change."""
+    enum_items_cache.clear()
+
+
+def get_tile_defaults_key(context, tile_type):
+    """Return a key that changes when the defaults of a tile type are reloaded."""
+    tile = get_tile_type_defaults(context, tile_type)
+    return (tile_type, tile_defaults_cache['mtime'], tile is not None)
+
+
 def create_tile_type_enums(self, context):
     """Create an enum of tile types out of subclasses of MT_OT_Make_Tile."""
-    enum_items = []
     if context is None:
-        return enum_items
+        return []
 
-    # blueprint = context.scene.mt_scene_props.tile_blueprint
-    subclasses = get_all_subclasses(MT_Tile_Generator)
+    def build():
+        enum_items = []
+        subclasses = get_all_subclasses(MT_Tile_Generator)
+        for subclass in subclasses:
+            if 'INTERNAL' not in subclass.bl_options:
+                enum = (subclass.mt_type, subclass.bl_label, "")
+                enum_items.append(enum)
+        return sorted(enum_items)
 
-    for subclass in subclasses:
-        # if hasattr(subclass, 'mt_blueprint'):
-        if 'INTERNAL' not in subclass.bl_options:
-            enum = (subclass.mt_type, subclass.bl_label, "")
-            enum_items.append(enum)
-    return sorted(enum_items)
+    return get_cached_enum_items(('tile_types',), build)
 
 
 def create_main_part_blueprint_enums(self, context):
@@ -81,48 +194,36 @@ def create_main_part_blueprint_enums(self, context):
     Returns:
         list[enum_item]: list of enum items
     """
-    enum_items = []
-
     if context is None:
-        return enum_items
+        return []
 
-    scene = context.scene
-    scene_props = scene.mt_scene_props
+    tile_type = context.scene.mt_scene_props.tile_type
 
-    tile_type = scene_props.tile_type
-    tile_defaults = load_tile_defaults(context)
+    def build():
+        tile = get_tile_type_defaults(context, tile_type)
+        # some tiles such as mini bases don't have a main part
+        if tile is None or 'main_part_blueprints' not in tile:
+            return []
+        return sorted((key, value, "") for key, value in tile['main_part_blueprints'].items())
 
-    for default in tile_defaults:
-        if default['type'] == tile_type:
-            try:
-                for key, value in default['main_part_blueprints'].items():
-                    enum = (key, value, "")
-                    enum_items.append(enum)
-                return sorted(enum_items)
-            # some tiles such as mini bases don't have a main part
-            except KeyError:
-                pass
-    return enum_items
+    return get_cached_enum_items(
+        ('main_part_blueprints',) + get_tile_defaults_key(context, tile_type), build)
 
 
 def create_base_blueprint_enums(self, context):
-    enum_items = []
     if context is None:
-        return enum_items
+        return []
 
-    scene = context.scene
-    scene_props = scene.mt_scene_props
+    tile_type = context.scene.mt_scene_props.tile_type
 
-    tile_type = scene_props.tile_type
-    tile_defaults = load_tile_defaults(context)
+    def build():
+        tile = get_tile_type_defaults(context, tile_type)
+        if tile is None:
+            return []
+        return sorted((key, value, "") for key, value in tile['base_blueprints'].items())
 
-    for default in tile_defaults:
-        if default['type'] == tile_type:
-            for key, value in default['base_blueprints'].items():
-                enum = (key, value, "")
-                enum_items.append(enum)
-            return sorted(enum_items)
-    return enum_items
+    return get_cached_enum_items(
+        ('base_blueprints',) + get_tile_defaults_key(context, tile_type), build)
 
 
 def update_scene_defaults(self, context):
@@ -132,50 +233,32 @@ def update_scene_defaults(self, context):
 
 def reset_scene_defaults(self, context):
     scene_props = context.scene.mt_scene_props
-    tile_type = scene_props.tile_type
-    tile_defaults = load_tile_defaults(context)
-
-    for tile in tile_defaults:
-        if tile['type'] == tile_type:
-            defaults = tile['defaults']
-            for key, value in defaults.items():
-                if hasattr(scene_props, key):
-                    setattr(scene_props, key, value)
-            break
+    tile = get_tile_type_defaults(context, scene_props.tile_type)
+
+    if tile is not None:
+        for key, value in tile['defaults'].items():
+            if hasattr(scene_props, key):
+                setattr(scene_props, key, value)
     reset_part_defaults(scene_props, context)
 
 
 def reset_part_defaults(self, context):
     scene_props = context.scene.mt_scene_props
     tile_type = scene_props.tile_type
-    base_blueprint = self.base_blueprint
-    main_part_blueprint = self.main_part_blueprint
-    floor_material = self.floor_material
-    tile_defaults = load_tile_defaults(context)
-    for tile in tile_defaults:
-        if tile['type'] == tile_type:
-            defaults = tile['defaults']
-            base_defaults = defaults['base_defaults']
-            for key, value in base_defaults.items():
-                if key == base_blueprint:
-                    for k, v in value.items():
-                        setattr(self, k, v)
-                    break
-            try:
-                main_part_defaults = defaults['tile_defaults']
-                for key, value in main_part_defaults.items():
-                    if key == main_part_blueprint:
-                        for k, v in value.items():
-                            setattr(self, k, v)
-                        break
-            # some tiles such as mini bases don't have a main part
-            except KeyError:
-                pass
-            try:
-                setattr(self, 'floor_material', defaults['floor_material'])
-            except KeyError:
-                break
-            break
+    tile = get_tile_type_defaults(context, tile_type)
+    if tile is None:
+        return
+
+    part_defaults = get_part_defaults(
+        context,
+        tile_type,
+        self.main_part_blueprint,
+        self.base_blueprint)
+    for key, value in part_defaults.items():
+        setattr(self, key, value)
+
+    if 'floor_material' in tile['defaults']:
+        setattr(self, 'floor_material', tile['defaults']['floor_material'])
 
 
 # TODO: Work out why this is called twice by operator
@@ -198,19 +281,16 @@ def create_material_enums(self, context):
     Returns:
         list[EnumPropertyItem]: enum items
     """
-    prefs = get_prefs()
-    enum_items = []
-
     if context is None:
-        return enum_items
+        return []
 
-    mats = prefs.default_materials
+    mats = get_prefs().default_materials
 
-    for mat in mats:
-        enum = (mat.name, mat.name, "")
-        enum_items.append(enum)
+    def build():
+        return sorted((mat.name, mat.name, "") for mat in mats)
 
-    return sorted(enum_items)
+    # cleared when default materials are added or removed. Length is a safety net
+    return get_cached_enum_items(('materials', len(mats)), build)
 
 
 def create_wall_position_enums(self, context):
@@ -222,28 +302,19 @@ def create_wall_position_enums(self, context):
     Returns:
         list[EnumPropertyItem]: enum items
     """
-    prefs = get_prefs()
-    enum_items = []
-
     if context is None:
-        return enum_items
+        return []
 
-    scene = context.scene
-    scene_props = scene.mt_scene_props
+    tile_type = context.scene.mt_scene_props.tile_type
 
-    tile_type = scene_props.tile_type
-    tile_defaults = load_tile_defaults(context)
+    def build():
+        tile = get_tile_type_defaults(context, tile_type)
+        if tile is None or 'wall_positions' not in tile:
+            return []
+        return sorted((key, value, "") for key, value in tile['wall_positions'].items())
 
-    for default in tile_defaults:
-        if default['type'] == tile_type:
-            try:
-                for key, value in default['wall_positions'].items():
-                    enum = (key, value, "")
-                    enum_items.append(enum)
-                return sorted(enum_items)
-            except KeyError:
-                pass
-    return enum_items
+    return get_cached_enum_items(
+        ('wall_positions',) + get_tile_defaults_key(context, tile_type), build)
 
 
 class MT_OT_Reset_Tile_Defaults(Operator):
@@ -492,20 +563,19 @@ class MT_Tile_Generator:
         self.reset_defaults = False
 
         scene_props = context.scene.mt_scene_props
-        all_annotations = get_annotations(self.__class__)
-        for key in scene_props.__annotations__.keys():
-            for k in all_annotations.keys():
-                try:
-                    if k == key:
-                        setattr(self, str(k), getattr(scene_props, str(k)))
-                except TypeError:
-                    pass
+        for key in get_shared_prop_names(scene_props.__class__, self.__class__):
+            try:
+                setattr(self, key, getattr(scene_props, key))
+            except TypeError:
+                pass
         self.refresh = True
         return self.execute(context)
 
     def execute(self, context):
         """Call when operator is executed."""
-        self.init(context)
+        reset_phase_timings()
+        with phase_timer('init'):
+            self.init(context)
 
     def init(self, context):
         """Initialise operator properties."""
@@ -517,33 +587,17 @@ class MT_Tile_Generator:
 
         # reset tile defaults
         if self.reset_defaults:
-            tile_defaults = load_tile_defaults(context)
-            for tile in tile_defaults:
-                if tile['type'] == tile_type:
-                    defaults = tile['defaults']
-                    for key, value in defaults.items():
-                        setattr(self, key, value)
-                    break
-            main_part_blueprint = self.main_part_blueprint
-            base_blueprint = self.base_blueprint
-            try:
-                main_part_defaults = defaults['tile_defaults']
-                for key, value in main_part_defaults.items():
-                    if key == main_part_blueprint:
-                        for k, v in value.items():
-                            setattr(self, k, v)
-                        break
-            except KeyError:
-                pass
-            try:
-                base_defaults = defaults['base_defaults']
-                for key, value in base_defaults.items():
-                    if key == base_blueprint:
-                        for k, v in value.items():
-                            setattr(self, k, v)
-                        break
-            except KeyError:
-                pass
+            tile = get_tile_type_defaults(context, tile_type)
+            if tile is not None:
+                for key, value in tile['defaults'].items():
+                    setattr(self, key, value)
+            part_defaults = get_part_defaults(
+                context,
+                tile_type,
+                self.main_part_blueprint,
+                self.base_blueprint)
+            for key, value in part_defaults.items():
+                setattr(self, key, value)
             self.reset_defaults = False
 
         # We create tile at origin and then move it back to original location.
@@ -571,9 +625,8 @@ class MT_Tile_Generator:
         # later access by the tile constructors
         tile_props = tile_collection.mt_tile_props
 
-        self_annotations = get_annotations(self.__class__)
         try:
-            copy_annotation_props(self, tile_props, self_annotations)
+            copy_annotation_props(self, tile_props)
         except TypeError as err:
             self.report({'INFO'}, str(err))
             return False
@@ -628,36 +681,40 @@ class MT_Tile_Generator:
             base (bpy.types.Object): Base to parent objects to
             *args (list of bpy.types.Object)
         """
-        # assign secondary material to base if it is a mesh
-        prefs = get_prefs()
-        if base.type == 'MESH' and prefs.secondary_material not in base.material_slots:
-            base.data.materials.append(
-                bpy.data.materials[prefs.secondary_material])
-
-        # Reset location of base
-        base.location = self.cursor_orig_loc
-        cursor = context.scene.cursor
-        cursor.location = self.cursor_orig_loc
-        cursor.rotation_euler = self.cursor_orig_rot
-
-        # Parent cores to base
-        for arg in args:
-            if arg is not None:
-                arg.parent = base
-                lock_all_transforms(arg)
-
-        # deselect any currently selected objects
-        for obj in context.selected_objects:
-            obj.select_set(False)
-
-        base.select_set(True)
-        context.view_layer.objects.active = base
+        with phase_timer('finalise'):
+            # assign secondary material to base if it is a mesh
+            prefs = get_prefs()
+            if base.type == 'MESH' and prefs.secondary_material not in base.material_slots:
+                base.data.materials.append(
+                    get_default_material(prefs.secondary_material))
 
-        if self.auto_refresh is False:
-            self.refresh = False
+            # Reset location of base
+            base.location = self.cursor_orig_loc
+            cursor = context.scene.cursor
+            cursor.location = self.cursor_orig_loc
+            cursor.rotation_euler = self.cursor_orig_rot
+
+            # Parent cores to base
+            for arg in args:
+                if arg is not None:
+                    arg.parent = base
+                    lock_all_transforms(arg)
 
-        self.invoked = False
-        self.executed = True
+            # deselect any currently selected objects
+            for obj in context.selected_objects:
+                obj.select_set(False)
+
+            base.select_set(True)
+            context.view_layer.objects.active = base
+
+            if self.auto_refresh is False:
+                self.refresh = False
+
+            self.invoked = False
+            self.executed = True
+
+        tile_props = bpy.data.collections[self.tile_name].mt_tile_props
+        record_phase_timings(tile_props)
 
     def draw(self, context):
         """Draw the Redo panel."""
@@ -678,6 +735,18 @@ class MT_Tile_Generator:
         layout.prop(self, 'reset_defaults', toggle=True, icon='LOOP_BACK')
         layout.prop(self, 'subdivision_density')
 
+        # time taken by each phase of the last generation
+        collection = bpy.data.collections.get(self.tile_name)
+        if collection is not None and len(collection.mt_tile_props.phase_timings) > 0:
+            timings = collection.mt_tile_props.phase_timings
+            box = layout.box()
+            box.label(text="Generated in {0:.3f}s".format(sum(item.value for item in timings)))
+            col = box.column(align=True)
+            for item in timings:
+                row = col.row()
+                row.label(text=item.name.capitalize())
+                row.label(text="{0:.3f}s".format(item.value))
+
 
 @multimethod(str, dict)
 def get_subdivs(density, dims):
@@ -767,11 +836,60 @@ def create_common_tile_props(scene_props, tile_props, tile_collection):
     tile_props.collection_type = "TILE"
 
 
+# property names shared by two classes keyed by (source class, target class)
+shared_prop_names = {}
+
+# merged annotations of all MT_Tile_Generator subclasses and the subclasses they came from
+generator_annotations_cache = {
+    'subclasses': None,
+    'annotations': None}
+
+
+def get_shared_prop_names(source_cls, target_cls):
+    """Return the names of properties annotated on both classes, including annotations of parent classes.
+
+    Computed once per pair of classes. Names are in the order they are annotated on source_cls.
+
+    Args:
+        source_cls (class): source class
+        target_cls (class): target class
+
+    Returns:
+        tuple[str]: property names
+    """
+    key = (source_cls, target_cls)
+    if key not in shared_prop_names:
+        # keep the order of the source annotations as setting some props triggers updates
+        target_annotations = get_annotations(target_cls)
+        shared_prop_names[key] = tuple(
+            k for k in get_annotations(source_cls) if k in target_annotations)
+    return shared_prop_names[key]
+
+
+def get_generator_annotations():
+    """Return the merged annotations of all subclasses of MT_Tile_Generator.
+
+    Only rebuilt if the set of subclasses changes.
+
+    Returns:
+        dict: annotations
+    """
+    subclasses = tuple(get_all_subclasses(MT_Tile_Generator))
+    if generator_annotations_cache['subclasses'] != subclasses:
+        annotations = {}
+        for subclass in subclasses:
+            # get_annotations includes annotations of parent classes such as mixins
+            annotations.update(get_annotations(subclass))
+        generator_annotations_cache['subclasses'] = subclasses
+        generator_annotations_cache['annotations'] = annotations
+    return generator_annotations_cache['annotations']
+
+
 def copy_annotation_props(source_props, target_props, source_annotations=None, target_annotations=None):
     """Set target_props to the value of source_props.
 
-    Props must have same names and be of same type. If you want to include annotations of parent
-    class(es) set them seperately.
+    Props must have same names and be of same type. Annotations of parent classes
+    are included unless annotations are passed in.
 
     Args:
         source_prop_group (class): Source class
@@ -779,19 +897,20 @@ def copy_annotation_props(source_props, target_props, source_annotations=None, t
         source_annotations (.__annotations__), optional: annotations to copy. Defaults to None.
         target_annotations (.__annotations__), optional: annotations to set. Defaults to None.
     """
-    if not source_annotations:
-        source_annotations = source_props.__annotations__
-    if not target_annotations:
-        target_annotations = target_props.__annotations__
+    if source_annotations or target_annotations:
+        if not source_annotations:
+            source_annotations = get_annotations(source_props.__class__)
+        if not target_annotations:
+            target_annotations = get_annotations(target_props.__class__)
+        keys = [k for k in source_annotations if k in target_annotations]
+    else:
+        keys = get_shared_prop_names(source_props.__class__, target_props.__class__)
 
-    for key in source_annotations.keys():
-        for k in target_annotations.keys():
-            if k == key:
-                try:
-                    setattr(target_props, str(k),
-                            getattr(source_props, str(k)))
-                except TypeError:
-                    pass
+    for key in keys:
+        try:
+            setattr(target_props, key, getattr(source_props, key))
+        except TypeError:
+            pass
 
 
 def lock_all_transforms(obj):
@@ -829,6 +948,7 @@ def add_subsurf_modifier(obj):
     return subsurf.name
 
 
+@timed_phase('displacement')
 def convert_to_displacement_core(core, textured_vertex_groups, material, subsurf):
     """Convert the core part of an object so it can be used by the MakeTile dispacement system.
 
@@ -845,8 +965,8 @@ def convert_to_displacement_core(core, textured_vertex_groups, material, subsurf
     prefs = get_prefs()
     props = core.mt_object_props
     scene_props = scene.mt_scene_props
-    prim_mat = bpy.data.materials[material]
-    sec_mat = bpy.data.materials[prefs.secondary_material]
+    prim_mat = get_default_material(material)
+    sec_mat = get_default_material(prefs.secondary_material)
 
     # check if we need to append primary material
     if prefs.default_mat_behaviour == 'APPEND' and prim_mat.library:
@@ -920,36 +1040,45 @@ def spawn_empty_base(tile_props):
     return base
 
 
-def spawn_prefab(context, subclasses, blueprint, mt_type, **kwargs):
+# plain python builders for prefab parts keyed by (mt_type, mt_blueprint)
+prefab_builders = {}
+
+
+def register_prefab_builder(mt_type, mt_blueprint, builder):
+    """Register a function that builds a prefab part such as a base or tile core.
+
+    Builders are called directly rather than through bpy.ops, so composite
+    tiles can assemble their parts without nested operator calls or extra undo steps.
+
+    Args:
+        mt_type (str): mt_type enum item e.g. 'TRIANGULAR_BASE'
+        mt_blueprint (str): mt_blueprint enum item e.g. 'OPENLOCK'
+        builder (function): function taking (generator, tile_props, base) and
+            returning the new object or None
+    """
+    prefab_builders[mt_type, mt_blueprint] = builder
+
+
+def spawn_prefab(context, generator, tile_props, mt_type, blueprint, base=None):
     """Spawn a maketile prefab such as a base or tile core(s).
 
     Args:
         context (bpy.context): Blender context
-        subclasses (list): list of all subclasses of MT_Tile_Generator
+        generator (MT_Tile_Generator): tile generator whose properties the prefab uses
+        tile_props (MakeTile.properties.MT_Tile_Properties): tile properties
+        mt_type (str): mt_type enum item
         blueprint (str): mt_blueprint enum item
-        type (str): mt_type enum item
-        **kwargs (dict): Arguments to pass to operator
+        base (bpy.types.Object, optional): base the prefab is built on. Defaults to None.
+
+    Raises:
+        KeyError: if no builder is registered for mt_type and blueprint
 
     Returns:
         bpy.types.Object: Prefab
     """
-    args = []
-    for key, value in kwargs.items():
-        if isinstance(value, str):
-            value = "\"" + value + "\""
-        args.append(key + '=' + str(value))
-    arg_str = ', '.join(args)
-
-    # ensure we can only run bpy.ops in our eval statements
-    allowed_names = {k: v for k, v in bpy.__dict__.items() if k == 'ops'}
-    for subclass in subclasses:
-        if hasattr(subclass, 'mt_type') and hasattr(subclass, 'mt_blueprint'):
-            if subclass.mt_type == mt_type and subclass.mt_blueprint == blueprint:
-                eval_str = 'ops.' + subclass.bl_idname + '(' + arg_str + ')'
-                eval(eval_str, {"__builtins__": {}}, allowed_names)
-
-    prefab = context.active_object
-    return prefab
+    builder = prefab_builders[mt_type, blueprint]
+    with phase_timer('base' if base is None else 'core'):
+        return builder(generator, tile_props, base)
 
 
 def load_openlock_top_peg(tile_props):
@@ -983,6 +1112,7 @@ def load_openlock_top_peg(tile_props):
 # TODO: #3 Fix bug where toggling booleans in UI doesn't work if core or base have been renamed
 
 
+@timed_phase('booleans')
 def set_bool_obj_props(bool_obj, parent_obj, tile_props, bool_type):
     """Set properties for boolean object used for e.g. clip cutters.
 
@@ -1009,6 +1139,7 @@ def set_bool_obj_props(bool_obj, parent_obj, tile_props, bool_type):
     bool_obj.mt_object_props.tile_name = tile_props.tile_name
 
 
+@timed_phase('booleans')
 def set_bool_props(bool_obj, target_obj, bool_type, solver='FAST'):
     """Set Properties for boolean and add bool to target_object's cutters collection.
 
@@ -1033,3 +1164,8 @@ def set_bool_props(bool_obj, target_obj, bool_type, solver='FAST'):
     cutter_coll_item.value = True
     # bpy.context.view_layer.update()
     cutter_coll_item.parent = target_obj.name
+
+
+def register():
+    # generators may have been added or reloaded
+    clear_enum_items_cache()
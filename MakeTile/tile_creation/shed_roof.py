@@ -23,6 +23,7 @@ from ..lib.bmturtle.helpers import (
     bm_deselect_all,
     assign_verts_to_group,
     select_verts_in_bounds,
+    get_bmesh_coord_index,
     points_are_inside_bmesh)
 
 from ..lib.bmturtle.scripts import draw_cuboid
@@ -287,6 +288,8 @@ def draw_shed_base(self, tile_props, margin=0.001):
     bm_deselect_all(bm)
     turtle.location = draw_origin
 
+    coord_index = get_bmesh_coord_index(bm)
+
     # Left side
     left_verts = select_verts_in_bounds(
         lbound=(
@@ -298,7 +301,8 @@ def draw_shed_base(self, tile_props, margin=0.001):
             peak_loc[1] + base_dims[1],
             peak_loc[2] - margin),
         buffer=margin / 2,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     assign_verts_to_group(left_verts, obj, deform_groups, "Base Left")
     bm_deselect_all(bm)
@@ -314,7 +318,8 @@ def draw_shed_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             turtle.location[2] + base_dims[2] - margin / 2),
         buffer=margin / 3,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
 
     assign_verts_to_group(right_verts, obj, deform_groups, "Base Right")
     bm_deselect_all(bm)
@@ -330,7 +335,8 @@ def draw_shed_base(self, tile_props, margin=0.001):
             turtle.location[1] + base_dims[1],
             turtle.location[2]),
         buffer=margin / 3,
-        bm=bm)
+        bm=bm,
+        index=coord_index)
     assign_verts_to_group(bottom_verts, obj, deform_groups, "Bottom")
     bm_deselect_all(bm)
 
@@ -1,7 +1,7 @@
 import bpy
 from bpy.types import Panel
 from bpy.props import BoolProperty, EnumProperty
-from ..app_handlers import load_tile_defaults
+from ..app_handlers import get_tile_type_defaults
 
 # TODO create a Layout Mode, Preview Mode switch. Add in a triangulate modifier that can be switched on and off for layout mode.
 # Layout mode should also switch everything to 0 subdivision layers and to solid shading
@@ -31,13 +31,9 @@ class MT_PT_Tile_Generator_Panel(Panel):
         layout.prop(scene_props, 'subdivisions')
 
         # Display the appropriate operator based on tile_type
-        tile_type = scene_props.tile_type
-        #tile_defaults = scene_props['tile_defaults']
-        tile_defaults = load_tile_defaults(context)
-
-        for default in tile_defaults:
-            if default['type'] == tile_type:
-                layout.operator(default['bl_idname'], text="MakeTile")
+        tile = get_tile_type_defaults(context, scene_props.tile_type)
+        if tile is not None:
+            layout.operator(tile['bl_idname'], text="MakeTile")
 
         if obj is not None and obj.type == 'MESH':
             #if obj.mt_object_props.geometry_type == 'PREVIEW':
@@ -107,6 +103,7 @@ class MT_PT_Converter_Panel(Panel):
 
         layout.label(text="Convert Object")
         layout.prop(scene_props, 'converter_material')
+        layout.prop(scene_props, 'converter_uv_projection')
         layout.operator('object.convert_to_make_tile', text='Convert to MakeTile Object')
 
         layout.label(text="Flatten Object")
@@ -0,0 +1,39 @@
+from bpy.types import Panel
+from ..utils.registration import get_prefs
+from ..lib.utils.profile import latest_profile
+
+
+class MT_PT_Profiling_Panel(Panel):
+    bl_order = 5
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Make Tile"
+    bl_idname = "MT_PT_Profiling_Panel"
+    bl_label = "Profiling"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return get_prefs().profile_operators
+
+    def draw(self, context):
+        layout = self.layout
+
+        if latest_profile['operator'] is None:
+            layout.label(text="Run an operator to profile it")
+            return
+
+        layout.label(text=latest_profile['operator'])
+        layout.label(text="Total: {0:.3f}s".format(latest_profile['total_time']))
+        layout.label(text=latest_profile['path'])
+
+        col = layout.column(align=True)
+        row = col.row()
+        row.label(text="Function")
+        row.label(text="Calls")
+        row.label(text="Cumulative")
+        for name, calls, tottime, cumtime in latest_profile['entries']:
+            row = col.row()
+            row.label(text=name)
+            row.label(text=str(calls))
+            row.label(text="{0:.3f}s".format(cumtime))
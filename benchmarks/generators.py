@@ -0,0 +1,146 @@
+"""Benchmark cases for the MakeTile tile generators.
+
+Each generator is swept over its sizes, subdivision densities and blueprints.
+The bmesh turtle base generators are called directly and swept over their sizes.
+"""
+import itertools
+
+SUBDIVISION_DENSITIES = ['LOW', 'MEDIUM', 'HIGH']
+
+OPENLOCK_AND_PLAIN = [('OPENLOCK', 'OPENLOCK'), ('PLAIN', 'PLAIN')]
+
+# name, scene tile type, operator, (main_part_blueprint, base_blueprint) pairs, sizes
+GENERATORS = [
+    {
+        'name': 'straight_wall',
+        'tile_type': 'STRAIGHT_WALL',
+        'operator': 'make_straight_wall',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'tile_x': 1, 'base_x': 1},
+            'LARGE': {'tile_x': 6, 'base_x': 6}}},
+    {
+        'name': 'rect_floor',
+        'tile_type': 'RECT_FLOOR',
+        'operator': 'make_rect_floor',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'tile_x': 2, 'tile_y': 2, 'base_x': 2, 'base_y': 2},
+            'LARGE': {'tile_x': 6, 'tile_y': 6, 'base_x': 6, 'base_y': 6}}},
+    {
+        'name': 'l_wall',
+        'tile_type': 'L_WALL',
+        'operator': 'make_l_wall_tile',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'leg_1_len': 2, 'leg_2_len': 2},
+            'LARGE': {'leg_1_len': 6, 'leg_2_len': 6}}},
+    {
+        'name': 'u_wall',
+        'tile_type': 'U_WALL',
+        'operator': 'make_u_wall',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'tile_x': 2, 'leg_1_len': 2, 'leg_2_len': 2},
+            'LARGE': {'tile_x': 6, 'leg_1_len': 6, 'leg_2_len': 6}}},
+    {
+        'name': 'curved_wall',
+        'tile_type': 'CURVED_WALL',
+        'operator': 'make_curved_wall',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'base_radius': 2, 'degrees_of_arc': 90},
+            'LARGE': {'base_radius': 6, 'degrees_of_arc': 90}}},
+    {
+        'name': 'semi_circ_floor',
+        'tile_type': 'SEMI_CIRC_FLOOR',
+        'operator': 'make_semi_circ_floor',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'base_radius': 2},
+            'LARGE': {'base_radius': 6}}},
+    {
+        'name': 'triangular_floor',
+        'tile_type': 'TRIANGULAR_FLOOR',
+        'operator': 'make_triangular_floor',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'leg_1_len': 2, 'leg_2_len': 2},
+            'LARGE': {'leg_1_len': 6, 'leg_2_len': 6}}},
+    {
+        'name': 'connecting_column',
+        'tile_type': 'CONNECTING_COLUMN',
+        'operator': 'make_connecting_column',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'tile_z': 2},
+            'LARGE': {'tile_z': 6}}},
+    {
+        'name': 'mini_base',
+        'tile_type': 'MINI_BASE',
+        'operator': 'make_mini_base',
+        'blueprints': [(None, 'RECT'), (None, 'ROUND')],
+        'sizes': {
+            'SMALL': {'base_diameter': 1},
+            'LARGE': {'base_diameter': 4}}},
+    {
+        'name': 'roof',
+        'tile_type': 'ROOF',
+        'operator': 'make_roof',
+        'blueprints': OPENLOCK_AND_PLAIN,
+        'sizes': {
+            'SMALL': {'base_x': 2, 'base_y': 2},
+            'LARGE': {'base_x': 6, 'base_y': 6}}}]
+
+# name, bmturtle.scripts function, positional args for each size
+BASE_GENERATORS = [
+    {
+        'name': 'base_cuboid',
+        'function': 'draw_cuboid',
+        'sizes': {
+            'SMALL': ((2, 2, 0.2755),),
+            'LARGE': ((6, 6, 0.2755),)}},
+    {
+        'name': 'base_tri_prism',
+        'function': 'draw_tri_prism',
+        'sizes': {
+            'SMALL': ({'b': 2, 'c': 2, 'A': 90, 'height': 0.2755},),
+            'LARGE': ({'b': 6, 'c': 6, 'A': 90, 'height': 0.2755},)}},
+    {
+        'name': 'base_tri_slot_cutter',
+        'function': 'draw_tri_slot_cutter',
+        'sizes': {
+            'SMALL': ({'b': 2, 'c': 2, 'A': 90},),
+            'LARGE': ({'b': 6, 'c': 6, 'A': 90},)}}]
+
+
+def get_cases(name_filter=None):
+    """Return every benchmark case.
+
+    Args:
+        name_filter (str, optional): only return cases whose generator name contains this. Defaults to None.
+
+    Returns:
+        list[dict]: cases with a unique key, the generator and the operator kwargs or function args
+    """
+    cases = []
+    for generator in GENERATORS:
+        if name_filter and name_filter not in generator['name']:
+            continue
+        for (size, size_kwargs), density, (main, base) in itertools.product(
+                generator['sizes'].items(),
+                SUBDIVISION_DENSITIES,
+                generator['blueprints']):
+            kwargs = dict(size_kwargs, refresh=True, subdivision_density=density)
+            if main is not None:
+                kwargs['main_part_blueprint'] = main
+            kwargs['base_blueprint'] = base
+            key = '/'.join((generator['name'], size, density, main or '-', base))
+            cases.append({'key': key, 'generator': generator, 'kwargs': kwargs})
+    for generator in BASE_GENERATORS:
+        if name_filter and name_filter not in generator['name']:
+            continue
+        for size, args in generator['sizes'].items():
+            key = '/'.join((generator['name'], size))
+            cases.append({'key': key, 'generator': generator, 'args': args})
+    return cases
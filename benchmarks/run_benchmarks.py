@@ -0,0 +1,243 @@
+"""Benchmark the MakeTile tile generators in background Blender.
+
+Run from the repository root with MakeTile installed and enabled:
+
+    blender -b --python benchmarks/run_benchmarks.py -- [options]
+
+Options:
+    --output PATH       where to write results. Defaults to bench_output.json
+    --baseline PATH     baseline to compare against. Defaults to benchmarks/baseline.json
+    --update-baseline   save the results as the new baseline
+    --threshold FLOAT   allowed slowdown as a fraction of the baseline time. Defaults to 0.25
+    --repeat INT        runs per case, the fastest is recorded. Defaults to 1
+    --filter STR        only run generators whose name contains STR
+
+Exits with 1 if any case is slower than the baseline by more than the threshold.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generators import get_cases  # noqa: E402
+from MakeTile.lib.bmturtle import scripts as bmturtle_scripts  # noqa: E402
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_OUTPUT = 'bench_output.json'
+
+# differences smaller than this are treated as noise
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def get_rss():
+    """Return the current resident set size of this process in MB, or None if unavailable.
+
+    ru_maxrss only ever grows over the run, so it can't be attributed to a case.
+    Where /proc isn't available this falls back to it anyway.
+
+    Returns:
+        float: rss
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak / 1024 ** 2
+    return peak / 1024
+
+
+def reset_scene():
+    """Load an empty scene and purge any data left by the previous case."""
+    bpy.ops.wm.read_homefile(use_empty=True)
+    bpy.ops.outliner.orphans_purge(do_recursive=True)
+
+
+def count_geometry():
+    """Return the number of vertices and faces of all meshes in the scene.
+
+    Returns:
+        tuple(int, int): vertices, faces
+    """
+    verts = 0
+    faces = 0
+    for obj in bpy.context.scene.objects:
+        if obj.type == 'MESH':
+            verts += len(obj.data.vertices)
+            faces += len(obj.data.polygons)
+    return verts, faces
+
+
+def get_rss_delta(rss_before):
+    """Return the change in rss since rss_before in MB, or None if unavailable.
+
+    Args:
+        rss_before (float): rss in MB
+
+    Returns:
+        float: change in rss
+    """
+    rss_after = get_rss()
+    if rss_before is None or rss_after is None:
+        return None
+    return rss_after - rss_before
+
+
+def run_case(case, repeat):
+    """Run a benchmark case and return its result.
+
+    Args:
+        case (dict): case returned by get_cases
+        repeat (int): number of runs, the fastest is recorded
+
+    Returns:
+        dict: result
+    """
+    generator = case['generator']
+    times = []
+    result = {}
+    rss_deltas = []
+    for _ in range(repeat):
+        reset_scene()
+        rss_before = get_rss()
+        if 'function' in generator:
+            function = getattr(bmturtle_scripts, generator['function'])
+            start = time.perf_counter()
+            try:
+                function(*case['args'])
+            except (RuntimeError, TypeError, ValueError) as err:
+                return {'error': str(err)}
+            times.append(time.perf_counter() - start)
+            rss_deltas.append(get_rss_delta(rss_before))
+            continue
+
+        operator = getattr(bpy.ops.object, generator['operator'])
+        bpy.context.scene.mt_scene_props.tile_type = generator['tile_type']
+        start = time.perf_counter()
+        try:
+            ret = operator(**case['kwargs'])
+        except (RuntimeError, TypeError) as err:
+            return {'error': str(err)}
+        times.append(time.perf_counter() - start)
+        rss_deltas.append(get_rss_delta(rss_before))
+        if ret != {'FINISHED'}:
+            return {'error': 'operator returned ' + str(ret)}
+
+    verts, faces = count_geometry()
+    result['time'] = round(min(times), 4)
+    result['verts'] = verts
+    result['faces'] = faces
+    result['rss_mb'] = get_rss()
+    result['rss_delta_mb'] = None if None in rss_deltas else round(min(rss_deltas), 2)
+    return result
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """Compare results with a baseline.
+
+    Args:
+        results (dict): results keyed by case
+        baseline (dict): baseline results keyed by case
+        threshold (float): allowed slowdown as a fraction of the baseline time
+
+    Returns:
+        tuple(list[str], list[str]): regressions, geometry changes
+    """
+    regressions = []
+    changes = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or 'time' not in base:
+            continue
+        if 'error' in result:
+            regressions.append('{0}: failed with {1}'.format(key, result['error']))
+            continue
+        slowdown = result['time'] - base['time']
+        if slowdown > MIN_REGRESSION_SECONDS and result['time'] > base['time'] * (1 + threshold):
+            regressions.append('{0}: {1:.3f}s -> {2:.3f}s (+{3:.0%})'.format(
+                key, base['time'], result['time'], slowdown / base['time']))
+        if (result['verts'], result['faces']) != (base['verts'], base['faces']):
+            changes.append('{0}: {1}/{2} -> {3}/{4} verts/faces'.format(
+                key, base['verts'], base['faces'], result['verts'], result['faces']))
+    return regressions, changes
+
+
+def load_json(path):
+    """Return the contents of a json file, or None if it doesn't exist."""
+    if os.path.exists(path):
+        with open(path) as json_file:
+            return json.load(json_file)
+    return None
+
+
+def save_json(path, data):
+    """Write data to a json file."""
+    with open(path, 'w') as json_file:
+        json.dump(data, json_file, indent=4, sort_keys=True)
+
+
+def parse_args():
+    """Parse the arguments passed after -- on the Blender command line."""
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(prog='run_benchmarks.py')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--threshold', type=float, default=0.25)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--filter', default=None)
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    cases = get_cases(args.filter)
+    results = {}
+    for i, case in enumerate(cases):
+        result = run_case(case, max(args.repeat, 1))
+        results[case['key']] = result
+        print('[{0}/{1}] {2}: {3}'.format(i + 1, len(cases), case['key'], result))
+
+    report = {
+        'blender': bpy.app.version_string,
+        'platform': platform.platform(),
+        'results': results}
+    save_json(args.output, report)
+    print('Results written to ' + args.output)
+
+    if args.update_baseline:
+        save_json(args.baseline, report)
+        print('Baseline written to ' + args.baseline)
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        print('No baseline found at ' + args.baseline + '. Run with --update-baseline to create one.')
+        return 0
+
+    regressions, changes = compare_to_baseline(results, baseline['results'], args.threshold)
+    for change in changes:
+        print('Geometry changed: ' + change)
+    for regression in regressions:
+        print('Regression: ' + regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+from math import sqrt
+import pytest
+import bmesh
+import bpy
+from MakeTile.lib.bmturtle.scripts import (
+    draw_cuboid,
+    draw_tri_prism,
+    draw_tri_slot_cutter)
+
+# openlock base dimensions used by the removed bpy.ops.turtle scripts
+LEGACY_OUTER_W = 0.2362
+LEGACY_SLOT_W = 0.1811
+LEGACY_SLOT_H = 0.2402
+
+# Output of the removed scripts for a 2 x 1 x 0.3 rectangular base and a
+# b = c = 2, A = 90 triangular base, recorded from their turtle moves.
+# Vertex counts are for the outer shell and for the slot ring, which the
+# bmesh turtle draws as separate objects and joins with a boolean.
+# The legacy rectangular base was mirrored about its centre so its bounds
+# are offset by half its size from draw_cuboid's.
+LEGACY_BASES = {
+    'cuboid': {
+        'verts': 8,
+        'bounds': ((-1, -0.5, 0), (1, 0.5, 0.3)),
+        'offset': (1, 0.5, 0)},
+    'tri_prism': {
+        'verts': 6,
+        'bounds': ((0, 0, 0), (2, 2, 0.2755)),
+        'offset': (0, 0, 0)},
+    'tri_slot': {
+        'verts': 12,
+        'bounds': (
+            (LEGACY_OUTER_W, LEGACY_OUTER_W, 0),
+            (2 - LEGACY_OUTER_W * (1 + sqrt(2)), 2 - LEGACY_OUTER_W * (1 + sqrt(2)), LEGACY_SLOT_H)),
+        'offset': (0, 0, 0)}}
+
+
+@pytest.fixture
+def reset_cursor():
+    cursor = bpy.context.scene.cursor
+    cursor.location = (0, 0, 0)
+    cursor.rotation_euler = (0, 0, 0)
+
+
+def is_closed_manifold(obj):
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    manifold = all(e.is_manifold for e in bm.edges)
+    bm.free()
+    return manifold
+
+
+def get_bounds(obj):
+    coords = [obj.matrix_world @ v.co for v in obj.data.vertices]
+    return (
+        tuple(min(co[i] for co in coords) for i in range(3)),
+        tuple(max(co[i] for co in coords) for i in range(3)))
+
+
+def assert_matches_legacy(obj, name, abs_tol):
+    legacy = LEGACY_BASES[name]
+    lbound, ubound = get_bounds(obj)
+    offset = legacy['offset']
+    assert len(obj.data.vertices) == legacy['verts']
+    assert [b - o for b, o in zip(lbound, offset)] == pytest.approx(legacy['bounds'][0], abs=abs_tol)
+    assert [b - o for b, o in zip(ubound, offset)] == pytest.approx(legacy['bounds'][1], abs=abs_tol)
+
+
+def test_bases_match_legacy_bounds(reset_cursor):
+    assert_matches_legacy(draw_cuboid((2, 1, 0.3)), 'cuboid', 0.0001)
+    assert_matches_legacy(
+        draw_tri_prism({'b': 2, 'c': 2, 'A': 90, 'height': 0.2755}),
+        'tri_prism',
+        0.0001)
+    # the slot cutter is drawn slightly oversize and starts just below the base
+    assert_matches_legacy(draw_tri_slot_cutter({'b': 2, 'c': 2, 'A': 90}), 'tri_slot', 0.01)
+
+
+def test_draw_cuboid(reset_cursor):
+    obj = draw_cuboid((2, 1, 0.3))
+    assert tuple(round(d, 4) for d in obj.dimensions) == (2, 1, 0.3)
+    assert is_closed_manifold(obj)
+
+
+def test_draw_tri_prism(reset_cursor):
+    obj, dimensions = draw_tri_prism(
+        {'b': 2, 'c': 2, 'A': 90, 'height': 0.2755}, True)
+    assert dimensions['a'] == pytest.approx(2 * 2 ** 0.5)
+    assert obj.dimensions[2] == pytest.approx(0.2755)
+    assert len(obj.data.vertices) == 6
+    assert is_closed_manifold(obj)
+
+
+def test_tri_slot_cutter_matches_legacy_base(reset_cursor):
+    obj = draw_tri_slot_cutter({'b': 2, 'c': 2, 'A': 90})
+    xs = sorted({round(v.co[0], 3) for v in obj.data.vertices})
+    zs = [v.co[2] for v in obj.data.vertices]
+
+    assert is_closed_manifold(obj)
+    assert xs[0] == pytest.approx(LEGACY_OUTER_W, abs=0.005)
+    assert xs[1] == pytest.approx(LEGACY_OUTER_W + LEGACY_SLOT_W, abs=0.01)
+    assert max(zs) - min(zs) == pytest.approx(LEGACY_SLOT_H, abs=0.005)
@@ -0,0 +1,76 @@
+import numpy as np
+import bmesh
+import bpy
+from MakeTile.operators.displacer import (
+    sample_image_bilinear,
+    apply_displacement)
+from MakeTile.lib.utils.vertex_groups import get_vert_group_mask
+
+
+def test_sample_image_bilinear_constant():
+    pixels = np.full((4, 4, 4), 0.5, dtype=np.float32)
+    uvs = np.array([[0, 0], [0.3, 0.7], [1.2, -0.4]], dtype=np.float32)
+    assert np.allclose(sample_image_bilinear(pixels, uvs), 0.5)
+
+
+def test_sample_image_bilinear_interpolates():
+    pixels = np.zeros((1, 2, 4), dtype=np.float32)
+    pixels[0, 1, :3] = 1
+    # halfway between pixel centres
+    uvs = np.array([[0.5, 0.5]], dtype=np.float32)
+    assert np.allclose(sample_image_bilinear(pixels, uvs), 0.5)
+
+
+def add_top_vert_group(obj):
+    group = obj.vertex_groups.new(name='disp_mod_vert_group')
+    top = [v.index for v in obj.data.vertices if v.co.z > 0]
+    group.add(top, 1, 'ADD')
+    return group, top
+
+
+def test_get_vert_group_mask(cube):
+    group, top = add_top_vert_group(cube)
+    mesh = cube.data.copy()
+    mask = get_vert_group_mask(mesh, group.index)
+    assert sorted(np.flatnonzero(mask)) == sorted(top)
+    bpy.data.meshes.remove(mesh)
+
+
+def test_apply_displacement(cube):
+    group, top = add_top_vert_group(cube)
+    mesh = cube.data.copy()
+    mesh.uv_layers.new()
+    image = bpy.data.images.new('mt_displacement_test', width=4, height=4, float_buffer=True)
+    image.pixels.foreach_set(np.ones(4 * 4 * 4, dtype=np.float32))
+
+    num_displaced = apply_displacement(mesh, image, 0.1, 0, group.index)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape((-1, 3))
+    assert num_displaced == len(top)
+    # top vertices move out along their normals, the bottom stays put
+    assert np.all(co[top, 2] > 0.5)
+    bottom = np.setdiff1d(np.arange(len(co)), top)
+    assert np.allclose(co[bottom, 2], -0.5)
+    bpy.data.meshes.remove(mesh)
+    bpy.data.images.remove(image)
+
+
+def test_subdivided_boundary_has_no_ngons(cube):
+    group, top = add_top_vert_group(cube)
+    mesh = cube.data.copy()
+    mesh.uv_layers.new()
+    image = bpy.data.images.new('mt_displacement_test', width=4, height=4, float_buffer=True)
+
+    apply_displacement(mesh, image, 0.1, 1, group.index)
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    assert max(len(f.verts) for f in bm.faces) <= 4
+    assert all(e.is_manifold for e in bm.edges)
+    # the top face is split into a 2 x 2 grid
+    assert len([f for f in bm.faces if f.calc_center_median().z > 0.49]) == 4
+    bm.free()
+    bpy.data.meshes.remove(mesh)
+    bpy.data.images.remove(image)
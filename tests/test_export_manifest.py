@@ -0,0 +1,67 @@
+import bpy
+from MakeTile.operators.export_manifest import (
+    hash_data,
+    get_mesh_hash,
+    get_object_settings,
+    EXPORT_OPTIONS,
+    get_variant_seed,
+    get_variant_hash,
+    load_manifest,
+    save_manifest,
+    add_to_manifest,
+    is_exported)
+
+
+def test_hash_data_ignores_key_order():
+    assert hash_data({'a': 1, 'b': 2}) == hash_data({'b': 2, 'a': 1})
+
+
+def test_variant_seed_deterministic():
+    seed = get_variant_seed('abc', 1)
+    assert seed == get_variant_seed('abc', 1)
+    assert seed != get_variant_seed('abc', 2)
+    assert 0 <= seed <= 1000
+
+
+def test_manifest_round_trip(tmp_path):
+    manifest = load_manifest(str(tmp_path))
+    assert manifest == {}
+    variant_hash = get_variant_hash('abc', [1.0])
+    filename = 'tile.' + variant_hash[:16] + '.stl'
+    add_to_manifest(manifest, variant_hash, filename, 'tile', 0)
+    save_manifest(str(tmp_path), manifest)
+    manifest = load_manifest(str(tmp_path))
+    assert not is_exported(str(tmp_path), manifest, variant_hash)
+    (tmp_path / filename).write_text('solid')
+    assert is_exported(str(tmp_path), manifest, variant_hash)
+
+
+def test_mesh_hash_sees_interior_edits(cube):
+    orig_hash = get_mesh_hash(cube.data)
+    assert orig_hash == get_mesh_hash(cube.data)
+    # an edit that keeps the vertex count and bounds the same
+    cube.data.vertices[0].co *= 0.5
+    assert get_mesh_hash(cube.data) != orig_hash
+
+
+def test_object_settings_see_cutters(cube):
+    cutter = bpy.data.objects.new('test_cutter', cube.data.copy())
+    bpy.context.layer_collection.collection.objects.link(cutter)
+    boolean = cube.modifiers.new('test_cutter.bool', 'BOOLEAN')
+    boolean.object = cutter
+    orig_hash = hash_data(get_object_settings(cube))
+    assert orig_hash == hash_data(get_object_settings(cube))
+
+    # moving the cutter changes the exported geometry
+    cutter.location = (0.25, 0, 0)
+    bpy.context.view_layer.update()
+    moved_hash = hash_data(get_object_settings(cube))
+    assert moved_hash != orig_hash
+
+    boolean.operation = 'UNION'
+    assert hash_data(get_object_settings(cube)) != moved_hash
+
+
+def test_memory_budgets_not_in_export_options():
+    for key in ('bake_memory_budget', 'memory_budget', 'memory_budget_action'):
+        assert key not in EXPORT_OPTIONS
@@ -1,5 +1,9 @@
 import pytest
 import bpy
+from MakeTile.operators.bakedisplacement import (
+    group_by_tile,
+    estimate_bake_bytes,
+    BAKE_MARGIN)
 
 
 def test_MT_OT_Make_3D(straight_wall):
@@ -9,3 +13,28 @@ def test_MT_OT_Make_3D(straight_wall):
         'selected_objects': [core]}
     op = bpy.ops.scene.mt_make_3d(ctx)
     assert op == {'FINISHED'}
+
+
+def test_group_by_tile(straight_wall, cube):
+    core = bpy.data.objects['straight_wall.wall_core']
+    base = bpy.data.objects['straight_wall.base']
+    groups = group_by_tile([core, cube, base])
+    assert sorted(len(group) for group in groups) == [1, 2]
+    assert [cube] in groups
+
+
+def test_estimate_atlas_bake_bytes(cube):
+    props = bpy.context.scene.mt_scene_props
+    props.bake_resolution_mode = 'FIXED'
+    props.tile_resolution = 512
+    other = bpy.data.objects.new('other_cube', cube.data.copy())
+
+    required, limited = estimate_bake_bytes([cube, other], atlas=True)
+
+    # two cells side by side in an 8 bit atlas, read back as floats, then split
+    cell_res = 512 + 2 * BAKE_MARGIN
+    atlas_pixels = cell_res * 2 * cell_res
+    assert limited == atlas_pixels * 4
+    assert required == atlas_pixels * 4 + atlas_pixels * 16 + 2 * 512 * 512 * 4
+    # estimating doesn't unwrap the meshes
+    assert len(cube.data.uv_layers) == 0
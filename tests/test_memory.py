@@ -0,0 +1,51 @@
+import bpy
+from MakeTile.lib.utils.memory import (
+    memory_report,
+    get_rss,
+    get_memory_snapshot,
+    get_memory_delta,
+    get_image_memory,
+    reset_memory_report,
+    track_memory,
+    format_bytes)
+from MakeTile.operators.bakedisplacement import get_memory_budget
+
+
+def test_format_bytes():
+    assert format_bytes(512) == '512.0B'
+    assert format_bytes(3 * 1024 ** 2) == '3.0MB'
+    assert format_bytes(-2048) == '-2.0KB'
+    assert format_bytes(None) == 'n/a'
+
+
+def test_image_memory():
+    image = bpy.data.images.new('mt_memory_test', width=64, height=64, float_buffer=True)
+    memory = get_image_memory([image])
+    assert memory['images'] == 1
+    assert memory['image_bytes'] == 64 * 64 * 4 * 4
+    bpy.data.images.remove(image)
+
+
+def test_track_memory(cube):
+    reset_memory_report()
+    with track_memory('add image'):
+        image = bpy.data.images.new('mt_memory_test', width=128, height=128)
+    stage = memory_report['stages'][-1]
+    assert stage['stage'] == 'add image'
+    delta = get_memory_delta(stage['before'], stage['after'])
+    assert delta['images'] == 1
+    assert delta['image_bytes'] == 128 * 128 * 4
+    assert stage['after']['loops'] >= len(cube.data.loops)
+    bpy.data.images.remove(image)
+
+
+def test_memory_report_operator():
+    assert bpy.ops.scene.mt_memory_report() == {'FINISHED'}
+    assert memory_report['snapshot'].keys() == get_memory_snapshot().keys()
+    assert get_rss() is None or get_rss() > 0
+
+
+def test_memory_budget():
+    assert get_memory_budget(0) is None
+    assert get_memory_budget(-1) is None
+    assert get_memory_budget(2) == 2 * 1024 * 1024
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from MakeTile.lib.utils.mesh_analysis import (
+    get_component_labels,
+    get_inverted_part_count,
+    get_loose_part_count,
+    get_signed_volume,
+    get_stl_size)
+
+
+@pytest.fixture
+def tetrahedron():
+    co = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float64)
+    tris = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    return co, tris
+
+
+def test_signed_volume(tetrahedron):
+    co, tris = tetrahedron
+    assert get_signed_volume(co, tris) == pytest.approx(1 / 6)
+    assert get_signed_volume(co, tris[:, ::-1]) == pytest.approx(-1 / 6)
+
+
+def test_component_labels():
+    edges = np.array([[0, 1], [1, 2], [3, 4]])
+    labels = get_component_labels(6, edges)
+    assert len(np.unique(labels)) == 3
+    assert labels[0] == labels[2]
+    assert labels[0] != labels[3]
+
+
+def test_stl_size():
+    assert get_stl_size(0) == 84
+    assert get_stl_size(10) == 584
+
+
+def test_inverted_part_count(tetrahedron):
+    co, tris = tetrahedron
+    # a second tetrahedron moved along x with its normals flipped
+    co = np.vstack((co, co + (2, 0, 0)))
+    tris = np.vstack((tris, tris[:, ::-1] + 4))
+    edge_verts = np.array([[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]])
+    edge_verts = np.vstack((edge_verts, edge_verts + 4))
+    labels = get_component_labels(len(co), edge_verts)
+    face_counts = np.full(len(edge_verts), 2)
+    assert get_loose_part_count(labels, edge_verts) == 2
+    assert get_inverted_part_count(co, tris, edge_verts, labels, face_counts) == 1
+    # open parts are skipped
+    face_counts[-1] = 1
+    assert get_inverted_part_count(co, tris, edge_verts, labels, face_counts) == 0
@@ -2,4 +2,12 @@ import pytest
 import bpy
 
 def test_MT_OT_Convert_To_MT_Obj(cube):
-    assert bpy.ops.object.convert_to_make_tile() == {'FINISHED'}
\ No newline at end of file
+    assert bpy.ops.object.convert_to_make_tile() == {'FINISHED'}
+
+
+def test_MT_OT_Convert_To_MT_Obj_box_projection(cube):
+    cube.vertex_groups.new(name='Textured')
+    assert bpy.ops.object.convert_to_make_tile(uv_projection='BOX') == {'FINISHED'}
+    assert cube.vertex_groups[0].name == 'All'
+    assert 'Textured' in cube.vertex_groups
+    assert len(cube.data.uv_layers) == 1
@@ -0,0 +1,32 @@
+from MakeTile.lib.utils.profile import is_run_finished, profile_operator_method
+
+
+def test_modal_run_lasts_until_finished():
+    assert not is_run_finished('invoke', {'RUNNING_MODAL'})
+    assert not is_run_finished('modal', {'RUNNING_MODAL'})
+    assert not is_run_finished('modal', {'PASS_THROUGH'})
+    assert is_run_finished('modal', {'FINISHED'})
+    assert is_run_finished('modal', {'CANCELLED'})
+    assert is_run_finished('cancel', None)
+
+
+def test_non_modal_run_ends_after_call():
+    assert is_run_finished('execute', {'FINISHED'})
+    assert is_run_finished('execute', {'PASS_THROUGH'})
+    assert is_run_finished('invoke', {'CANCELLED'})
+    # the method raised
+    assert is_run_finished('execute', None)
+
+
+def test_wrappers_keep_argument_count():
+    # Blender refuses to register operators whose methods take the wrong number of arguments
+    def invoke(self, context, event):
+        return {'FINISHED'}
+
+    def execute(self, context):
+        return {'FINISHED'}
+
+    assert profile_operator_method(invoke, 'invoke').__code__.co_argcount == 3
+    assert profile_operator_method(invoke, 'modal').__code__.co_argcount == 3
+    assert profile_operator_method(execute, 'execute').__code__.co_argcount == 2
+    assert profile_operator_method(execute, 'cancel').__code__.co_argcount == 2
@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from MakeTile.lib.utils.selection import CoordIndex
+from MakeTile.lib.bmturtle.helpers import (
+    select_verts_in_bounds,
+    select_edges_in_bounds,
+    assign_verts_to_group,
+    get_bmesh_coord_index)
+
+
+@pytest.fixture
+def cube_index():
+    co = np.array(
+        [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)],
+        dtype=np.float64)
+    edges = np.array([[0, 1], [0, 4], [1, 5], [6, 7]])
+    return CoordIndex(co, edges)
+
+
+def test_vert_mask(cube_index):
+    mask = cube_index.vert_mask((0, 0, 0), (0, 1, 1))
+    assert np.flatnonzero(mask).tolist() == [0, 1, 2, 3]
+
+
+def test_bbox_buffer(cube_index):
+    assert cube_index.vert_mask((0.0005, 0, 0), (1, 1, 1)).sum() == 8
+    assert cube_index.vert_mask((0.0005, 0, 0), (1, 1, 1), buffer=0).sum() == 4
+
+
+def test_edge_mask(cube_index):
+    assert np.flatnonzero(cube_index.edge_mask((0, 0, 0), (1, 0, 0))).tolist() == [1]
+
+
+def test_select_in_bounds(bm_cube):
+    top = select_edges_in_bounds((-0.5, -0.5, 0.5), (0.5, 0.5, 0.5), 0.001, bm_cube)
+    assert len(top) == 4
+    assert all(e.select for e in top)
+    assert sum(e.select for e in bm_cube.edges) == 4
+
+
+def test_shared_index(bm_cube):
+    index = get_bmesh_coord_index(bm_cube)
+    top = select_verts_in_bounds((-0.5, -0.5, 0.5), (0.5, 0.5, 0.5), 0.001, bm_cube, index)
+    left = select_verts_in_bounds((-0.5, -0.5, -0.5), (-0.5, 0.5, 0.5), 0.001, bm_cube, index)
+    assert len(top) == 4
+    assert len(left) == 4
+    assert len(set(top) & set(left)) == 2
+    # each selection replaces the last
+    assert sum(v.select for v in bm_cube.verts) == 4
+
+
+def test_assign_verts_to_group(bm_cube, cube):
+    group = cube.vertex_groups.new(name='Top')
+    deform_groups = bm_cube.verts.layers.deform.verify()
+    top = select_verts_in_bounds((-0.5, -0.5, 0.5), (0.5, 0.5, 0.5), 0.001, bm_cube)
+    assign_verts_to_group(top, cube, deform_groups, 'Top')
+    bm_cube.to_mesh(cube.data)
+    bm_cube.free()
+
+    members = [
+        v.index for v in cube.data.vertices
+        if group.index in [g.group for g in v.groups]]
+    assert len(members) == 4
+    assert all(cube.data.vertices[i].co[2] == 0.5 for i in members)
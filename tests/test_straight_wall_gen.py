@@ -38,3 +38,20 @@ def test_Make_Straight_Wall_OT_wall_position(fake_context, wall_position, operat
         wall_position=wall_position)
     assert op == operator_return
 
+
+
+def test_Make_Straight_Wall_OT_phase_timings(fake_context):
+    scene = fake_context.get('scene')
+    scene_props = scene.mt_scene_props
+    scene_props.tile_type = "STRAIGHT_WALL"
+    bpy.ops.object.make_straight_wall(
+        fake_context,
+        refresh=True,
+        main_part_blueprint='OPENLOCK',
+        base_blueprint='OPENLOCK')
+    tile_props = [coll.mt_tile_props for coll in bpy.data.collections
+                  if coll.mt_tile_props.tile_type == "STRAIGHT_WALL"][-1]
+    phases = [item.name for item in tile_props.phase_timings]
+    assert 'base' in phases
+    assert 'core' in phases
+    assert all(item.value >= 0 for item in tile_props.phase_timings)
@@ -0,0 +1,27 @@
+import pytest
+from MakeTile.app_handlers import index_tile_defaults
+
+
+@pytest.fixture
+def tile_defaults():
+    return [{
+        'type': 'RECT_FLOOR',
+        'defaults': {
+            'base_blueprint': 'OPENLOCK',
+            'base_defaults': {
+                'OPENLOCK': {'base_x': 2, 'base_z': 0.2755},
+                'PLAIN': {'base_x': 2, 'base_z': 0.2755}},
+            'tile_defaults': {
+                'OPENLOCK': {'tile_z': 0.3}}}}]
+
+
+def test_index_tile_defaults_by_type(tile_defaults):
+    tiles, parts = index_tile_defaults(tile_defaults)
+    assert tiles['RECT_FLOOR'] is tile_defaults[0]
+
+
+def test_index_tile_defaults_merges_parts(tile_defaults):
+    tiles, parts = index_tile_defaults(tile_defaults)
+    assert parts['RECT_FLOOR', 'OPENLOCK', 'PLAIN'] == {'base_x': 2, 'base_z': 0.2755, 'tile_z': 0.3}
+    assert parts['RECT_FLOOR', None, 'OPENLOCK'] == {'base_x': 2, 'base_z': 0.2755}
+    assert parts['RECT_FLOOR', None, None] == {}
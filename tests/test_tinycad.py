@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from MakeTile.lib.utils.tinycad.cad_module import get_edge_intersections
+
+
+@pytest.fixture
+def hash_grid():
+    # 5 horizontal and 5 vertical segments crossing in a # pattern
+    co = []
+    for i in range(5):
+        co += [(0, i + 0.5, 0), (5, i + 0.5, 0)]
+    for i in range(5):
+        co += [(i + 0.5, 0, 0), (i + 0.5, 5, 0)]
+    edge_verts = np.arange(20).reshape((-1, 2))
+    return np.array(co, dtype=np.float64), edge_verts
+
+
+def test_get_edge_intersections(hash_grid):
+    co, edge_verts = hash_grid
+    pairs, points = get_edge_intersections(co, edge_verts)
+    assert len(pairs) == 25
+    assert all(i < 5 <= j for i, j in pairs.tolist())
+    for (i, j), point in zip(pairs.tolist(), points):
+        assert point == pytest.approx((j - 5 + 0.5, i + 0.5, 0))
+
+
+def test_edges_sharing_a_vertex_are_skipped():
+    co = np.array([(0, 0, 0), (1, 0, 0), (0, 1, 0)], dtype=np.float64)
+    edge_verts = np.array([(0, 1), (0, 2), (1, 2)])
+    pairs, points = get_edge_intersections(co, edge_verts)
+    assert len(pairs) == 0
+
+
+def test_parallel_and_separate_edges_are_skipped():
+    co = np.array(
+        [(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0), (2, -1, 0), (2, 1, 0)],
+        dtype=np.float64)
+    edge_verts = np.array([(0, 1), (2, 3), (4, 5)])
+    pairs, points = get_edge_intersections(co, edge_verts)
+    assert len(pairs) == 0
@@ -0,0 +1,40 @@
+from MakeTile.lib.utils.vertex_groups import (
+    new_vertex_group_at_start,
+    get_vert_indexes_in_vert_group,
+    clear_vert_group)
+from MakeTile.materials.materials import get_faces_in_vert_group
+
+
+def add_top_vert_group(obj, name, weight):
+    group = obj.vertex_groups.new(name=name)
+    top = [v.index for v in obj.data.vertices if v.co[2] > 0]
+    group.add(top, weight, 'REPLACE')
+    return top
+
+
+def test_new_vertex_group_at_start_keeps_weights(cube):
+    top = add_top_vert_group(cube, 'Top', 0.5)
+    cube.vertex_groups.new(name='Empty')
+
+    group = new_vertex_group_at_start(cube, 'All')
+
+    assert [g.name for g in cube.vertex_groups] == ['All', 'Top', 'Empty']
+    assert group.index == 0
+    top_group = cube.vertex_groups['Top']
+    assert sorted(get_vert_indexes_in_vert_group('Top', cube)) == sorted(top)
+    assert all(top_group.weight(i) == 0.5 for i in top)
+    assert get_vert_indexes_in_vert_group('Empty', cube) == []
+
+
+def test_get_faces_in_vert_group(cube):
+    add_top_vert_group(cube, 'Top', 1)
+    in_group = get_faces_in_vert_group('Top', cube)
+    assert in_group.sum() == 1
+    assert cube.data.polygons[int(in_group.nonzero()[0][0])].center[2] == 0.5
+
+
+def test_zero_weight_vertices_are_group_members(cube):
+    top = add_top_vert_group(cube, 'Top', 0)
+    assert sorted(get_vert_indexes_in_vert_group('Top', cube)) == sorted(top)
+    clear_vert_group(cube.vertex_groups['Top'], cube)
+    assert get_vert_indexes_in_vert_group('Top', cube) == []
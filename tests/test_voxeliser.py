@@ -0,0 +1,64 @@
+import bmesh
+import bpy
+from mathutils import Matrix
+from MakeTile.operators.voxeliser import (
+    make_manifold,
+    remesh,
+    remesh_chunked,
+    get_auto_voxel_size)
+from MakeTile.lib.utils.mesh_analysis import (
+    get_triangle_count,
+    get_non_manifold_edge_count)
+
+
+def get_volume(mesh):
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    volume = bm.calc_volume()
+    bm.free()
+    return volume
+
+
+def test_make_manifold_leaves_linked_duplicates_alone(cube):
+    linked = bpy.data.objects.new('linked_cube', cube.data)
+    bpy.context.layer_collection.collection.objects.link(linked)
+
+    # open the cube up so there's something to repair
+    bm = bmesh.new()
+    bm.from_mesh(cube.data)
+    bmesh.ops.delete(bm, geom=[bm.faces[0]], context='FACES_ONLY')
+    bm.to_mesh(cube.data)
+    bm.free()
+
+    result = make_manifold(bpy.context, cube)
+
+    assert cube.data != linked.data
+    assert result['non_manifold_after'] == 0
+    assert len(linked.data.polygons) == 5
+
+
+def test_auto_voxel_size_hits_target_on_scaled_cube(cube):
+    props = bpy.context.scene.mt_scene_props
+    props.voxel_size_mode = 'TRIANGLES'
+    props.target_triangles = 2000
+    props.voxel_adaptivity = 0
+    cube.scale = (10, 10, 10)
+    bpy.context.view_layer.update()
+
+    remesh(cube, get_auto_voxel_size(bpy.context, cube), 0)
+
+    assert 1000 < get_triangle_count(cube.data) < 4000
+
+
+def test_remesh_chunked_is_manifold_and_matches_unchunked(cube):
+    # a 4 x 4 x 1 slab split into 3 x 3 blocks
+    cube.data.transform(Matrix.Diagonal((4, 4, 1, 1)))
+    whole = bpy.data.objects.new('whole_cube', cube.data.copy())
+    bpy.context.layer_collection.collection.objects.link(whole)
+
+    num_chunks = remesh_chunked(bpy.context, cube, 0.1, 0.5, 16)
+    remesh(whole, 0.1, 0)
+
+    assert num_chunks == 9
+    assert get_non_manifold_edge_count(cube.data) == 0
+    assert abs(get_volume(cube.data) - get_volume(whole.data)) < get_volume(whole.data) * 0.01